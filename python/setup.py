@@ -21,8 +21,20 @@ setup(
     install_requires=[
         "requests",
         "pandas",
+        "numpy",
         "tqdm",
         "matplotlib",
         "vectorbt",
     ],
+    extras_require={
+        "parquet": ["pyarrow"],
+        "http2": ["httpx[http2]"],
+        "brotli": ["brotli"],
+    },
+    entry_points={
+        "console_scripts": [
+            "tmai-fetch=tmai_api.cli:main",
+            "tmai-proxy=tmai_api.proxy:main",
+        ],
+    },
 )
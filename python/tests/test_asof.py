@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+import pandas as pd
+from tmai_api.asof import AsOfIndex
+
+class TestAsOfIndex(unittest.TestCase):
+    
+    def setUp(self):
+        rows = []
+        for token, grades in [(3375, [50, 55, 60]), (3306, [70, 65])]:
+            for day, grade in enumerate(grades):
+                rows.append({"TOKEN_ID": token, "DATE": f"2024-01-0{day + 2}T00:00:00.000Z",
+                             "TM_TRADER_GRADE": grade, "TRADING_SIGNAL": 1 if grade > 55 else 0})
+        # Rows arrive unsorted
+        self.df = pd.DataFrame(rows[::-1])
+        self.index = AsOfIndex(self.df)
+    
+    def test_lookup(self):
+        self.assertEqual(len(self.index), 5)
+        row = self.index.lookup(3375, "2024-01-03T12:00:00Z")
+        self.assertEqual(row["TM_TRADER_GRADE"], 55)
+        self.assertEqual(row["DATE"], pd.Timestamp("2024-01-03", tz="UTC"))
+        self.assertEqual(self.index.lookup(3306, "2024-02-01")["TM_TRADER_GRADE"], 65)
+        self.assertIsNone(self.index.lookup(3375, "2024-01-01"))
+        self.assertIsNone(self.index.lookup(1, "2024-01-05"))
+    
+    def test_lookup_many_matches_pandas(self):
+        rng = np.random.default_rng(0)
+        tokens = rng.choice([3375, 3306, 1], 200)
+        times = pd.Timestamp("2024-01-01", tz="UTC") + pd.to_timedelta(rng.integers(0, 6 * 24, 200), unit="h")
+        result = self.index.lookup_many(tokens, times)
+        
+        df = self.df.assign(DATE=pd.to_datetime(self.df["DATE"], utc=True))
+        for token, time, grade in zip(tokens, times, result["TM_TRADER_GRADE"]):
+            history = df[(df["TOKEN_ID"] == token) & (df["DATE"] <= time)].sort_values("DATE")
+            if history.empty:
+                self.assertTrue(np.isnan(grade))
+            else:
+                self.assertEqual(grade, history["TM_TRADER_GRADE"].iloc[-1])
+    
+    def test_max_age(self):
+        result = self.index.lookup_many([3306, 3306], ["2024-01-04", "2024-01-10"], max_age="2D")
+        self.assertEqual(result["TM_TRADER_GRADE"].iloc[0], 65)
+        self.assertTrue(np.isnan(result["TM_TRADER_GRADE"].iloc[1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from tmai_api import TokenMetricsClient
+from tmai_api.transport import Transport, TransportResponse
+
+class FakeServer(Transport):
+    """Serves a fixed body, honouring If-None-Match when an ETag is configured."""
+    
+    def __init__(self, body, etag=None):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        self.requests.append(headers)
+        if self.etag and headers.get("if-none-match") == self.etag:
+            return TransportResponse(304, b"", url=url)
+        response_headers = {"ETag": self.etag} if self.etag else {}
+        return TransportResponse(200, self.body, response_headers, url=url)
+
+class TestConditionalRequests(unittest.TestCase):
+    
+    def test_etag_revalidation(self):
+        server = FakeServer(b'{"data": [{"TOKEN_SYMBOL": "BTC"}]}', etag='"v1"')
+        client = TokenMetricsClient(api_key="test-api-key", transport=server, validator_cache=True)
+        
+        first = client.tokens.get(symbol="BTC")
+        second = client.tokens.get(symbol="BTC")
+        
+        self.assertEqual(first, {"data": [{"TOKEN_SYMBOL": "BTC"}]})
+        self.assertEqual(second, first)
+        self.assertNotIn("if-none-match", server.requests[0])
+        self.assertEqual(server.requests[1]["if-none-match"], '"v1"')
+        
+        # A different request is cached separately
+        client.tokens.get(symbol="ETH")
+        self.assertNotIn("if-none-match", server.requests[2])
+        
+        # Callers get their own copy, so mutating a result leaves the cache intact
+        second["data"][0]["TOKEN_SYMBOL"] = "changed"
+        self.assertEqual(client.tokens.get(symbol="BTC"), {"data": [{"TOKEN_SYMBOL": "BTC"}]})
+    
+    def test_content_hash_fallback(self):
+        server = FakeServer(b'{"data": [{"TOKEN_SYMBOL": "BTC"}]}')
+        client = TokenMetricsClient(api_key="test-api-key", transport=server, validator_cache=True)
+        
+        first = client.ai_reports.get(symbol="BTC")
+        second = client.ai_reports.get(symbol="BTC")
+        self.assertEqual(second, first)
+        second["data"].clear()
+        self.assertEqual(client.ai_reports.get(symbol="BTC"), first)
+        
+        server.body = b'{"data": [{"TOKEN_SYMBOL": "BTC", "TRADER_REPORT": "new"}]}'
+        self.assertEqual(client.ai_reports.get(symbol="BTC")["data"][0]["TRADER_REPORT"], "new")
+    
+    def test_disabled_without_cache(self):
+        server = FakeServer(b'{"data": []}', etag='"v1"')
+        client = TokenMetricsClient(api_key="test-api-key", transport=server)
+        client.tokens.get()
+        client.tokens.get()
+        self.assertNotIn("if-none-match", server.requests[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import datetime
+import os
+import tempfile
+import unittest
+from unittest import mock
+import requests
+from tmai_api import cli
+
+class TestFetchCLI(unittest.TestCase):
+    
+    def test_build_shards(self):
+        args = cli._parse_args(["daily-ohlcv", "--start", "2024-01-01", "--end", "2024-03-01",
+                                "--output", "out", "--api-key", "test-api-key",
+                                "--symbols", "BTC,ETH,SOL", "--symbol-batch", "2", "--format", "csv"])
+        shards = cli.build_shards(args, cli._load_symbols(args))
+        
+        # 3 date chunks x 2 symbol batches
+        self.assertEqual(len(shards), 6)
+        self.assertEqual(shards[0][:4], (0, "BTC,ETH", "2024-01-01", "2024-01-29"))
+        self.assertEqual(shards[1][1], "SOL")
+        self.assertEqual(shards[1][4], os.path.join("out", "daily-ohlcv", "date=2024-01-01", "part-00001.csv"))
+        
+        # Market-wide endpoints are not split by symbol
+        args.endpoint = "market-metrics"
+        self.assertEqual(len(cli.build_shards(args, ["BTC", "ETH", "SOL"])), 3)
+    
+    def test_shards_fit_the_page_limit(self):
+        symbols = ["T%d" % i for i in range(100)]
+        args = cli._parse_args(["hourly-ohlcv", "--start", "2024-01-01", "--end", "2024-03-01",
+                                "--output", "out", "--api-key", "test-api-key", "--symbols", ",".join(symbols)])
+        shards = cli.build_shards(args, symbols)
+        for batch, batch_symbols, chunk_start, chunk_end, path in shards:
+            days = (datetime.date.fromisoformat(chunk_end) - datetime.date.fromisoformat(chunk_start)).days + 1
+            self.assertLessEqual(len(batch_symbols.split(",")) * 24 * days, 1000)
+        covered = {symbol for shard in shards for symbol in shard[1].split(",")}
+        self.assertEqual(covered, set(symbols))
+    
+    @mock.patch('requests.get')
+    def test_fetch_shard_writes_file(self, mock_get):
+        mock_response = mock.Mock()
+        mock_response.json.return_value = {"data": [{"TOKEN_ID": 3375, "CLOSE": 1.0}]}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        with tempfile.TemporaryDirectory() as output:
+            path = cli.shard_path(output, "daily-ohlcv", "flat", "csv", "2024-01-01", "2024-01-30", 0)
+            cli._init_worker("test-api-key", "daily-ohlcv", None, {}, "csv")
+            rows = cli._fetch_shard((0, "BTC", "2024-01-01", "2024-01-30", path))
+            
+            self.assertEqual(rows, 1)
+            with open(path) as f:
+                self.assertEqual(f.read().split(), ["TOKEN_ID,CLOSE", "3375,1.0"])
+        self.assertEqual(mock_get.call_args[1]['params']['symbol'], "BTC")
+    
+    @mock.patch('requests.get')
+    def test_failed_shard_is_not_written(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError("connection refused")
+        with tempfile.TemporaryDirectory() as output:
+            path = cli.shard_path(output, "daily-ohlcv", "flat", "csv", "2024-01-01", "2024-01-30", 0)
+            cli._init_worker("test-api-key", "daily-ohlcv", None, {}, "csv")
+            with self.assertRaises(RuntimeError):
+                cli._fetch_shard((0, "BTC", "2024-01-01", "2024-01-30", path))
+            self.assertFalse(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
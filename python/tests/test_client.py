@@ -78,6 +78,54 @@ class TestTokenMetricsClient(unittest.TestCase):
         answer_text = self.client.ai_agent.get_answer_text(question)
         self.assertEqual(answer_text, "This is a test answer from the AI chatbot.")
 
+    @mock.patch('requests.post')
+    def test_ai_agent_session_budget(self, mock_post):
+        def reply(url, headers=None, json=None, **kwargs):
+            mock_response = mock.Mock()
+            mock_response.raise_for_status.return_value = None
+            mock_response.json.return_value = {
+                "success": True,
+                "answer": "answer",
+                "thread": json['messages'] + [{"chatbot": "answer"}]
+            }
+            return mock_response
+        mock_post.side_effect = reply
+        
+        session = self.client.ai_agent.session(max_messages=4)
+        for i in range(10):
+            self.assertEqual(session.ask(f"question {i}"), "answer")
+        
+        # Every request stays within the budget and ends with the new question
+        for call in mock_post.call_args_list:
+            messages = call[1]['json']['messages']
+            self.assertLessEqual(len(messages), 4)
+            self.assertIn("user", messages[0])
+        self.assertEqual(messages[-1], {"user": "question 9"})
+        self.assertEqual(session.thread[-2:], [{"user": "question 9"}, {"chatbot": "answer"}])
+        
+        # Summarizing keeps a single summary message in front of the recent turns
+        session = self.client.ai_agent.session(max_messages=4, strategy="summarize")
+        for i in range(10):
+            session.ask(f"question {i}")
+        messages = mock_post.call_args[1]['json']['messages']
+        self.assertLessEqual(len(messages), 4)
+        self.assertTrue(messages[0]["user"].startswith(session.SUMMARY_PREFIX))
+
+    @mock.patch('requests.post')
+    def test_conversation_session_non_dict_reply(self, mock_post):
+        mock_response = mock.Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = "plain answer"
+        mock_post.return_value = mock_response
+        
+        session = self.client.ai_agent.session()
+        self.assertEqual(session.send("question"), "plain answer")
+        self.assertEqual(session.thread, [{"user": "question"}, {"chatbot": "plain answer"}])
+        
+        mock_response.json.return_value = ["unexpected"]
+        self.assertEqual(session.ask("again"), "")
+        self.assertEqual(session.thread[-1], {"chatbot": ""})
+
     @mock.patch('requests.get')
     def test_ai_reports_endpoint(self, mock_get):
         # Setup mock response
@@ -0,0 +1,100 @@
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from tmai_api import TokenMetricsClient
+from tmai_api.columnar import ColumnarAccumulator
+from tmai_api.transport import InMemoryTransport
+
+class TestColumnarAccumulator(unittest.TestCase):
+    
+    def test_matches_list_of_dicts(self):
+        rows = [
+            {"TOKEN_ID": 3375, "TOKEN_SYMBOL": "BTC", "CLOSE": 100.5, "VOLUME": 10},
+            {"TOKEN_ID": 3306, "TOKEN_SYMBOL": "ETH", "CLOSE": 10, "VOLUME": None},
+            {"TOKEN_ID": 3375, "TOKEN_SYMBOL": None, "CLOSE": 101.0, "EXTRA": "x"},
+        ]
+        accumulator = ColumnarAccumulator()
+        accumulator.extend(rows[:2])
+        accumulator.extend(rows[2:])
+        
+        self.assertEqual(len(accumulator), 3)
+        columns = accumulator.to_numpy()
+        self.assertEqual(columns["TOKEN_ID"].dtype, np.int64)
+        self.assertEqual(columns["CLOSE"].dtype, np.float64)
+        self.assertEqual(list(columns["TOKEN_SYMBOL"]), ["BTC", "ETH", None])
+        self.assertEqual(list(columns["EXTRA"]), [None, None, "x"])
+        np.testing.assert_array_equal(columns["VOLUME"], [10.0, np.nan, np.nan])
+        
+        frame = accumulator.to_dataframe()
+        expected = pd.DataFrame(rows)
+        self.assertEqual(list(frame.columns), list(expected.columns))
+        np.testing.assert_array_equal(frame["CLOSE"].to_numpy(), expected["CLOSE"].to_numpy())
+        self.assertEqual(accumulator.to_dataframe(categorical=True)["TOKEN_SYMBOL"].dtype, "category")
+    
+    def test_extend_after_export(self):
+        accumulator = ColumnarAccumulator()
+        accumulator.extend([{"TOKEN_ID": 1, "CLOSE": 1.5, "TOKEN_SYMBOL": "BTC"}])
+        columns = accumulator.to_numpy()
+        categorical = accumulator.to_dataframe(categorical=True)
+        accumulator.extend([{"TOKEN_ID": 2, "CLOSE": 2.5, "TOKEN_SYMBOL": "ETH"}])
+        
+        self.assertEqual(columns["TOKEN_ID"].tolist(), [1])
+        self.assertEqual(len(categorical), 1)
+        self.assertEqual(accumulator.to_numpy()["CLOSE"].tolist(), [1.5, 2.5])
+    
+    def test_slice_and_merge(self):
+        accumulator = ColumnarAccumulator()
+        accumulator.extend([{"TOKEN_ID": 1, "CLOSE": 1.5, "TOKEN_SYMBOL": "BTC", "NOTE": None},
+                            {"TOKEN_ID": 2, "CLOSE": 2.5, "TOKEN_SYMBOL": "ETH", "NOTE": None},
+                            {"TOKEN_ID": 3, "CLOSE": None, "TOKEN_SYMBOL": "SOL", "NOTE": None}])
+        merged = accumulator.slice(2, 3)
+        merged.merge(accumulator.slice(0, 2))
+        
+        self.assertEqual(len(merged), 3)
+        columns = merged.to_numpy()
+        self.assertEqual(columns["TOKEN_ID"].tolist(), [3, 1, 2])
+        np.testing.assert_array_equal(columns["CLOSE"], [np.nan, 1.5, 2.5])
+        self.assertEqual(columns["TOKEN_SYMBOL"].tolist(), ["SOL", "BTC", "ETH"])
+        self.assertEqual(columns["NOTE"].tolist(), [None, None, None])
+        
+        part = accumulator.slice(0, 1)
+        part.append({"TOKEN_ID": 4, "TOKEN_SYMBOL": "ADA"})
+        self.assertEqual(len(accumulator), 3)
+        self.assertEqual(accumulator.to_numpy()["TOKEN_SYMBOL"].tolist(), ["BTC", "ETH", "SOL"])
+    
+    @mock.patch('requests.get')
+    def test_paginated_columnar_option(self, mock_get):
+        mock_response = mock.Mock()
+        mock_response.json.return_value = {"success": True, "data": [{"TOKEN_ID": 3375, "CLOSE": 1.0}]}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        result = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01",
+                                        endDate="2024-03-01", columnar=True)
+        
+        self.assertIsInstance(result, ColumnarAccumulator)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result.meta, {"success": True})
+        frame = client.daily_ohlcv.get_dataframe(symbol="BTC", columnar=True)
+        self.assertEqual(frame.to_dict("records"), [{"TOKEN_ID": 3375, "CLOSE": 1.0}])
+    
+    def test_streamed_chunks_merge_into_columns(self):
+        def rows(params, payload):
+            day = int(params["startDate"][-2:])
+            return {"success": True, "data": [{"TOKEN_ID": day, "TOKEN_SYMBOL": "BTC" if day % 2 else "ETH",
+                                               "CLOSE": float(day)}, {"TOKEN_ID": None, "EXTRA": day}]}
+        client = TokenMetricsClient(api_key="test-api-key", transport=InMemoryTransport({"daily-ohlcv": rows}))
+        options = dict(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01", columnar=True, progress=False)
+        
+        streamed = client.daily_ohlcv.get(stream=True, **options)
+        expected = ColumnarAccumulator()
+        expected.extend(client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                               progress=False)["data"])
+        self.assertEqual(len(streamed), 6)
+        self.assertTrue(streamed.to_dataframe().equals(expected.to_dataframe()))
+        self.assertEqual(list(streamed.to_numpy()["TOKEN_SYMBOL"]), ["BTC", None, "ETH", None, "ETH", None])
+
+if __name__ == '__main__':
+    unittest.main()
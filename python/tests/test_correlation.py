@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+import pandas as pd
+from tmai_api.correlation import CorrelationEngine
+
+class TestCorrelationEngine(unittest.TestCase):
+    
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        market = rng.normal(0, 0.02, 200)
+        returns = {token: market * beta + rng.normal(0, 0.01, 200)
+                   for token, beta in zip(range(1, 8), [1, 0.9, 0.5, 0.1, -0.8, 0, 1.2])}
+        self.returns = pd.DataFrame(returns)
+        # Missing data for some tokens
+        self.returns.iloc[:30, 2] = np.nan
+        self.returns.iloc[100:120, 5] = np.nan
+    
+    def test_blocked_matches_pandas(self):
+        engine = CorrelationEngine(self.returns, block_size=3)
+        pd.testing.assert_frame_equal(engine.correlation(), self.returns.corr(min_periods=20),
+                                      check_names=False, atol=1e-10)
+        pd.testing.assert_frame_equal(engine.covariance(), self.returns.cov(min_periods=20),
+                                      check_names=False, atol=1e-12)
+    
+    def test_top_k(self):
+        engine = CorrelationEngine(self.returns, block_size=2)
+        expected = self.returns.corr()
+        top = engine.top_k(k=2)
+        self.assertEqual(len(top), 14)
+        for token, group in top.groupby("TOKEN_ID"):
+            partners = expected[token].drop(token).nlargest(2)
+            self.assertEqual(list(group["OTHER_TOKEN_ID"]), list(partners.index))
+        
+        single = engine.top_k(k=1, token=5, absolute=True)
+        self.assertEqual(single["OTHER_TOKEN_ID"].tolist(), [expected[5].drop(5).abs().idxmax()])
+    
+    def test_from_ohlcv_and_rolling(self):
+        times = pd.date_range("2024-01-01", periods=50, freq="D", tz="UTC").strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        prices = np.exp(np.cumsum(self.returns.iloc[:50, :2].to_numpy(), axis=0))
+        df = pd.DataFrame([{"TOKEN_ID": token, "DATE": time, "CLOSE": prices[i, j]}
+                           for j, token in enumerate([1, 2]) for i, time in enumerate(times)])
+        engine = CorrelationEngine.from_ohlcv(df, min_periods=10)
+        self.assertEqual(engine.returns.shape, (49, 2))
+        rolling = engine.rolling(1, window=10)
+        self.assertTrue(np.allclose(rolling[1].dropna(), 1.0))
+
+if __name__ == '__main__':
+    unittest.main()
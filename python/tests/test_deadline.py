@@ -0,0 +1,57 @@
+import threading
+import time
+import unittest
+from tmai_api import TokenMetricsClient
+from tmai_api.exceptions import DeadlineExceeded
+from tmai_api.transport import Transport, TransportResponse
+
+class SlowTransport(Transport):
+    """Responds immediately except for chunks starting on a stalled date, which hang until released."""
+    
+    def __init__(self, stalled):
+        self.stalled = stalled
+        self.timeouts = []
+        self.release = threading.Event()
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        self.timeouts.append(timeout)
+        if params['startDate'] in self.stalled:
+            self.release.wait(5)
+        body = ('{"data": [{"DATE": "%s"}]}' % params['startDate']).encode()
+        return TransportResponse(200, body, url=url)
+
+class TestDeadline(unittest.TestCase):
+    
+    def test_deadline_returns_completed_chunks(self):
+        transport = SlowTransport(stalled={"2024-01-30"})
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport,
+                                    timeout=(5, 30), max_workers=3)
+        started = time.monotonic()
+        result = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                        deadline=0.3, return_result=True)
+        transport.release.set()
+        
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([row["DATE"] for row in result.data], ["2024-01-01", "2024-02-28"])
+        self.assertEqual([f.chunk_start for f in result.failed], ["2024-01-30"])
+        self.assertIsInstance(result.failed[0].error, DeadlineExceeded)
+        # Request timeouts are capped by the time left before the deadline
+        self.assertTrue(all(read <= 0.3 for connect, read in transport.timeouts))
+    
+    def test_deadline_can_raise(self):
+        transport = SlowTransport(stalled={"2024-01-01"})
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport)
+        with self.assertRaises(DeadlineExceeded) as raised:
+            client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                   deadline=0.2, on_deadline="raise")
+        transport.release.set()
+        self.assertEqual(len(raised.exception.result.failed), 3)
+    
+    def test_client_timeout_is_passed_to_transport(self):
+        transport = SlowTransport(stalled=set())
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport)
+        client.trader_indices.get(startDate="2024-01-01", endDate="2024-01-02")
+        self.assertEqual(transport.timeouts, [(10, 60)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import pandas as pd
+from tmai_api.gaps import find_gaps, repair_gaps
+
+def hourly_rows(token, hours, skip=()):
+    times = pd.date_range("2024-01-01", periods=hours, freq="h", tz="UTC")
+    return [{"TOKEN_ID": token, "TIMESTAMP": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"), "CLOSE": float(i)}
+            for i, time in enumerate(times) if i not in skip]
+
+class FakeEndpoint:
+    """Serves complete hourly data and records the requests it receives."""
+    
+    def __init__(self, hours):
+        self.hours = hours
+        self.calls = []
+    
+    def get(self, token_id=None, startDate=None, endDate=None, **options):
+        self.calls.append((token_id, startDate, endDate))
+        rows = []
+        for token in token_id.split(","):
+            rows.extend(row for row in hourly_rows(int(token), self.hours)
+                        if startDate <= row["TIMESTAMP"][:10] <= endDate)
+        return {"success": True, "data": rows}
+    
+    def to_dataframe(self, data):
+        return pd.DataFrame(data["data"])
+
+class TestGaps(unittest.TestCase):
+    
+    def test_find_gaps_and_duplicates(self):
+        rows = hourly_rows(1, 48, skip={3, 4, 30}) + hourly_rows(2, 24)
+        rows.append(dict(rows[0]))
+        report = find_gaps(pd.DataFrame(rows), start="2024-01-01", end="2024-01-02", tokens=[1, 2, 3])
+        
+        gaps = report.gaps
+        self.assertEqual(gaps["BARS"].tolist(), [2, 1, 24, 48])
+        self.assertEqual(gaps["TOKEN_ID"].tolist(), [1, 1, 2, 3])
+        self.assertEqual(gaps["GAP_START"].iloc[0], pd.Timestamp("2024-01-01T03:00", tz="UTC"))
+        self.assertEqual(len(report.duplicates), 2)
+        self.assertEqual(report.repair_requests(), [
+            ("1,3", "2024-01-01", "2024-01-02"),
+            ("2", "2024-01-02", "2024-01-02"),
+        ])
+    
+    def test_repair_requests_fit_the_page_limit(self):
+        rows = [row for token in range(100) for row in hourly_rows(token, 72, skip=set(range(24, 72)))]
+        report = find_gaps(pd.DataFrame(rows), end="2024-01-03")
+        requests = report.repair_requests()
+        
+        # 100 tokens x 2 days x 24 bars need at least 5 requests of 1000 rows
+        self.assertEqual(len(requests), 5)
+        token_days = []
+        for token_ids, start, end in requests:
+            days = pd.date_range(start, end, freq="D")
+            self.assertLessEqual(len(token_ids.split(",")) * 24 * len(days), 1000)
+            token_days.extend((int(token), day) for token in token_ids.split(",") for day in days)
+        self.assertEqual(len(token_days), 200)
+        self.assertEqual(len(set(token_days)), 200)
+    
+    def test_daily_frames_are_complete(self):
+        df = pd.DataFrame([{"TOKEN_ID": 1, "DATE": f"2024-01-0{d}T00:00:00.000Z"} for d in range(1, 6)])
+        self.assertTrue(find_gaps(df).complete)
+    
+    def test_repair_fetches_only_gap_days(self):
+        rows = hourly_rows(1, 72, skip={30, 31}) + hourly_rows(2, 72)
+        endpoint = FakeEndpoint(72)
+        repaired, report = repair_gaps(endpoint, pd.DataFrame(rows))
+        self.assertEqual(endpoint.calls, [("1", "2024-01-02", "2024-01-02")])
+        self.assertTrue(report.complete)
+        self.assertEqual(len(repaired), 144)
+
+if __name__ == '__main__':
+    unittest.main()
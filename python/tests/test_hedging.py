@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+from tmai_api import TokenMetricsClient
+from tmai_api.hedging import HedgePolicy, LatencyTracker
+from tmai_api.transport import Transport, TransportResponse
+
+class StragglerTransport(Transport):
+    """Stalls the first request of chunks starting on given dates; duplicates respond immediately."""
+    
+    def __init__(self, stalled):
+        self.stalled = set(stalled)
+        self.requests = []
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        with self.lock:
+            self.requests.append(params['startDate'])
+            stall = params['startDate'] in self.stalled
+            self.stalled.discard(params['startDate'])
+        if stall:
+            self.release.wait(5)
+        body = ('{"data": [{"DATE": "%s"}]}' % params['startDate']).encode()
+        return TransportResponse(200, body, url=url)
+
+class TestHedging(unittest.TestCase):
+    
+    def test_policy_delay_and_budget(self):
+        tracker = LatencyTracker()
+        policy = HedgePolicy(percentile=50, max_extra=0.5, min_samples=3)
+        self.assertIsNone(policy.delay(tracker, "daily-ohlcv"))
+        for seconds in (0.1, 0.2, 0.3):
+            tracker.record("daily-ohlcv", seconds)
+        self.assertAlmostEqual(policy.delay(tracker, "daily-ohlcv"), 0.2)
+        
+        for _ in range(4):
+            policy.record_request()
+        self.assertTrue(policy.try_hedge())
+        self.assertTrue(policy.try_hedge())
+        self.assertFalse(policy.try_hedge())
+    
+    def test_straggler_is_hedged(self):
+        transport = StragglerTransport(stalled={"2024-01-30"})
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport, max_workers=3)
+        policy = HedgePolicy(max_extra=0.5, initial_delay=0.1)
+        
+        started = time.monotonic()
+        data = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                      hedge=policy, progress=False)
+        
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([row["DATE"] for row in data["data"]], ["2024-01-01", "2024-01-30", "2024-02-28"])
+        self.assertEqual(transport.requests.count("2024-01-30"), 2)
+        self.assertEqual(policy.hedges, 1)
+        self.assertEqual(client.latency.count("daily-ohlcv"), 3)
+        transport.release.set()
+    
+    def test_queued_straggler_is_hedged_with_one_worker(self):
+        transport = StragglerTransport(stalled={"2024-02-28"})
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport, max_workers=1)
+        policy = HedgePolicy(max_extra=0.5, initial_delay=0.1)
+        timed_fetch_chunk = client.daily_ohlcv._timed_fetch_chunk
+        
+        def late_start(method, endpoint, params, stream=False, deadline_at=None, start_times=None, index=None,
+                       *args, **kwargs):
+            # The last chunk sits in the queue for a while before the only worker picks it up
+            if start_times is not None and params["startDate"] == "2024-02-28":
+                time.sleep(0.3)
+            return timed_fetch_chunk(method, endpoint, params, stream, deadline_at, start_times, index, *args, **kwargs)
+        client.daily_ohlcv._timed_fetch_chunk = late_start
+        
+        started = time.monotonic()
+        data = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                      hedge=policy, progress=False)
+        
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([row["DATE"] for row in data["data"]], ["2024-01-01", "2024-01-30", "2024-02-28"])
+        self.assertEqual(policy.hedges, 1)
+        transport.release.set()
+    
+    def test_hedging_is_opt_in(self):
+        transport = StragglerTransport(stalled=set())
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport, max_workers=3)
+        client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01", progress=False)
+        self.assertEqual(len(transport.requests), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+import pandas as pd
+from tmai_api.indicators import IndicatorEngine
+
+def make_ohlcv(hours, tokens=(3375, 3306), missing=()):
+    rng = np.random.default_rng(0)
+    rows = []
+    times = pd.date_range("2024-01-01", periods=hours, freq="h", tz="UTC")
+    for token in tokens:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, hours)))
+        for i, time in enumerate(times):
+            if (token, i) in missing:
+                continue
+            rows.append({"TOKEN_ID": token, "TIMESTAMP": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                         "OPEN": close[i], "HIGH": close[i] * 1.01, "LOW": close[i] * 0.99, "CLOSE": close[i]})
+    return pd.DataFrame(rows)
+
+class TestIndicatorEngine(unittest.TestCase):
+    
+    def test_incremental_update_matches_full_fit(self):
+        df = make_ohlcv(120, missing={(3306, 50), (3306, 110)})
+        times = pd.to_datetime(df["TIMESTAMP"], utc=True)
+        cutoff = pd.Timestamp("2024-01-01", tz="UTC") + pd.Timedelta(hours=100)
+        
+        full = IndicatorEngine().fit(df)
+        engine = IndicatorEngine()
+        engine.fit(df[times < cutoff])
+        new = engine.update(df[times >= cutoff])
+        self.assertEqual(len(new), 2 * 20 - 1)
+        
+        expected = full[full["TIMESTAMP"] >= cutoff].reset_index(drop=True)
+        pd.testing.assert_frame_equal(new, expected)
+        
+        # Sanity-check against direct pandas calculations for one token
+        btc = df[df["TOKEN_ID"] == 3375]["CLOSE"].reset_index(drop=True)
+        btc_full = full[full["TOKEN_ID"] == 3375].reset_index(drop=True)
+        np.testing.assert_allclose(btc_full["SMA"].iloc[-1], btc.iloc[-20:].mean())
+        np.testing.assert_allclose(btc_full["EMA"], btc.ewm(span=20, adjust=False).mean())
+        self.assertTrue(((btc_full["RSI"].dropna() >= 0) & (btc_full["RSI"].dropna() <= 100)).all())
+    
+    def test_new_tokens_in_update(self):
+        engine = IndicatorEngine(sma_window=3, vol_window=3)
+        engine.fit(make_ohlcv(10, tokens=(1,)))
+        later = make_ohlcv(12, tokens=(1, 2))
+        update = engine.update(later)
+        self.assertEqual(sorted(update["TOKEN_ID"].unique()), [1, 2])
+        # Only bars after the last fitted time are new, for old and new tokens alike
+        self.assertEqual(len(update), 2 * 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import threading
+import time
+import unittest
+from tmai_api import TokenMetricsClient
+from tmai_api.exceptions import QuotaExhausted
+from tmai_api.keys import KeyPool
+from tmai_api.transport import Transport, TransportResponse
+
+class ThrottlingTransport(Transport):
+    """Answers 429 for throttled keys and records which key sent each request."""
+    
+    def __init__(self, throttled=()):
+        self.throttled = set(throttled)
+        self.keys = []
+        self.lock = threading.Lock()
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        with self.lock:
+            self.keys.append(headers["api_key"])
+        if headers["api_key"] in self.throttled:
+            return TransportResponse(429, b'{"message": "Too many requests"}', {"Retry-After": "30"}, url=url)
+        body = ('{"data": [{"DATE": "%s"}]}' % params['startDate']).encode()
+        return TransportResponse(200, body, url=url)
+
+class TestKeyPool(unittest.TestCase):
+    
+    def test_requests_are_spread_by_remaining_quota(self):
+        pool = KeyPool(["a", "b"], quota={"a": 1, "b": 3})
+        keys = []
+        for _ in range(4):
+            key = pool.acquire()
+            pool.release(key, 200)
+            keys.append(key)
+        self.assertEqual(sorted(keys), ["a", "b", "b", "b"])
+        with self.assertRaises(QuotaExhausted):
+            pool.acquire()
+    
+    def test_per_key_rate_limit(self):
+        pool = KeyPool(["a", "b"], rate=20)
+        started = time.monotonic()
+        keys = [pool.acquire() for _ in range(4)]
+        self.assertEqual(sorted(keys), ["a", "a", "b", "b"])
+        self.assertLess(time.monotonic() - started, 0.5)
+    
+    def test_throttled_key_cools_down(self):
+        transport = ThrottlingTransport(throttled={"a"})
+        client = TokenMetricsClient(api_key=["a", "b"], transport=transport, max_workers=2)
+        self.assertEqual(client.api_key, "a")
+        
+        data = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01", progress=False)
+        self.assertEqual(len(data["data"]), 3)
+        # "a" was tried once, then rested while "b" served every request
+        self.assertEqual(transport.keys.count("a"), 1)
+        stats = client.key_pool.stats()
+        self.assertEqual(stats["a"]["throttled"], 1)
+        self.assertGreater(stats["a"]["cooldown"], 25)
+        self.assertEqual(stats["b"]["requests"], 3)
+    
+    def test_single_key_is_unchanged(self):
+        transport = ThrottlingTransport()
+        client = TokenMetricsClient(api_key="only", transport=transport)
+        client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-01-02", progress=False)
+        self.assertIsNone(client.key_pool)
+        self.assertEqual(transport.keys, ["only"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import datetime
+import unittest
+import numpy as np
+import pandas as pd
+from tmai_api.market_regime import MarketRegime
+
+def metrics_frame(start, end):
+    days = pd.date_range(start, end, freq="D", tz="UTC")
+    return pd.DataFrame({"DATE": days.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                         "FEAR_AND_GREED_VALUE": days.day.astype(float),
+                         "TM_GRADE_SIGNAL": np.where(days.day % 2 == 0, 1, -1)})
+
+class FakeMarketMetrics:
+    def __init__(self, last=None):
+        self.calls = []
+        self.last = last
+    
+    def get_dataframe(self, startDate=None, endDate=None, **kwargs):
+        self.calls.append((startDate, endDate))
+        # The API has no rows after the last published day
+        return metrics_frame(startDate, min(endDate, self.last or endDate))
+
+class FakeClient:
+    def __init__(self):
+        self.market_metrics = FakeMarketMetrics()
+
+class TestMarketRegime(unittest.TestCase):
+    
+    def test_hourly_rows_get_that_days_metrics(self):
+        times = pd.date_range("2024-01-03", periods=48, freq="h", tz="UTC")
+        df = pd.DataFrame({"TOKEN_ID": 1, "TIMESTAMP": times.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                           "CLOSE": 1.0}).iloc[::-1]
+        regime = MarketRegime(metrics=metrics_frame("2024-01-01", "2024-01-10"))
+        joined = regime.join(df)
+        
+        self.assertEqual(list(joined.index), list(df.index))
+        expected = times[::-1].day.astype(float)
+        self.assertEqual(joined["FEAR_AND_GREED_VALUE"].tolist(), list(expected))
+    
+    def test_series_is_fetched_once_and_extended(self):
+        client = FakeClient()
+        regime = MarketRegime(client, columns=["FEAR_AND_GREED_VALUE"])
+        daily = pd.DataFrame({"TOKEN_ID": 1, "DATE": ["2024-01-05T00:00:00.000Z", "2024-01-07T00:00:00.000Z"],
+                              "FEAR_AND_GREED_VALUE": 0.0})
+        joined = regime.join(daily)
+        self.assertEqual(joined["FEAR_AND_GREED_VALUE_MARKET"].tolist(), [5.0, 7.0])
+        self.assertNotIn("TM_GRADE_SIGNAL", joined.columns)
+        
+        regime.join(daily)
+        later = daily.assign(DATE=["2024-01-06T00:00:00.000Z", "2024-01-09T00:00:00.000Z"])
+        regime.join(later)
+        self.assertEqual(client.market_metrics.calls, [("2024-01-05", "2024-01-07"), ("2024-01-08", "2024-01-09")])
+    
+    def test_only_returned_days_before_today_are_cached(self):
+        client = FakeClient()
+        client.market_metrics.last = "2024-01-07"
+        regime = MarketRegime(client)
+        regime.load("2024-01-05", "2024-01-09")
+        regime.load("2024-01-05", "2024-01-09")
+        self.assertEqual(client.market_metrics.calls, [("2024-01-05", "2024-01-09"), ("2024-01-08", "2024-01-09")])
+        
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        client = FakeClient()
+        regime = MarketRegime(client)
+        regime.load(today - datetime.timedelta(days=1), today)
+        regime.load(today - datetime.timedelta(days=1), today)
+        self.assertEqual(client.market_metrics.calls[1], (today.isoformat(), today.isoformat()))
+    
+    def test_tolerance(self):
+        regime = MarketRegime(metrics=metrics_frame("2024-01-01", "2024-01-02"))
+        df = pd.DataFrame({"DATE": ["2024-01-02T00:00:00.000Z", "2024-01-05T00:00:00.000Z"]})
+        joined = regime.join(df, tolerance="1D")
+        self.assertEqual(joined["FEAR_AND_GREED_VALUE"].iloc[0], 2.0)
+        self.assertTrue(np.isnan(joined["FEAR_AND_GREED_VALUE"].iloc[1]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from tmai_api.panel import PricePanel
+
+def make_ohlcv():
+    times = pd.date_range("2024-01-01", periods=48, freq="h", tz="UTC").strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    rows = []
+    for token, base in [(3375, 40000.0), (3306, 2000.0)]:
+        for i, time in enumerate(times):
+            if token == 3306 and i in (5, 6):
+                continue
+            rows.append({"TOKEN_ID": token, "TOKEN_SYMBOL": "X", "TIMESTAMP": time, "OPEN": base + i,
+                         "HIGH": base + i + 1, "LOW": base + i - 1, "CLOSE": base + i, "VOLUME": 10.0 * i})
+    return pd.DataFrame(rows)
+
+class TestPricePanel(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "panel")
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_write_open_and_slice(self):
+        df = make_ohlcv()
+        PricePanel.write(self.path, df)
+        panel = PricePanel.open(self.path)
+        
+        self.assertEqual(panel.shape, (2, 48))
+        self.assertIsInstance(panel.arrays["CLOSE"], np.memmap)
+        close = panel.get("CLOSE", 3375, "2024-01-01T10:00:00.000Z", "2024-01-01T12:00:00.000Z")
+        self.assertEqual(close.tolist(), [40010.0, 40011.0, 40012.0])
+        self.assertFalse(panel.mask[panel.token_row(3306), 5])
+        self.assertTrue(np.isnan(panel.get("CLOSE", 3306)[6]))
+        
+        restored = panel.to_dataframe()
+        self.assertEqual(len(restored), len(df))
+        merged = restored.merge(df, on=["TOKEN_ID", "TIMESTAMP"], suffixes=("", "_orig"))
+        self.assertTrue(np.allclose(merged["VOLUME"], merged["VOLUME_orig"]))
+        
+        with self.assertRaises(KeyError):
+            panel.get("CLOSE", 1)
+    
+    def test_rewrite_keeps_open_readers_valid(self):
+        df = make_ohlcv()
+        old = PricePanel.write(self.path, df)
+        df["CLOSE"] = df["CLOSE"] * 2
+        new = PricePanel.write(self.path, df)
+        
+        self.assertEqual(old.get("CLOSE", 3375)[0], 40000.0)
+        self.assertEqual(new.get("CLOSE", 3375)[0], 80000.0)
+        current = [name for name in os.listdir(self.path) if name != "CURRENT"]
+        self.assertEqual(len(current), 1)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.path, current[0]))),
+                         ["CLOSE.npy", "HIGH.npy", "LOW.npy", "OPEN.npy", "VOLUME.npy", "index.json", "mask.npy"])
+        
+        # Fields dropped from a rewrite do not linger next to the new version
+        narrow = PricePanel.write(self.path, df, fields=("CLOSE",))
+        self.assertEqual(narrow.fields, ["CLOSE"])
+        current = [name for name in os.listdir(self.path) if name != "CURRENT"]
+        self.assertEqual(sorted(os.listdir(os.path.join(self.path, current[0]))),
+                         ["CLOSE.npy", "index.json", "mask.npy"])
+        self.assertEqual(new.get("HIGH", 3375)[0], 40001.0)
+        with self.assertRaises(ValueError):
+            PricePanel.write(self.path, df[["TOKEN_ID", "TIMESTAMP"]])
+    
+    def test_grades_are_aligned_as_of_each_bar(self):
+        grades = pd.DataFrame([
+            {"TOKEN_ID": 3375, "DATE": "2024-01-01T00:00:00.000Z", "TM_TRADER_GRADE": 60.0},
+            {"TOKEN_ID": 3375, "DATE": "2024-01-02T00:00:00.000Z", "TM_TRADER_GRADE": 70.0},
+        ])
+        panel = PricePanel.write(self.path, make_ohlcv(), grades=grades)
+        grade = panel.get("TM_TRADER_GRADE", 3375)
+        self.assertEqual(grade[23], 60.0)
+        self.assertEqual(grade[24], 70.0)
+        self.assertTrue(np.isnan(panel.get("TM_TRADER_GRADE", 3306)).all())
+
+if __name__ == '__main__':
+    unittest.main()
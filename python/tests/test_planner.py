@@ -0,0 +1,80 @@
+import unittest
+from unittest import mock
+from tmai_api import TokenMetricsClient
+from tmai_api.planner import FetchPlan, optimal_batching
+
+class TestFetchPlanner(unittest.TestCase):
+    
+    def test_optimal_batching(self):
+        # 3 tokens x 60 days of hourly bars with a 1000-row limit
+        self.assertEqual(optimal_batching(3, 60, 24, 1000, 29), (3, 12, True))
+        # One request per day can hold 41 tokens of hourly bars
+        self.assertEqual(optimal_batching(100, 1, 24, 1000, 29), (34, 1, True))
+        self.assertEqual(optimal_batching(1, 1, 2000, 1000, 29), (1, 1, False))
+    
+    @mock.patch('requests.get')
+    def test_dry_run_and_execute(self, mock_get):
+        def respond(url, headers=None, params=None, **kwargs):
+            mock_response = mock.Mock()
+            mock_response.raise_for_status.return_value = None
+            if url.endswith("/tokens"):
+                mock_response.json.return_value = {"data": [
+                    {"TOKEN_ID": 3375, "TOKEN_SYMBOL": "BTC"},
+                    {"TOKEN_ID": 3306, "TOKEN_SYMBOL": "ETH"},
+                    {"TOKEN_ID": 9999, "TOKEN_SYMBOL": "ETH"}]}
+            else:
+                mock_response.json.return_value = {"data": [{"TOKEN_ID": params['token_id'],
+                                                             "START": params['startDate']}]}
+            return mock_response
+        mock_get.side_effect = respond
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        plan = client.hourly_ohlcv.get(symbol="BTC,ETH", startDate="2024-01-01", endDate="2024-02-29",
+                                       dry_run=True)
+        
+        self.assertIsInstance(plan, FetchPlan)
+        self.assertEqual(plan.request_count, 5)
+        self.assertEqual(plan.expected_rows, 3 * 24 * 60)
+        self.assertTrue(plan.rows_per_request <= plan.limit)
+        self.assertEqual(client.token_index, {"BTC": ["3375"], "ETH": ["3306", "9999"]})
+        self.assertEqual(mock_get.call_count, 1)
+        
+        result = plan.execute(progress=False)
+        self.assertEqual(mock_get.call_count, 6)
+        self.assertEqual([row["START"] for row in result["data"]],
+                         ["2024-01-01", "2024-01-13", "2024-01-25", "2024-02-06", "2024-02-18"])
+        self.assertEqual(mock_get.call_args[1]['params']['token_id'], "3375,3306,9999")
+        self.assertNotIn('symbol', mock_get.call_args[1]['params'])
+        
+        # Symbols are resolved from the cached token index on later calls
+        client.hourly_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-01-02", plan=True)
+        self.assertEqual(mock_get.call_count, 7)
+    
+    @mock.patch('requests.get')
+    def test_unresolved_symbols_fall_back_to_symbol_param(self, mock_get):
+        def respond(url, headers=None, params=None, **kwargs):
+            mock_response = mock.Mock()
+            mock_response.raise_for_status.return_value = None
+            if url.endswith("/tokens"):
+                mock_response.json.return_value = {"data": [{"TOKEN_ID": 3375, "TOKEN_SYMBOL": "BTC"}]}
+            else:
+                mock_response.json.return_value = {"data": [{"SYMBOL": params.get('symbol')}]}
+            return mock_response
+        mock_get.side_effect = respond
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        plan = client.daily_ohlcv.get(symbol="BTC,NEWCOIN", startDate="2024-01-01", endDate="2024-01-10",
+                                      dry_run=True)
+        self.assertEqual(plan.request_count, 1)
+        self.assertEqual(client.token_index, {"BTC": ["3375"]})
+        
+        result = plan.execute(progress=False)
+        self.assertEqual(result["data"], [{"SYMBOL": "BTC,NEWCOIN"}])
+        self.assertNotIn('token_id', mock_get.call_args[1]['params'])
+        
+        # The miss is looked up again rather than cached
+        client.daily_ohlcv.get(symbol="NEWCOIN", startDate="2024-01-01", endDate="2024-01-10", dry_run=True)
+        self.assertEqual(mock_get.call_args[1]['params']['symbol'], "NEWCOIN")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+import pandas as pd
+from tmai_api.portfolio import holdings_panel, reconstruct_nav
+
+def daily(day):
+    return (pd.Timestamp("2024-01-01", tz="UTC") + pd.Timedelta(days=day)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+class TestPortfolio(unittest.TestCase):
+    
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.closes = {token: 100 * np.exp(np.cumsum(rng.normal(0, 0.03, 30))) for token in (1, 2, 3)}
+        self.prices = pd.DataFrame([{"TOKEN_ID": token, "DATE": daily(day), "CLOSE": close[day]}
+                                    for token, close in self.closes.items() for day in range(30)])
+        self.holdings = pd.DataFrame([
+            {"TOKEN_ID": 1, "DATE": daily(0), "WEIGHT": 0.5},
+            {"TOKEN_ID": 2, "DATE": daily(0), "WEIGHT": 0.5},
+            {"TOKEN_ID": 2, "DATE": daily(10), "WEIGHT": 0.25},
+            {"TOKEN_ID": 3, "DATE": daily(10), "WEIGHT": 0.75},
+        ])
+    
+    def simulate(self, cost_bps=0.0):
+        """Reference day-by-day simulation with explicit quantities."""
+        targets = {0: {1: 0.5, 2: 0.5}, 10: {2: 0.25, 3: 0.75}}
+        quantities, nav = {}, []
+        value = 1.0
+        for day in range(30):
+            if quantities:
+                value = sum(q * self.closes[t][day] for t, q in quantities.items())
+            if day in targets:
+                before = {t: q * self.closes[t][day] / value for t, q in quantities.items()}
+                tokens = set(before) | set(targets[day])
+                turnover = 0.5 * sum(abs(targets[day].get(t, 0) - before.get(t, 0)) for t in tokens) \
+                    if quantities else 1.0
+                value *= 1 - turnover * cost_bps / 10000
+                quantities = {t: w * value / self.closes[t][day] for t, w in targets[day].items()}
+            nav.append(value)
+        return np.array(nav)
+    
+    def test_nav_matches_simulation(self):
+        for cost_bps in (0.0, 25.0):
+            result = reconstruct_nav(self.holdings, self.prices, weight_col="WEIGHT", cost_bps=cost_bps)
+            np.testing.assert_allclose(result.nav.to_numpy(), self.simulate(cost_bps))
+        
+        self.assertEqual(result.turnover.iloc[0], 1.0)
+        self.assertEqual(len(result.turnover), 2)
+        np.testing.assert_allclose(result.weights.sum(axis=1), 1.0)
+        self.assertEqual(result.weights.loc[pd.Timestamp("2024-01-11", tz="UTC"), 1], 0.0)
+        self.assertEqual(len(result.returns), 29)
+    
+    def test_equal_weights_without_weight_column(self):
+        panel = holdings_panel(self.holdings.drop(columns="WEIGHT"))
+        self.assertEqual(panel.loc[pd.Timestamp("2024-01-11", tz="UTC")].tolist(), [0.0, 0.5, 0.5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+from unittest import mock
+from tmai_api import TokenMetricsClient
+from tmai_api.proxy import CachingProxy, _Flight
+from tmai_api.transport import InMemoryTransport
+
+class TestCachingProxy(unittest.TestCase):
+    
+    def setUp(self):
+        self.proxy = CachingProxy(api_key="proxy-key")
+        self.server = self.proxy.make_server(port=0)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_coalesces_and_caches_identical_requests(self):
+        calls = []
+        def fetch(path, params, headers):
+            calls.append((path, params))
+            time.sleep(0.2)
+            return 200, {"content-type": "application/json"}, b'{"data": [{"TOKEN_SYMBOL": "BTC"}]}'
+        
+        with mock.patch.object(self.proxy, "_fetch", side_effect=fetch):
+            client = TokenMetricsClient(api_key="worker-key", base_url=self.base_url)
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(client.tokens.get(symbol="BTC")))
+                       for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            results.append(client.tokens.get(symbol="BTC"))
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][0], "/tokens")
+        self.assertEqual(calls[0][1]["symbol"], "BTC")
+        self.assertEqual(results, [{"data": [{"TOKEN_SYMBOL": "BTC"}]}] * 6)
+        self.assertEqual(self.proxy.stats["hits"], 1)
+        self.assertEqual(self.proxy.stats["coalesced"], 4)
+    
+    def test_coalesced_requests_get_502_when_upstream_raises(self):
+        def fetch(path, params, headers):
+            time.sleep(0.2)
+            raise ValueError("Malformed upstream response")
+        
+        results = []
+        def get():
+            results.append(self.proxy.get("/tokens", {"symbol": "BTC"}, {}))
+        
+        with mock.patch.object(self.proxy, "_fetch", side_effect=fetch):
+            threads = [threading.Thread(target=get) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual([status for status, _, _ in results], [502] * 5)
+        self.assertEqual(results[0][2], b"Malformed upstream response")
+        self.assertEqual(self.proxy.stats["coalesced"], 4)
+        self.assertEqual(self.proxy.flights, {})
+        self.assertEqual(len(self.proxy.cache), 0)
+    
+    def test_date_aware_ttl(self):
+        self.assertEqual(self.proxy.ttl_for({"startDate": "2020-01-01", "endDate": "2020-02-01"}), 86400)
+        self.assertEqual(self.proxy.ttl_for({"startDate": "2020-01-01", "endDate": "2999-01-01"}), 60)
+        self.assertEqual(self.proxy.ttl_for({"symbol": "BTC"}), 300)
+    
+    def test_upstream_requests_use_the_client_transport(self):
+        transport = InMemoryTransport({"tokens": lambda params, json: {"data": [{"TOKEN_SYMBOL": params["symbol"]}]}})
+        proxy = CachingProxy(api_key="proxy-key", transport=transport, timeout=(3, 7))
+        with mock.patch.object(transport, "send", wraps=transport.send) as send:
+            status, _, body = proxy.get("/tokens", {"symbol": "BTC"}, {})
+        self.assertEqual(status, 200)
+        self.assertEqual(body, b'{"data": [{"TOKEN_SYMBOL": "BTC"}]}')
+        self.assertEqual(send.call_args[1]["timeout"], (3, 7))
+        self.assertEqual(proxy.wait_timeout, 10)
+    
+    def test_coalesced_request_times_out(self):
+        proxy = CachingProxy(api_key="proxy-key", wait_timeout=0.05)
+        key = ("/tokens", (("symbol", "BTC"),), None)
+        proxy.flights[key] = _Flight()
+        status, _, _ = proxy.get("/tokens", {"symbol": "BTC"}, {})
+        self.assertEqual(status, 504)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from tmai_api import TokenMetricsClient
+from tmai_api.query import col
+from tmai_api.transport import InMemoryTransport
+
+def grades(params, payload):
+    symbols = params.get("symbol", "BTC,ETH,SOL").split(",")
+    rows = []
+    for day in range(int(params["startDate"][-2:]), int(params["endDate"][-2:]) + 1):
+        for grade, symbol in enumerate(symbols):
+            rows.append({"TOKEN_ID": grade, "TOKEN_SYMBOL": symbol, "DATE": "2024-01-%02dT00:00:00.000Z" % day,
+                         "TM_TRADER_GRADE": 70 + 10 * grade, "EXTRA": "x" * 10})
+    return {"success": True, "data": rows}
+
+class TestQuery(unittest.TestCase):
+    
+    def setUp(self):
+        self.transport = InMemoryTransport({"trader-grades": grades, "tokens": {"data": [{"TOKEN_ID": 1}]}})
+        self.client = TokenMetricsClient(api_key="test-api-key", transport=self.transport)
+    
+    def test_predicates_are_pushed_down(self):
+        query = (self.client.trader_grades.query()
+                 .where(col("TOKEN_SYMBOL").isin(["BTC", "ETH"]), col("DATE").between("2024-01-02", "2024-01-05"))
+                 .where(col("DATE") > "2024-01-02", col("TM_TRADER_GRADE") >= 75)
+                 .select(["TOKEN_SYMBOL", "DATE"]))
+        self.assertEqual(query.pushdown(), {"symbol": "BTC,ETH", "startDate": "2024-01-02",
+                                            "endDate": "2024-01-05", "traderGrade": 75})
+        self.assertEqual(self.transport.calls, [])
+        
+        df = query.collect()
+        params = self.transport.calls[0][2]
+        self.assertEqual((params["symbol"], params["traderGrade"]), ("BTC,ETH", 75))
+        self.assertEqual(list(df.columns), ["TOKEN_SYMBOL", "DATE"])
+        self.assertEqual(df["TOKEN_SYMBOL"].unique().tolist(), ["ETH"])
+        self.assertEqual(df["DATE"].str[:10].tolist(), ["2024-01-03", "2024-01-04", "2024-01-05"])
+    
+    def test_fields_are_dropped_while_parsing(self):
+        data = self.client.trader_grades.get(startDate="2024-01-01", endDate="2024-01-01", columnar=True,
+                                             fields=["TOKEN_SYMBOL"], progress=False)
+        self.assertEqual(list(data.columns), ["TOKEN_SYMBOL"])
+        rows = self.client.trader_grades.get(startDate="2024-01-01", endDate="2024-01-01",
+                                             fields=["TOKEN_ID"], progress=False)["data"]
+        self.assertEqual(rows, [{"TOKEN_ID": 0}, {"TOKEN_ID": 1}, {"TOKEN_ID": 2}])
+        rows = self.client.trader_grades.get(startDate="2024-01-01", endDate="2024-01-01", stream=True,
+                                             fields=["TOKEN_ID", "MISSING"], progress=False)["data"]
+        self.assertEqual(rows[0], {"TOKEN_ID": 0, "MISSING": None})
+    
+    def test_collect_rejects_its_own_options(self):
+        query = self.client.trader_grades.query().where(col("DATE").between("2024-01-01", "2024-01-02"))
+        with self.assertRaises(TypeError):
+            query.collect(columnar=False)
+        with self.assertRaises(TypeError):
+            query.collect(fields=["DATE"])
+        self.assertEqual(len(query.collect(return_result=True)), 6)
+    
+    def test_unpaginated_endpoint_and_raw_params(self):
+        df = self.client.tokens.query().where(symbol=["BTC", "ETH"]).collect()
+        self.assertEqual(df["TOKEN_ID"].tolist(), [1])
+        self.assertEqual(self.transport.calls[0][2]["symbol"], "BTC,ETH")
+
+if __name__ == '__main__':
+    unittest.main()
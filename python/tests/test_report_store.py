@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+from tmai_api import TokenMetricsClient
+from tmai_api.report_store import ReportStore
+
+class TestReportStore(unittest.TestCase):
+    
+    def setUp(self):
+        self.client = TokenMetricsClient(api_key="test-api-key")
+        self.reports = [
+            {"TOKEN_ID": 3375, "TOKEN_SYMBOL": "BTC", "TOKEN_NAME": "Bitcoin",
+             "TRADER_REPORT": "Strong momentum after the halving. Momentum traders are long.",
+             "TECHNOLOGY_REPORT": "Proof of work secures the network."},
+            {"TOKEN_ID": 3306, "TOKEN_SYMBOL": "ETH", "TOKEN_NAME": "Ethereum",
+             "TRADER_REPORT": "Weak momentum, range bound.",
+             "FUNDAMENTAL_REPORT": "Proof of stake and a large developer ecosystem."}
+        ]
+    
+    def test_search_keywords_and_phrases(self):
+        store = ReportStore(":memory:")
+        self.assertEqual(store.add_reports(self.reports), 4)
+        
+        results = store.search("momentum")
+        self.assertEqual([r["symbol"] for r in results], ["BTC", "ETH"])
+        self.assertEqual(results[0]["score"], 2)
+        
+        results = store.search('"proof of stake"')
+        self.assertEqual([(r["symbol"], r["section"]) for r in results], [("ETH", "FUNDAMENTAL_REPORT")])
+        self.assertEqual(store.search('"stake of proof"'), [])
+        self.assertEqual(len(store.search("proof", sections=["TECHNOLOGY_REPORT"])), 1)
+    
+    @mock.patch('requests.get')
+    def test_refresh_reindexes_only_changed_sections(self, mock_get):
+        mock_response = mock.Mock(status_code=200, headers={})
+        mock_response.json.return_value = {"data": self.reports}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+        
+        store = ReportStore(":memory:", client=self.client)
+        self.assertEqual(store.refresh(), 4)
+        self.assertEqual(store.refresh(), 0)
+        
+        self.reports[1]["TRADER_REPORT"] = "Momentum is building."
+        self.assertEqual(store.refresh(), 1)
+        self.assertEqual(store.get_report(3306, "TRADER_REPORT"), "Momentum is building.")
+        self.assertEqual(store.search("range"), [])
+        
+        # Sections and reports the API no longer returns are removed
+        del self.reports[0]["TECHNOLOGY_REPORT"]
+        del self.reports[1]
+        store.refresh()
+        self.assertIsNone(store.get_report(3375, "TECHNOLOGY_REPORT"))
+        self.assertIsNone(store.get_report(3306, "TRADER_REPORT"))
+        self.assertEqual(store.search("proof"), [])
+    
+    @mock.patch('requests.get')
+    def test_refresh_stops_when_pages_repeat_and_revalidates(self, mock_get):
+        def respond(url, headers=None, params=None, **kwargs):
+            if headers.get("if-none-match") == '"v1"':
+                return mock.Mock(status_code=304, headers={})
+            # The page parameter is ignored: every page is the same
+            mock_response = mock.Mock(status_code=200, headers={"ETag": '"v1"'})
+            mock_response.json.return_value = {"data": self.reports}
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        mock_get.side_effect = respond
+        
+        store = ReportStore(":memory:", client=self.client)
+        self.assertEqual(store.refresh(page_size=2), 4)
+        self.assertEqual(mock_get.call_count, 2)
+        
+        self.assertEqual(store.refresh(page_size=2), 0)
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(len(store.search("momentum")), 2)
+
+if __name__ == '__main__':
+    unittest.main()
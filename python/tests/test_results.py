@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+import requests
+from tmai_api import TokenMetricsClient
+from tmai_api.columnar import ColumnarAccumulator
+from tmai_api.results import FetchResult
+
+class TestFetchResult(unittest.TestCase):
+    
+    @mock.patch('requests.get')
+    def test_records_failed_chunks_and_refetches_them(self, mock_get):
+        failing = {"2024-01-30"}
+        def respond(url, headers=None, params=None, **kwargs):
+            if params['startDate'] in failing:
+                raise requests.ConnectionError("connection reset")
+            mock_response = mock.Mock()
+            mock_response.json.return_value = {"data": [{"DATE": params['startDate']}]}
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        mock_get.side_effect = respond
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        result = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                        return_result=True)
+        
+        self.assertIsInstance(result, FetchResult)
+        self.assertFalse(result.complete)
+        self.assertEqual([(f.chunk_start, f.chunk_end) for f in result.failed], [("2024-01-30", "2024-02-28")])
+        self.assertIsInstance(result.failed[0].error, requests.ConnectionError)
+        self.assertEqual(len(result.data), 2)
+        
+        failing.clear()
+        calls = mock_get.call_count
+        result.refetch_failed()
+        
+        self.assertEqual(mock_get.call_count, calls + 1)
+        self.assertTrue(result.complete)
+        self.assertEqual([row["DATE"] for row in result.to_response()["data"]],
+                         ["2024-01-01", "2024-01-30", "2024-02-28"])
+        self.assertEqual(len(result.to_dataframe()), 3)
+    
+    @mock.patch('requests.get')
+    def test_refetched_columnar_rows_keep_chunk_order_and_fields(self, mock_get):
+        failing = {"2024-01-01"}
+        def respond(url, headers=None, params=None, **kwargs):
+            if params['startDate'] in failing:
+                raise requests.ConnectionError("connection reset")
+            mock_response = mock.Mock()
+            mock_response.json.return_value = {"data": [{"DATE": params['startDate'], "CLOSE": 1.5, "OPEN": 1},
+                                                        {"DATE": params['endDate'], "CLOSE": 2.5, "OPEN": 2}]}
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        mock_get.side_effect = respond
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        for columnar in (False, True):
+            failing.add("2024-01-01")
+            result = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                            return_result=True, columnar=columnar, fields=["DATE", "CLOSE"],
+                                            progress=False)
+            failing.clear()
+            # Columnar data is merged buffer by buffer, never rebuilt from row dicts
+            with mock.patch.object(ColumnarAccumulator, "iter_rows", side_effect=AssertionError):
+                result.refetch_failed()
+            
+            df = result.to_dataframe()
+            self.assertEqual(list(df.columns), ["DATE", "CLOSE"])
+            self.assertEqual(list(df["DATE"]), ["2024-01-01", "2024-01-30", "2024-01-30", "2024-02-28",
+                                                "2024-02-28", "2024-03-01"])
+            self.assertEqual(result.row_counts, [2, 2, 2])
+
+if __name__ == '__main__':
+    unittest.main()
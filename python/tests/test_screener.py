@@ -0,0 +1,51 @@
+import unittest
+import pandas as pd
+from tmai_api.screener import Screener
+
+class TestScreener(unittest.TestCase):
+    
+    def setUp(self):
+        rows = [
+            (3375, "BTC", 1e12, 5e10, 80, 90, "['Layer 1']", "['binance', 'coinbase']"),
+            (3306, "ETH", 4e11, 2e10, 75, 88, "['Layer 1', 'Smart Contracts']", "['binance']"),
+            (100, "UNI", 5e9, 1e8, 92, 70, "['DeFi']", "['coinbase']"),
+            (200, "AAVE", 2e9, 2e8, 60, None, "['DeFi', 'Lending']", "['binance']"),
+        ]
+        self.snapshot = pd.DataFrame(rows, columns=["TOKEN_ID", "TOKEN_SYMBOL", "MARKET_CAP", "VOLUME_24H",
+                                                    "TM_TRADER_GRADE", "TM_INVESTOR_GRADE", "CATEGORY_LIST",
+                                                    "EXCHANGE_LIST"])
+        self.snapshot["DATE"] = "2024-01-02T00:00:00.000Z"
+        # An older row for BTC is dropped from the snapshot
+        old = self.snapshot.iloc[[0]].assign(DATE="2024-01-01T00:00:00.000Z", TM_TRADER_GRADE=10)
+        self.screener = Screener(pd.concat([old, self.snapshot], ignore_index=True))
+    
+    def symbols(self, frame):
+        return frame["TOKEN_SYMBOL"].tolist()
+    
+    def test_endpoint_filters(self):
+        self.assertEqual(len(self.screener), 4)
+        self.assertEqual(self.symbols(self.screener.screen(marketcap=3e9)), ["BTC", "ETH", "UNI"])
+        self.assertEqual(self.symbols(self.screener.screen(category="defi", exchange="binance")), ["AAVE"])
+        self.assertEqual(self.symbols(self.screener.screen(traderGrade=78, investorGrade=0)), ["BTC", "UNI"])
+        with self.assertRaises(ValueError):
+            self.screener.screen(unknown=1)
+    
+    def test_list_filters_match_whole_items(self):
+        snapshot = pd.DataFrame({"TOKEN_ID": [1, 2, 3, 4], "TOKEN_SYMBOL": ["A", "B", "C", "D"],
+                                 "CATEGORY_LIST": ["['Blockchain']", '["AI", "Gaming"]', ["ai"], "Layer 1, AI"],
+                                 "EXCHANGE_LIST": [None, "binance", [{"exchange_name": "Binance"}], "kraken"]})
+        screener = Screener(snapshot)
+        self.assertEqual(self.symbols(screener.screen(category="ai")), ["B", "C", "D"])
+        self.assertEqual(self.symbols(screener.screen(category="layer 1")), ["D"])
+        self.assertEqual(self.symbols(screener.screen(exchange="BINANCE")), ["B", "C"])
+    
+    def test_expressions_sort_and_top(self):
+        result = self.screener.screen("TM_TRADER_GRADE > TM_INVESTOR_GRADE", columns=["TOKEN_SYMBOL"])
+        self.assertEqual(self.symbols(result), ["UNI"])
+        top = self.screener.screen(sort="TM_INVESTOR_GRADE", top=2)
+        self.assertEqual(self.symbols(top), ["BTC", "ETH"])
+        bottom = self.screener.screen(lambda df: df["VOLUME_24H"] < 1e11, sort="TM_TRADER_GRADE", ascending=True)
+        self.assertEqual(self.symbols(bottom), ["AAVE", "ETH", "BTC", "UNI"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import gc
+import json
+import os
+import tempfile
+import unittest
+import weakref
+from tmai_api import TokenMetricsClient
+from tmai_api.state import STATE_VERSION, ClientState
+from tmai_api.transport import InMemoryTransport
+
+def ohlcv(params, payload):
+    # Two rows per token per day
+    days = range(int(params["startDate"][-2:]), int(params["endDate"][-2:]) + 1)
+    rows = [{"TOKEN_ID": token, "DATE": "2024-01-%02d" % day}
+            for day in days for token in params["token_id"].split(",") * 2]
+    return {"data": rows}
+
+class TestClientState(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "state", "tmai.json")
+        self.transport = InMemoryTransport({
+            "tokens": {"data": [{"TOKEN_ID": 3375, "TOKEN_SYMBOL": "BTC"}], "success": True},
+            "daily-ohlcv": ohlcv,
+        })
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def client(self, **kwargs):
+        return TokenMetricsClient(api_key="test-api-key", transport=self.transport, state_file=self.path,
+                                  validator_cache=True, **kwargs)
+    
+    def test_round_trip(self):
+        client = self.client()
+        client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-01-10", plan=True, progress=False)
+        client.tokens.get(symbol="ETH")
+        self.assertEqual(client.row_density["daily-ohlcv"], 2.0)
+        client.save_state()
+        calls = len(self.transport.calls)
+        
+        warm = self.client()
+        self.assertEqual(warm.token_index, {"BTC": ["3375"]})
+        self.assertEqual(warm.row_density, {"daily-ohlcv": 2.0})
+        self.assertEqual(warm.latency.count("daily-ohlcv"), client.latency.count("daily-ohlcv"))
+        self.assertEqual(len(warm.validator_cache), len(client.validator_cache))
+        
+        # The symbol is resolved from the saved index and the plan uses the learned density
+        plan = warm.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-01-10", dry_run=True)
+        self.assertEqual(plan.expected_rows, 20)
+        self.assertEqual(len(self.transport.calls), calls)
+    
+    def test_stale_or_other_versions_are_ignored(self):
+        client = self.client()
+        client.token_index["BTC"] = ["3375"]
+        client.save_state()
+        self.assertIsNotNone(ClientState(self.path).read())
+        self.assertIsNone(ClientState(self.path, max_age=-1).read())
+        
+        with open(self.path) as f:
+            state = json.load(f)
+        state["version"] = STATE_VERSION + 1
+        with open(self.path, "w") as f:
+            json.dump(state, f)
+        self.assertEqual(self.client().token_index, {})
+        
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        self.assertFalse(ClientState(self.path).load(self.client()))
+    
+    def test_truncated_or_failed_fetches_are_not_learned(self):
+        client = self.client()
+        # A full page of the daily-ohlcv limit of 100 rows may have been truncated
+        full_page = {"data": [{"TOKEN_ID": "3375", "DATE": "2024-01-01"}] * 100}
+        self.transport.add("daily-ohlcv", full_page)
+        client.daily_ohlcv.get(token_id="3375", startDate="2024-01-01", endDate="2024-01-10", plan=True,
+                               progress=False)
+        self.assertEqual(client.row_density, {})
+        
+        self.transport.add("daily-ohlcv", lambda params, payload: (500, {"success": False}))
+        client.daily_ohlcv.get(token_id="3375", startDate="2024-01-01", endDate="2024-01-10", plan=True,
+                               progress=False)
+        self.assertEqual(client.row_density, {})
+    
+    def test_context_manager_saves_and_exit_hook_does_not_keep_client_alive(self):
+        with self.client() as client:
+            client.token_index["BTC"] = ["3375"]
+        self.assertEqual(self.client().token_index, {"BTC": ["3375"]})
+        
+        ref = weakref.ref(client)
+        del client
+        gc.collect()
+        self.assertIsNone(ref())
+
+if __name__ == '__main__':
+    unittest.main()
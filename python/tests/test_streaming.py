@@ -0,0 +1,56 @@
+import json
+import unittest
+from unittest import mock
+from tmai_api import TokenMetricsClient
+from tmai_api.streaming import iter_json_items
+
+def split_chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+class TestStreaming(unittest.TestCase):
+    
+    def test_iter_json_items_across_chunk_boundaries(self):
+        document = {
+            "success": True,
+            "message": "Data fetched successfully",
+            "data": [{"TOKEN_ID": i, "CLOSE": 1234.5 + i, "TOKEN_SYMBOL": "BéTC"} for i in range(50)],
+            "length": 50
+        }
+        text = json.dumps(document)
+        for size in (1, 7, 64, len(text)):
+            meta = {}
+            items = list(iter_json_items(split_chunks(text, size), meta=meta))
+            self.assertEqual(items, document["data"])
+            self.assertEqual(meta, {"success": True, "message": "Data fetched successfully", "length": 50})
+        
+            # Only the requested fields are decoded
+            items = list(iter_json_items(split_chunks(text, size), fields=["CLOSE", "NONE"]))
+            self.assertEqual(items, [{"CLOSE": row["CLOSE"], "NONE": None} for row in document["data"]])
+        
+        # Top-level arrays, scalar data values and empty arrays
+        self.assertEqual(list(iter_json_items(split_chunks("[1, 22, 333]", 2))), [1, 22, 333])
+        self.assertEqual(list(iter_json_items(['{"data": {"a": 1}}'])), [{"a": 1}])
+        self.assertEqual(list(iter_json_items(['{"data": [ ]}'])), [])
+    
+    @mock.patch('requests.get')
+    def test_paginated_stream_option(self, mock_get):
+        body = json.dumps({"success": True, "data": [{"TOKEN_ID": 3375, "CLOSE": 1.0}]}).encode()
+        mock_response = mock.Mock()
+        mock_response.encoding = "utf-8"
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_content.side_effect = lambda chunk_size: iter([body[:10], body[10:]])
+        mock_get.return_value = mock_response
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        result = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01",
+                                        endDate="2024-01-10", stream=True)
+        
+        self.assertEqual(result, {"success": True, "data": [{"TOKEN_ID": 3375, "CLOSE": 1.0}]})
+        args, kwargs = mock_get.call_args
+        self.assertTrue(kwargs['stream'])
+        # requests negotiates compression itself
+        self.assertNotIn('accept-encoding', kwargs['headers'])
+        mock_response.json.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+import requests
+from tmai_api import TokenMetricsClient
+from tmai_api.transport import HTTP2Transport, InMemoryTransport, RecordingTransport, ReplayTransport, Urllib3Transport
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Returns the request's startDate as a data row."""
+    
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        body = json.dumps({"success": True, "data": [{"DATE": query["startDate"][0],
+                                                       "API_KEY": self.headers["api_key"]}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.dumps({"body": self.rfile.read(length).decode()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+class TestRecordReplayTransport(unittest.TestCase):
+    
+    @mock.patch('requests.get')
+    def test_record_then_replay_chunked_request(self, mock_get):
+        def respond(url, headers=None, params=None, **kwargs):
+            mock_response = mock.Mock()
+            mock_response.status_code = 200
+            mock_response.headers = {"Content-Type": "application/json", "X-Other": "1"}
+            mock_response.encoding = "utf-8"
+            mock_response.content = ('{"data": [{"DATE": "%s", "TOKEN_ID": 3375}]}' % params['startDate']).encode()
+            return mock_response
+        mock_get.side_effect = respond
+        
+        with tempfile.TemporaryDirectory() as directory:
+            cassette = os.path.join(directory, "daily.jsonl.gz")
+            with RecordingTransport(cassette) as recorder:
+                client = TokenMetricsClient(api_key="test-api-key", transport=recorder)
+                recorded = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01")
+            self.assertEqual(mock_get.call_count, 3)
+            
+            client = TokenMetricsClient(api_key="test-api-key", transport=ReplayTransport(cassette))
+            replayed = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01")
+            self.assertEqual(mock_get.call_count, 3)
+        
+        self.assertEqual(replayed, recorded)
+        self.assertEqual([row["DATE"] for row in replayed["data"]], ["2024-01-01", "2024-01-30", "2024-02-28"])
+        
+        # Requests that were never recorded fail loudly instead of going to the network
+        with self.assertRaises(LookupError):
+            client.tokens._request('get', 'tokens', {'symbol': 'ETH'})
+
+class TestTransportBackends(unittest.TestCase):
+    
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = "http://127.0.0.1:%d/v2" % self.server.server_address[1]
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def fetch(self, transport, **options):
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport, base_url=self.base_url,
+                                    max_workers=3)
+        data = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-03-01",
+                                      progress=False, **options)
+        return [row["DATE"] for row in data["data"]], data["data"][0]["API_KEY"]
+    
+    def test_urllib3_transport(self):
+        transport = Urllib3Transport(maxsize=2)
+        expected = (["2024-01-01", "2024-01-30", "2024-02-28"], "test-api-key")
+        self.assertEqual(self.fetch(transport), expected)
+        self.assertEqual(self.fetch(transport, stream=True), expected)
+    
+    def test_urllib3_transport_bodies_and_connection_reuse(self):
+        transport = Urllib3Transport(maxsize=1)
+        url = self.base_url + "/daily-ohlcv"
+        self.assertEqual(transport.send("post", url, {}).json(), {"body": ""})
+        self.assertEqual(transport.send("post", url, {}, json={"a": 1}).json(), {"body": '{"a": 1}'})
+        
+        # Streamed responses closed before being read give their connection back
+        for _ in range(3):
+            transport.send("get", url, {}, params={"startDate": "2024-01-01"}, stream=True).close()
+        pool = transport.pool.connection_from_url(url)
+        self.assertEqual(pool.num_connections, 1)
+        self.assertEqual(pool.num_requests, 5)
+    
+    @unittest.skipUnless(importlib.util.find_spec("httpx") and importlib.util.find_spec("h2"),
+                         "httpx[http2] is not installed")
+    def test_http2_transport_falls_back_to_http1(self):
+        transport = HTTP2Transport()
+        self.assertEqual(self.fetch(transport)[0], ["2024-01-01", "2024-01-30", "2024-02-28"])
+        transport.close()
+    
+    def test_in_memory_transport(self):
+        transport = InMemoryTransport({
+            "daily-ohlcv": lambda params, payload: {"data": [{"DATE": params["startDate"]}]},
+            "tokens": (503, {"message": "unavailable"}),
+        })
+        client = TokenMetricsClient(api_key="test-api-key", transport=transport)
+        data = client.daily_ohlcv.get(symbol="BTC", startDate="2024-01-01", endDate="2024-01-10", progress=False)
+        self.assertEqual(data["data"], [{"DATE": "2024-01-01"}])
+        self.assertEqual(transport.calls[0][1], "/v2/daily-ohlcv")
+        with self.assertRaises(requests.HTTPError):
+            client.tokens._request('get', 'tokens')
+        # Unrouted paths answer 404
+        with self.assertRaises(requests.HTTPError):
+            client.ai_reports._request('get', 'ai-reports')
+
+if __name__ == '__main__':
+    unittest.main()
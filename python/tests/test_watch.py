@@ -0,0 +1,80 @@
+import unittest
+from unittest import mock
+import requests
+from tmai_api import TokenMetricsClient
+
+class TestWatcher(unittest.TestCase):
+    
+    @mock.patch('requests.get')
+    def test_emits_only_inserted_and_changed_rows(self, mock_get):
+        polls = [
+            [{"TOKEN_ID": 1, "DATE": "2024-01-01", "TM_TRADER_GRADE": 50},
+             {"TOKEN_ID": 2, "DATE": "2024-01-01", "TM_TRADER_GRADE": 60}],
+            [{"TOKEN_ID": 1, "DATE": "2024-01-01", "TM_TRADER_GRADE": 50},
+             {"TOKEN_ID": 2, "DATE": "2024-01-01", "TM_TRADER_GRADE": 65},
+             {"TOKEN_ID": 3, "DATE": "2024-01-01", "TM_TRADER_GRADE": 70}],
+        ]
+        def respond(url, headers=None, params=None, **kwargs):
+            mock_response = mock.Mock()
+            mock_response.json.return_value = {"data": polls.pop(0)}
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        mock_get.side_effect = respond
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        sleeps = []
+        watcher = client.trader_grades.watch(interval=60, jitter=0.1, sleep=sleeps.append, symbol="BTC,ETH,SOL")
+        changes = []
+        watcher.run(changes.append, max_polls=2)
+        
+        self.assertEqual([c.kind for c in changes], ["inserted", "inserted", "changed", "inserted"])
+        self.assertEqual([c.key for c in changes[2:]], [(2, "2024-01-01"), (3, "2024-01-01")])
+        self.assertEqual(len(sleeps), 1)
+        self.assertTrue(54 <= sleeps[0] <= 66)
+        params = mock_get.call_args[1]['params']
+        self.assertEqual(params['symbol'], "BTC,ETH,SOL")
+        self.assertIn('startDate', params)
+    
+    @mock.patch('requests.get')
+    def test_incomplete_poll_keeps_snapshot(self, mock_get):
+        rows = [{"TOKEN_ID": 1, "DATE": "2024-01-01", "TM_TRADER_GRADE": 50}]
+        polls = [rows, requests.exceptions.ConnectionError("down"), rows]
+        def respond(url, headers=None, params=None, **kwargs):
+            poll = polls.pop(0)
+            if isinstance(poll, Exception):
+                raise poll
+            mock_response = mock.Mock()
+            mock_response.json.return_value = {"data": poll}
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        mock_get.side_effect = respond
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        watcher = client.trader_grades.watch(sleep=lambda _: None, startDate="2024-01-01", endDate="2024-01-02")
+        self.assertEqual(len(watcher.poll()), 1)
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(watcher.poll(), [])
+        self.assertIn((1, "2024-01-01"), watcher.snapshot)
+    
+    @mock.patch('requests.get')
+    def test_only_keys_in_polled_window_are_dropped(self, mock_get):
+        polls = [
+            [{"TOKEN_ID": 1, "DATE": "2023-12-31", "TM_TRADER_GRADE": 40},
+             {"TOKEN_ID": 1, "DATE": "2024-01-01", "TM_TRADER_GRADE": 50}],
+            [],
+        ]
+        def respond(url, headers=None, params=None, **kwargs):
+            mock_response = mock.Mock()
+            mock_response.json.return_value = {"data": polls.pop(0)}
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+        mock_get.side_effect = respond
+        
+        client = TokenMetricsClient(api_key="test-api-key")
+        watcher = client.trader_grades.watch(sleep=lambda _: None, startDate="2024-01-01", endDate="2024-01-02")
+        watcher.poll()
+        watcher.poll()
+        self.assertEqual(list(watcher.snapshot), [(1, "2023-12-31")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+from tmai_api.frames import TOKEN_COLUMN, parse_times, time_column
+
+class AsOfIndex:
+    """Point-in-time lookups over grade and signal histories.
+    
+    Rows are sorted once by (token, time) and addressed by a composite integer
+    key, token code * time span + seconds since the first row, so the latest row
+    at or before any (token, time) is found with one binary search. Batches of
+    queries are answered with a single vectorized searchsorted call.
+    """
+    
+    def __init__(self, df, columns=None, time_col=None, token_col=TOKEN_COLUMN):
+        """Build the index.
+        
+        Args:
+            df (pandas.DataFrame): Frame from trader_grades, investor_grades or trading_signals
+            columns (list, optional): Value columns to return. Defaults to every other column
+            time_col (str, optional): Time column. Detected when None
+            token_col (str, optional): Token column
+        """
+        self.time_col = time_col or time_column(df)
+        self.token_col = token_col
+        self.columns = list(columns) if columns is not None else \
+            [c for c in df.columns if c not in (self.time_col, token_col)]
+        
+        seconds = parse_times(df[self.time_col]).to_numpy(dtype="datetime64[s]").astype(np.int64)
+        self.tokens = pd.Index(pd.unique(df[token_col]))
+        codes = self.tokens.get_indexer(df[token_col])
+        order = np.lexsort((seconds, codes))
+        self.codes = codes[order]
+        self.seconds = seconds[order]
+        self.values = {column: df[column].to_numpy()[order] for column in self.columns}
+        
+        self.origin = int(self.seconds.min()) if len(self.seconds) else 0
+        self.span = int(self.seconds.max()) - self.origin + 1 if len(self.seconds) else 1
+        self.keys = self.codes * self.span + (self.seconds - self.origin)
+        # First row of every token code
+        self.starts = np.searchsorted(self.codes, np.arange(len(self.tokens)), side="left")
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def _positions(self, codes, seconds):
+        """Return the row of the latest entry at or before each (code, second), or -1."""
+        offsets = np.clip(seconds - self.origin, -1, self.span - 1)
+        positions = np.searchsorted(self.keys, codes * self.span + offsets, side="right") - 1
+        found = (codes >= 0) & (positions >= self.starts[np.maximum(codes, 0)]) & (offsets >= 0)
+        return np.where(found, positions, -1)
+    
+    def lookup(self, token, time):
+        """Return the latest row of a token at or before a time.
+        
+        Args:
+            token: Token ID
+            time (str or datetime): Point in time
+            
+        Returns:
+            dict: Value columns plus the time of the row, or None when the token has no
+            row at or before the time
+        """
+        code = self.tokens.get_indexer([token])
+        second = np.array([parse_times(time).to_datetime64().astype("datetime64[s]").astype(np.int64)])
+        position = self._positions(code, second)[0]
+        if position < 0:
+            return None
+        row = {column: values[position] for column, values in self.values.items()}
+        row[self.time_col] = pd.Timestamp(self.seconds[position], unit="s", tz="UTC")
+        return row
+    
+    def lookup_many(self, tokens, times, max_age=None):
+        """Look up many (token, time) pairs at once.
+        
+        Args:
+            tokens (array-like): Token IDs
+            times (array-like): Points in time, one per token
+            max_age (str or timedelta, optional): Treat rows older than this as missing
+            
+        Returns:
+            pandas.DataFrame: One row per query with the value columns and the time of the
+            matched row; missing values where no row matches
+        """
+        codes = self.tokens.get_indexer(pd.Index(tokens))
+        seconds = pd.DatetimeIndex(parse_times(pd.Index(times))).to_numpy(dtype="datetime64[s]").astype(np.int64)
+        positions = self._positions(codes, seconds)
+        if max_age is not None:
+            limit = pd.Timedelta(max_age).total_seconds()
+            stale = (positions >= 0) & (seconds - self.seconds[positions] > limit)
+            positions = np.where(stale, -1, positions)
+        
+        found = positions >= 0
+        take = np.where(found, positions, 0)
+        result = {}
+        for column, values in self.values.items():
+            column_values = pd.Series(values[take] if len(values) else np.full(len(take), np.nan))
+            result[column] = column_values.where(found)
+        matched = pd.Series(self.seconds[take] if len(self.seconds) else np.zeros(len(take), dtype=np.int64))
+        result[self.time_col] = pd.to_datetime(matched, unit="s", utc=True).where(found)
+        return pd.DataFrame(result)
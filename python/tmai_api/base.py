@@ -1,11 +1,41 @@
-import requests
 import pandas as pd
 import datetime
+import time
+import copy
+import hashlib
+import json as jsonlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
 from tqdm import tqdm
+from tmai_api.columnar import ColumnarAccumulator
+from tmai_api.exceptions import DeadlineExceeded
+from tmai_api.hedging import HedgePolicy
+from tmai_api.planner import FetchPlanner
+from tmai_api.query import Query
+from tmai_api.results import FailedChunk, FetchResult
+from tmai_api.streaming import iter_json_items, iter_response_text
+from tmai_api.transport import request_key
+from tmai_api.watch import Watcher
 
 class BaseEndpoint:
     """Base class for all API endpoints"""
     
+    # Whether GET requests use cache validators when the client has a validator cache
+    conditional_requests = False
+    
+    # Default page limits for different endpoints
+    ENDPOINT_LIMITS = {
+        'daily-ohlcv': 100,
+        'hourly-ohlcv': 1000,
+        'trader-grades': 1000,
+        'investor-grades': 1000,
+        'market-metrics': 1000,
+        'trader-indices': 1000,
+        'trading-signals': 1000,
+        # Default for any other endpoint
+        'default': 1000
+    }
+    
     def __init__(self, client):
         """Initialize the endpoint with a client instance.
         
@@ -13,9 +43,9 @@ class BaseEndpoint:
             client: TokenMetricsClient instance
         """
         self.client = client
-        self.base_url = client.BASE_URL
+        self.base_url = client.base_url
     
-    def _request(self, method, endpoint, params=None, json=None):
+    def _request(self, method, endpoint, params=None, json=None, deadline_at=None):
         """Make a request to the API.
         
         Args:
@@ -23,28 +53,155 @@ class BaseEndpoint:
             endpoint (str): API endpoint path
             params (dict, optional): Query parameters for GET requests
             json (dict, optional): JSON payload for POST requests
+            deadline_at (float, optional): time.monotonic() value by which the request must finish
             
         Returns:
             dict: API response data
         """
+        cache = self.client.validator_cache
+        if cache is not None and self.conditional_requests and method.lower() == "get":
+            return self._conditional_request(endpoint, params, cache, deadline_at)
+        
+        response = self._send(method, endpoint, params=params, json=json, deadline_at=deadline_at)
+        return response.json()
+    
+    def _conditional_request(self, endpoint, params, cache, deadline_at=None):
+        """Make a GET request that revalidates a cached response.
+        
+        Stored ETag/Last-Modified validators are sent as conditional headers and a
+        304 response is served from the cache. When the server sends no validators,
+        an unchanged content hash still skips parsing the body again.
+        
+        Args:
+            endpoint (str): API endpoint path
+            params (dict, optional): Query parameters
+            cache (ValidatorCache): Cache holding validators and bodies
+            deadline_at (float, optional): time.monotonic() value by which the request must finish
+            
+        Returns:
+            dict: API response data, a copy the caller may mutate without touching the cache
+        """
+        key = request_key("get", f"{self.base_url}/{endpoint}", params)
+        entry = cache.get(key)
+        
+        response = self._send("get", endpoint, params=params, deadline_at=deadline_at,
+                              extra_headers=cache.conditional_headers(entry), allow_not_modified=entry is not None)
+        if response.status_code == 304:
+            return copy.deepcopy(entry["data"])
+        
+        content = response.content
+        digest = hashlib.sha1(content).hexdigest()
+        if entry is not None and entry["digest"] == digest:
+            data = entry["data"]
+        else:
+            data = jsonlib.loads(content)
+        
+        cache.put(key, data, digest, etag=response.headers.get("ETag"),
+                  last_modified=response.headers.get("Last-Modified"))
+        return copy.deepcopy(data)
+    
+    def _send(self, method, endpoint, params=None, json=None, stream=False, extra_headers=None,
+              allow_not_modified=False, deadline_at=None):
+        """Send a request to the API and return the raw response.
+        
+        Args:
+            method (str): HTTP method (get, post, etc.)
+            endpoint (str): API endpoint path
+            params (dict, optional): Query parameters for GET requests
+            json (dict, optional): JSON payload for POST requests
+            stream (bool, optional): Defer downloading the response body
+            extra_headers (dict, optional): Additional request headers
+            allow_not_modified (bool, optional): Return 304 responses instead of treating them as errors
+            deadline_at (float, optional): time.monotonic() value by which the request must finish.
+                The connect/read timeouts are capped to the time remaining
+            
+        Returns:
+            Response object returned by the client transport
+        """
         url = f"{self.base_url}/{endpoint}"
         headers = {
             "accept": "application/json",
             "api_key": self.client.api_key
         }
+        if extra_headers:
+            headers.update(extra_headers)
         
-        if method.lower() == "get":
-            response = requests.get(url, headers=headers, params=params)
-        elif method.lower() == "post":
+        if method.lower() == "post":
             headers["content-type"] = "application/json"
-            response = requests.post(url, headers=headers, json=json)
-        else:
+        elif method.lower() != "get":
             raise ValueError(f"Unsupported HTTP method: {method}")
         
+        key_pool = self.client.key_pool
+        if key_pool is None:
+            response = self.client.transport.send(method, url, headers, params=params, json=json,
+                                                  stream=stream, timeout=self._timeout(deadline_at))
+        else:
+            # A throttled key cools down and the request is retried once with each other key
+            for attempt in range(len(key_pool)):
+                headers["api_key"] = key_pool.acquire(deadline_at)
+                try:
+                    response = self.client.transport.send(method, url, headers, params=params, json=json,
+                                                          stream=stream, timeout=self._timeout(deadline_at))
+                except Exception:
+                    key_pool.release(headers["api_key"])
+                    raise
+                key_pool.release(headers["api_key"], response.status_code, response.headers)
+                if response.status_code != 429:
+                    break
+                if attempt < len(key_pool) - 1:
+                    response.close()
+        
+        if allow_not_modified and response.status_code == 304:
+            return response
+        
         # Raise an exception if the request failed
         response.raise_for_status()
         
-        return response.json()
+        return response
+    
+    def _timeout(self, deadline_at=None):
+        """Return the (connect, read) timeout for a request, capped by a deadline.
+        
+        Args:
+            deadline_at (float, optional): time.monotonic() value by which the request must finish
+            
+        Returns:
+            tuple: (connect timeout, read timeout) in seconds, or None for no timeout
+        """
+        timeout = self.client.timeout
+        if deadline_at is None:
+            return timeout
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded("Deadline expired before the request was sent")
+        if timeout is None:
+            return (remaining, remaining)
+        if not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        return tuple(min(value, remaining) if value is not None else remaining for value in timeout)
+    
+    def _request_items(self, method, endpoint, params=None, json=None, meta=None, deadline_at=None,
+                       fields=None):
+        """Make a request and incrementally parse the items of its "data" array.
+        
+        The response body is streamed and parsed item by item, so neither the raw
+        body nor the full parsed document is held in memory at once.
+        
+        Args:
+            method (str): HTTP method (get, post, etc.)
+            endpoint (str): API endpoint path
+            params (dict, optional): Query parameters for GET requests
+            json (dict, optional): JSON payload for POST requests
+            meta (dict, optional): Dict that receives the non-data fields of the response
+            deadline_at (float, optional): time.monotonic() value by which the request must finish
+            fields (list, optional): Only parse these fields of each data item
+            
+        Yields:
+            Items of the response's "data" array
+        """
+        response = self._send(method, endpoint, params=params, json=json, stream=True, deadline_at=deadline_at)
+        with closing(response):
+            yield from iter_json_items(iter_response_text(response), key="data", meta=meta, fields=fields)
     
     def _chunk_date_range(self, startDate, endDate, max_days=29):
         """Split a date range into chunks of max_days.
@@ -90,7 +247,67 @@ class BaseEndpoint:
             
         return result
     
-    def _paginated_request(self, method, endpoint, params=None, max_days=29, custom_limit=None):
+    def _fetch_chunk(self, method, endpoint, params, stream=False, deadline_at=None, fields=None,
+                     columnar=False):
+        """Fetch a single chunk and split the response into data items and metadata.
+        
+        Args:
+            method (str): HTTP method (get, post, etc.)
+            endpoint (str): API endpoint path
+            params (dict): Query parameters for this chunk
+            stream (bool, optional): Parse the response body incrementally
+            deadline_at (float, optional): time.monotonic() value by which the request must finish
+            fields (list, optional): Only parse these fields of each data item when streaming
+            columnar (bool, optional): Parse streamed items straight into a ColumnarAccumulator
+            
+        Returns:
+            tuple: (list of data items or ColumnarAccumulator, dict of the other response fields)
+        """
+        if stream:
+            meta = {}
+            items = self._request_items(method, endpoint, params, meta=meta, deadline_at=deadline_at,
+                                        fields=fields)
+            # Items go from the parser into column buffers one at a time
+            data_items = ColumnarAccumulator(fields) if columnar else []
+            data_items.extend(items)
+            return data_items, meta
+        
+        response = self._request(method, endpoint, params, deadline_at=deadline_at)
+        
+        # Extract the data
+        if isinstance(response, dict):
+            meta = {key: value for key, value in response.items() if key != "data"}
+            if "data" not in response:
+                return [], meta
+            data_items = response["data"]
+            return (data_items if isinstance(data_items, list) else [data_items]), meta
+        
+        # If the response is not a dict with a data field, use it directly
+        return (response if isinstance(response, list) else [response]), {}
+    
+    def _timed_fetch_chunk(self, method, endpoint, params, stream=False, deadline_at=None,
+                           start_times=None, index=None, fields=None, columnar=False):
+        """Fetch a single chunk and record its latency for hedging.
+        
+        Args:
+            method, endpoint, params, stream, deadline_at, fields, columnar: See _fetch_chunk
+            start_times (dict, optional): Receives the time.monotonic() start of the request
+            index (int, optional): Key of the request in start_times
+            
+        Returns:
+            tuple: (list of data items, dict of the other response fields)
+        """
+        begin = time.monotonic()
+        if start_times is not None:
+            start_times[index] = begin
+        result = self._fetch_chunk(method, endpoint, params, stream, deadline_at, fields, columnar)
+        self.client.latency.record(endpoint, time.monotonic() - begin)
+        return result
+    
+    def _paginated_request(self, method, endpoint, params=None, max_days=29, custom_limit=None,
+                           stream=False, columnar=False, progress=True, return_result=False,
+                           deadline=None, on_deadline="return", plan=False, dry_run=False, hedge=None,
+                           fields=None):
         """Make paginated requests to handle date ranges and custom pagination logic.
         
         This method handles two forms of pagination:
@@ -103,22 +320,33 @@ class BaseEndpoint:
             params (dict): Query parameters including startDate and endDate
             max_days (int): Maximum number of days allowed between startDate and endDate
             custom_limit (int, optional): Custom limit value. If None, uses endpoint-specific defaults.
+            stream (bool, optional): Parse each response body incrementally instead of in one shot,
+                which lowers peak memory for large pages
+            columnar (bool, optional): Accumulate rows into per-column typed buffers instead of
+                a list of dicts. The result is then a ColumnarAccumulator (with the response
+                metadata in its ``meta`` attribute) that converts to a DataFrame, NumPy or Arrow
+            progress (bool, optional): Display a progress bar while fetching
+            return_result (bool, optional): Return a FetchResult that records the failed
+                (chunk_start, chunk_end, error) units and can refetch only those chunks
+            deadline (float, optional): Upper bound in seconds for the whole call. When it expires,
+                outstanding chunk fetches are cancelled and recorded as failed chunks
+            on_deadline (str, optional): "return" the chunks that completed, or "raise"
+                DeadlineExceeded carrying them as a FetchResult
+            plan (bool, optional): Fetch with a FetchPlanner plan of (token batch, date range)
+                requests that each fit the page limit, instead of plain date chunks
+            dry_run (bool, optional): Return the FetchPlan (request count, expected rows)
+                without making any data requests
+            hedge (HedgePolicy or bool, optional): Send a duplicate of chunk requests that run
+                longer than a latency percentile of the endpoint and keep the first response.
+                True uses the client's hedge_policy (or a default HedgePolicy); None uses the
+                client's hedge_policy if set; False disables hedging
+            fields (list, optional): Only keep these fields of each data item; the others are
+                dropped as chunks arrive, or skipped without being decoded when streaming
             
         Returns:
-            dict: Combined API response data
+            dict: Combined API response data (ColumnarAccumulator when columnar=True,
+            FetchResult when return_result=True, FetchPlan when dry_run=True)
         """
-        # Default limits for different endpoints
-        endpoint_limits = {
-            'daily-ohlcv': 100,
-            'hourly-ohlcv': 1000,
-            'trader-grades': 1000,
-            'investor-grades': 1000,
-            'market-metrics': 1000,
-            'trader-indices': 1000,
-            'trading-signals': 1000,
-            # Default for any other endpoint
-            'default': 1000
-        }
         if params is None:
             params = {}
             
@@ -131,7 +359,7 @@ class BaseEndpoint:
             limit = custom_limit
         else:
             # Use endpoint-specific limit
-            limit = endpoint_limits.get(endpoint, endpoint_limits['default'])
+            limit = self.ENDPOINT_LIMITS.get(endpoint, self.ENDPOINT_LIMITS['default'])
         
         # Override user-provided limit with our internal limit
         params['limit'] = limit
@@ -140,6 +368,40 @@ class BaseEndpoint:
         if 'page' in params:
             del params['page']
             
+        if plan or dry_run:
+            fetch_plan = FetchPlanner(self.client).plan(self, endpoint, params, max_days=max_days, limit=limit)
+            if dry_run:
+                return fetch_plan
+            chunk_requests = fetch_plan.chunk_requests()
+        else:
+            fetch_plan = None
+            chunk_requests = self._date_chunk_requests(params, max_days, limit)
+        
+        result = self._fetch_chunks(method, endpoint, chunk_requests, stream=stream, columnar=columnar,
+                                    progress=progress, return_result=return_result or fetch_plan is not None,
+                                    deadline=deadline, on_deadline=on_deadline, hedge=hedge, fields=fields)
+        if fetch_plan is not None:
+            # Learn the row density from the per-request row counts
+            fetch_plan.observe(result)
+            if not return_result:
+                return result.to_response()
+        return result
+    
+    def _date_chunk_requests(self, params, max_days, limit):
+        """Split a request into one request per date chunk.
+        
+        Args:
+            params (dict): Query parameters including startDate and endDate
+            max_days (int): Maximum number of days allowed between startDate and endDate
+            limit (int): Page limit of each request
+            
+        Returns:
+            list: (chunk_start, chunk_end, chunk_params) tuples
+        """
+        # Extract date parameters
+        startDate = params.get('startDate')
+        endDate = params.get('endDate')
+        
         # If no date range or already within limits, we still need to handle pagination
         if not startDate or not endDate:
             date_chunks = [(startDate, endDate)]
@@ -147,60 +409,209 @@ class BaseEndpoint:
             # Split date range into chunks
             date_chunks = self._chunk_date_range(startDate, endDate, max_days)
         
+        # Build the request parameters of every date chunk
+        chunk_requests = []
+        for chunk_start, chunk_end in date_chunks:
+            # Update date parameters
+            chunk_params = params.copy()
+            if chunk_start:
+                chunk_params['startDate'] = chunk_start
+            if chunk_end:
+                chunk_params['endDate'] = chunk_end
+            
+            # Set a high limit to get as much data as possible in one request
+            chunk_params['limit'] = limit
+            
+            # Always start with page 0 for each chunk
+            chunk_params['page'] = 0
+            chunk_requests.append((chunk_start, chunk_end, chunk_params))
+        return chunk_requests
+    
+    def _fetch_chunks(self, method, endpoint, chunk_requests, stream=False, columnar=False, progress=True,
+                      return_result=False, deadline=None, on_deadline="return", hedge=None, fields=None):
+        """Fetch chunk requests concurrently and combine their results in chunk order.
+        
+        Args:
+            method (str): HTTP method (get, post, etc.)
+            endpoint (str): API endpoint path
+            chunk_requests (list): (chunk_start, chunk_end, chunk_params) tuples
+            stream, columnar, progress, return_result, deadline, on_deadline, hedge, fields:
+                See _paginated_request
+            
+        Returns:
+            dict: Combined API response data (ColumnarAccumulator when columnar=True,
+            FetchResult when return_result=True)
+        """
         # Initialize combined results
-        all_data = []
+        all_data = ColumnarAccumulator(fields) if columnar else []
         combined_meta = {}
+        failed = []
+        failed_params = []
+        failed_indexes = []
+        row_counts = [None] * len(chunk_requests)
+        
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        expired = False
+        workers = max(1, min(self.client.max_workers, len(chunk_requests)))
+        executor = ThreadPoolExecutor(max_workers=workers)
         
-        # Calculate total iterations for progress bar
-        total_iterations = len(date_chunks)
+        if hedge is None or hedge is True:
+            hedge = self.client.hedge_policy or (HedgePolicy() if hedge else None)
+        elif hedge is False:
+            hedge = None
+        hedge_executor = None
+        tracker = self.client.latency
         
         # Setup progress bar
-        with tqdm(total=total_iterations, desc=f"Fetching {endpoint} data", unit="chunk") as pbar:
-            # Process each date chunk
-            for chunk_start, chunk_end in date_chunks:
-                # Update date parameters
-                chunk_params = params.copy()
-                if chunk_start:
-                    chunk_params['startDate'] = chunk_start
-                if chunk_end:
-                    chunk_params['endDate'] = chunk_end
-                
-                # Set a high limit to get as much data as possible in one request
-                chunk_params['limit'] = limit
-                
-                # Always start with page 0 for each chunk
-                chunk_params['page'] = 0
+        with tqdm(total=len(chunk_requests), desc=f"Fetching {endpoint} data", unit="chunk",
+                  disable=not progress) as pbar:
+            try:
+                futures = {}
+                attempts = {}
+                start_times = {}
+                for index, (chunk_start, chunk_end, chunk_params) in enumerate(chunk_requests):
+                    future = executor.submit(self._timed_fetch_chunk, method, endpoint, chunk_params,
+                                             stream, deadline_at, start_times, index, fields, columnar)
+                    futures[future] = index
+                    attempts[index] = [future]
+                    if hedge is not None:
+                        hedge.record_request()
                 
-                # Try to get data for this date chunk, but handle errors gracefully
-                try:
-                    response = self._request(method, endpoint, chunk_params)
+                # Chunks are merged in date order, whatever order they complete in
+                completed = {}
+                finished = set()
+                next_index = 0
+                pending = set(futures)
+                hedged = set()
+                hedge_exhausted = False
+                while pending:
+                    timeout = None if deadline_at is None else max(0, deadline_at - time.monotonic())
+                    hedge_delay = hedge.delay(tracker, endpoint) if hedge is not None and not hedge_exhausted else None
+                    if hedge_delay is not None:
+                        # Wake up when the oldest running, unhedged request becomes a straggler
+                        waiting = [begin + hedge_delay for index, begin in list(start_times.items())
+                                   if index not in hedged and index not in finished]
+                        if waiting:
+                            until_hedge = max(0, min(waiting) - time.monotonic())
+                            timeout = until_hedge if timeout is None else min(timeout, until_hedge)
+                        elif any(index not in start_times and index not in finished for index in attempts):
+                            # Queued chunks only start their hedge clock once a worker picks them up,
+                            # so check back instead of blocking until some chunk completes
+                            timeout = hedge_delay if timeout is None else min(timeout, hedge_delay)
+                    done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
                     
-                    # Extract and store the data
-                    if isinstance(response, dict):
-                        if "data" in response:
-                            data_items = response["data"]
-                            if isinstance(data_items, list):
-                                all_data.extend(data_items)
-                            else:
-                                all_data.append(data_items)
+                    for future in done:
+                        index = futures[future]
+                        if index in finished:
+                            # The other request of a hedged chunk already won
+                            continue
+                        chunk_start, chunk_end, chunk_params = chunk_requests[index]
+                        others = [other for other in attempts[index] if other is not future and other in pending]
+                        # Collect the data of this date chunk, but handle errors gracefully
+                        try:
+                            completed[index] = future.result()
+                        except Exception as e:
+                            if others:
+                                # The duplicate of this chunk may still succeed
+                                continue
+                            # Skip this chunk and continue with the next one, remembering the failure
+                            # No need to print warnings as they would clutter the user's output
+                            completed[index] = None
+                            failed.append(FailedChunk(chunk_start, chunk_end, e))
+                            failed_params.append(chunk_params)
+                            failed_indexes.append(index)
+                        finished.add(index)
                         
-                        # Store metadata for later if it exists
-                        for key, value in response.items():
-                            if key != "data":
-                                combined_meta[key] = value
-                    else:
-                        # If the response is not a dict with a data field, append it directly
-                        if isinstance(response, list):
-                            all_data.extend(response)
-                        else:
-                            all_data.append(response)
-                except Exception as e:
-                    # Silently skip this chunk and continue with the next one
-                    # No need to print warnings as they would clutter the user's output
-                    pass
-                
-                # Update progress bar
-                pbar.update(1)
+                        # Running threads cannot be interrupted, so the losing request is abandoned
+                        for other in others:
+                            other.cancel()
+                            pending.discard(other)
+                        
+                        # Update progress bar
+                        pbar.update(1)
+                    
+                    if hedge_delay is not None:
+                        now = time.monotonic()
+                        for index, begin in sorted(list(start_times.items())):
+                            if index in hedged or index in finished or now - begin < hedge_delay:
+                                continue
+                            if not hedge.try_hedge():
+                                hedge_exhausted = True
+                                break
+                            if hedge_executor is None:
+                                hedge_executor = ThreadPoolExecutor(max_workers=workers)
+                            chunk_params = chunk_requests[index][2]
+                            duplicate = hedge_executor.submit(self._timed_fetch_chunk, method, endpoint,
+                                                              chunk_params, stream, deadline_at,
+                                                              fields=fields, columnar=columnar)
+                            futures[duplicate] = index
+                            attempts[index].append(duplicate)
+                            pending.add(duplicate)
+                            hedged.add(index)
+                    
+                    if pending and deadline_at is not None and time.monotonic() >= deadline_at:
+                        # Cancel outstanding chunks; running requests are bounded by their timeouts
+                        expired = True
+                        for index in sorted({futures[future] for future in pending}):
+                            for future in attempts[index]:
+                                future.cancel()
+                            chunk_start, chunk_end, chunk_params = chunk_requests[index]
+                            completed[index] = None
+                            finished.add(index)
+                            failed.append(FailedChunk(chunk_start, chunk_end,
+                                                      DeadlineExceeded(f"Deadline of {deadline}s expired")))
+                            failed_params.append(chunk_params)
+                            failed_indexes.append(index)
+                        pending = set()
+                    
+                    while next_index in completed:
+                        chunk_result = completed.pop(next_index)
+                        next_index += 1
+                        if chunk_result is not None:
+                            data_items, chunk_meta = chunk_result
+                            row_counts[next_index - 1] = len(data_items)
+                            if fields is not None and not columnar and not stream:
+                                data_items = [{key: item.get(key) for key in fields} if isinstance(item, dict)
+                                              else item for item in data_items]
+                            if isinstance(data_items, ColumnarAccumulator):
+                                all_data.merge(data_items)
+                            else:
+                                all_data.extend(data_items)
+                            
+                            # Store metadata for later if it exists
+                            combined_meta.update(chunk_meta)
+            finally:
+                executor.shutdown(wait=False)
+                if hedge_executor is not None:
+                    hedge_executor.shutdown(wait=False)
+        
+        if expired and on_deadline == "raise":
+            raise DeadlineExceeded(
+                f"Deadline of {deadline}s expired with {len(failed)} of {len(chunk_requests)} chunks incomplete",
+                result=FetchResult(self, method, endpoint, all_data, combined_meta,
+                                   failed, failed_params, stream=stream, row_counts=row_counts,
+                                   failed_indexes=failed_indexes, fields=fields))
+        
+        if return_result:
+            return FetchResult(self, method, endpoint, all_data, combined_meta,
+                               failed, failed_params, stream=stream, row_counts=row_counts,
+                               failed_indexes=failed_indexes, fields=fields)
+        
+        return self._combine_results(all_data, combined_meta)
+    
+    def _combine_results(self, all_data, combined_meta):
+        """Combine the data items and metadata of all chunks into one response.
+        
+        Args:
+            all_data (list or ColumnarAccumulator): Data items of all chunks
+            combined_meta (dict): Non-data response fields
+            
+        Returns:
+            dict: Combined API response data
+        """
+        if isinstance(all_data, ColumnarAccumulator):
+            all_data.meta = combined_meta
+            return all_data
         
         # Check if we got any data at all
         if not all_data:
@@ -220,6 +631,28 @@ class BaseEndpoint:
             # Otherwise, return just the data array
             return all_data
     
+    def query(self):
+        """Start a lazy query over this endpoint.
+        
+        Returns:
+            Query: Query whose predicates are pushed into the request parameters;
+            call collect() to fetch the result
+        """
+        return Query(self)
+    
+    def watch(self, interval=300, jitter=0.1, **kwargs):
+        """Watch this endpoint for inserted or changed rows.
+        
+        Args:
+            interval (float, optional): Seconds between polls
+            jitter (float, optional): Random fraction (+/-) applied to each interval
+            **kwargs: Arguments to pass to Watcher and to the get method
+            
+        Returns:
+            Watcher: Iterable of Change tuples, or use Watcher.run(callback)
+        """
+        return Watcher(self, interval=interval, jitter=jitter, **kwargs)
+    
     def to_dataframe(self, data):
         """Convert API response data to a pandas DataFrame.
         
@@ -231,7 +664,11 @@ class BaseEndpoint:
         """
         # Implementation depends on the specific structure of each endpoint's response
         # This is a placeholder to be overridden by subclasses
-        if isinstance(data, list):
+        if isinstance(data, FetchResult):
+            return data.to_dataframe()
+        elif isinstance(data, ColumnarAccumulator):
+            return data.to_dataframe()
+        elif isinstance(data, list):
             if not data:  # Handle empty list
                 return pd.DataFrame()
             return pd.DataFrame(data)
@@ -0,0 +1,89 @@
+import threading
+from collections import OrderedDict
+
+class ValidatorCache:
+    """Per-request store of HTTP cache validators and the last response body.
+    
+    Entries are keyed by a normalized request key and hold the ETag and
+    Last-Modified validators, a hash of the response content and the parsed
+    response. The least recently used entries are evicted beyond ``max_entries``.
+    """
+    
+    def __init__(self, max_entries=256):
+        """Initialize the cache.
+        
+        Args:
+            max_entries (int, optional): Maximum number of cached responses
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, key):
+        """Return the cached entry for a request key.
+        
+        Args:
+            key (str): Normalized request key
+            
+        Returns:
+            dict: Entry with etag, last_modified, digest and data keys, or None
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+    
+    def put(self, key, data, digest, etag=None, last_modified=None):
+        """Store the response for a request key.
+        
+        Args:
+            key (str): Normalized request key
+            data: Parsed response
+            digest (str): Hash of the response content
+            etag (str, optional): ETag response header
+            last_modified (str, optional): Last-Modified response header
+        """
+        with self.lock:
+            self.entries[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "digest": digest,
+                "data": data,
+            }
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def conditional_headers(self, entry):
+        """Build the conditional request headers for a cached entry.
+        
+        Args:
+            entry (dict): Entry returned by get()
+            
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry and entry["etag"]:
+            headers["if-none-match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["if-modified-since"] = entry["last_modified"]
+        return headers
+    
+    def items(self):
+        """Return a snapshot of the entries, least recently used first.
+        
+        Returns:
+            list: (key, entry) tuples
+        """
+        with self.lock:
+            return [(key, dict(entry)) for key, entry in self.entries.items()]
+    
+    def clear(self):
+        """Remove all entries."""
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,216 @@
+import argparse
+import datetime
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from tqdm import tqdm
+from tmai_api.client import TokenMetricsClient
+from tmai_api.planner import MARKET_WIDE_ENDPOINTS, ROWS_PER_DAY, optimal_batching
+from tmai_api.ratelimit import RateLimiter
+from tmai_api.transport import RateLimitedTransport, RequestsTransport
+
+# CLI endpoint name -> client attribute
+PAGINATED_ENDPOINTS = {
+    'hourly-ohlcv': 'hourly_ohlcv',
+    'daily-ohlcv': 'daily_ohlcv',
+    'trader-grades': 'trader_grades',
+    'investor-grades': 'investor_grades',
+    'trading-signals': 'trading_signals',
+    'market-metrics': 'market_metrics',
+    'trader-indices': 'trader_indices',
+}
+
+# Endpoints that accept a symbol filter
+SYMBOL_ENDPOINTS = {'hourly-ohlcv', 'daily-ohlcv', 'trader-grades', 'investor-grades', 'trading-signals'}
+
+# Per-process state, set up by _init_worker
+_worker = {}
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="tmai-fetch",
+        description="Export a paginated Token Metrics endpoint to partitioned Parquet/CSV files.")
+    parser.add_argument("endpoint", choices=sorted(PAGINATED_ENDPOINTS), help="Endpoint to export")
+    parser.add_argument("--start", required=True, help="Start date in YYYY-MM-DD format")
+    parser.add_argument("--end", required=True, help="End date in YYYY-MM-DD format")
+    parser.add_argument("--output", "-o", required=True, help="Output directory")
+    parser.add_argument("--api-key", default=os.environ.get("TMAI_API_KEY"),
+                        help="API key (defaults to the TMAI_API_KEY environment variable)")
+    parser.add_argument("--symbols", help="Comma-separated token symbols")
+    parser.add_argument("--symbols-file", help="File with one token symbol per line")
+    parser.add_argument("--symbol-batch", type=int, default=50,
+                        help="Number of symbols per request shard (default: 50)")
+    parser.add_argument("--chunk-days", type=int, default=29,
+                        help="Number of days per request shard (default: 29)")
+    parser.add_argument("--processes", "-p", type=int, default=4,
+                        help="Number of worker processes (default: 4)")
+    parser.add_argument("--rate-limit", type=float, default=None,
+                        help="Maximum requests per second across all processes")
+    parser.add_argument("--format", choices=("parquet", "csv"), default="parquet",
+                        help="Output file format (default: parquet)")
+    parser.add_argument("--layout", choices=("hive", "flat"), default="hive",
+                        help="hive: <endpoint>/date=<chunk start>/part-<batch>; "
+                             "flat: <endpoint>-<chunk start>-<chunk end>-<batch> (default: hive)")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra query parameter passed to the endpoint (repeatable)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="Re-fetch shards whose output file already exists")
+    args = parser.parse_args(argv)
+    
+    if not args.api_key:
+        parser.error("an API key is required (--api-key or TMAI_API_KEY)")
+    if args.symbol_batch < 1 or args.chunk_days < 1 or args.processes < 1:
+        parser.error("--symbol-batch, --chunk-days and --processes must be positive")
+    for param in args.param:
+        if "=" not in param:
+            parser.error(f"invalid --param {param!r}, expected KEY=VALUE")
+    return args
+
+def _load_symbols(args):
+    symbols = []
+    if args.symbols:
+        symbols.extend(s.strip() for s in args.symbols.split(","))
+    if args.symbols_file:
+        with open(args.symbols_file, encoding="utf-8") as f:
+            symbols.extend(line.strip() for line in f)
+    return [s for s in symbols if s]
+
+def shard_path(output, endpoint, layout, file_format, chunk_start, chunk_end, batch):
+    """Return the output file path of a shard.
+    
+    Args:
+        output (str): Output directory
+        endpoint (str): Endpoint name
+        layout (str): "hive" or "flat"
+        file_format (str): "parquet" or "csv"
+        chunk_start (str): Shard start date
+        chunk_end (str): Shard end date
+        batch (int): Symbol batch number
+        
+    Returns:
+        str: File path
+    """
+    if layout == "hive":
+        return os.path.join(output, endpoint, f"date={chunk_start}", f"part-{batch:05d}.{file_format}")
+    return os.path.join(output, f"{endpoint}-{chunk_start}-{chunk_end}-{batch:05d}.{file_format}")
+
+def build_shards(args, symbols):
+    """Split an export into (batch, symbols, chunk_start, chunk_end, path) shards.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        symbols (list): Token symbols to export (empty for all tokens)
+        
+    Returns:
+        list: Shard tuples
+    """
+    client = TokenMetricsClient(api_key=args.api_key)
+    endpoint = getattr(client, PAGINATED_ENDPOINTS[args.endpoint])
+    
+    by_symbol = bool(symbols) and args.endpoint in SYMBOL_ENDPOINTS
+    batch_size = min(args.symbol_batch, len(symbols)) if by_symbol else 1
+    chunk_days = args.chunk_days
+    start = datetime.date.fromisoformat(args.start)
+    end = datetime.date.fromisoformat(args.end)
+    if by_symbol or args.endpoint in MARKET_WIDE_ENDPOINTS:
+        # Shrink shards whose expected rows would be truncated by the page limit
+        limit = endpoint.ENDPOINT_LIMITS.get(args.endpoint, endpoint.ENDPOINT_LIMITS['default'])
+        rows_per_day = ROWS_PER_DAY.get(args.endpoint, 1)
+        if batch_size * rows_per_day * chunk_days > limit:
+            planned_batch, chunk_days, _ = optimal_batching(batch_size, max((end - start).days + 1, 1),
+                                                            rows_per_day, limit, args.chunk_days)
+            batch_size = min(batch_size, planned_batch)
+    
+    # Non-overlapping date ranges of chunk_days days each
+    date_chunks = []
+    chunk_start = start
+    while chunk_start <= end:
+        chunk_end = min(chunk_start + datetime.timedelta(days=chunk_days - 1), end)
+        date_chunks.append((chunk_start.isoformat(), chunk_end.isoformat()))
+        chunk_start = chunk_end + datetime.timedelta(days=1)
+    
+    if by_symbol:
+        batches = [",".join(symbols[i:i + batch_size]) for i in range(0, len(symbols), batch_size)]
+    else:
+        batches = [None]
+    
+    shards = []
+    for chunk_start, chunk_end in date_chunks:
+        for batch, batch_symbols in enumerate(batches):
+            path = shard_path(args.output, args.endpoint, args.layout, args.format,
+                              chunk_start, chunk_end, batch)
+            shards.append((batch, batch_symbols, chunk_start, chunk_end, path))
+    return shards
+
+def _init_worker(api_key, endpoint, rate, params, file_format):
+    # The rate limit applies to every HTTP request, not to whole shards
+    transport = RateLimitedTransport(RequestsTransport(), RateLimiter(rate))
+    client = TokenMetricsClient(api_key=api_key, transport=transport)
+    _worker["endpoint"] = getattr(client, PAGINATED_ENDPOINTS[endpoint])
+    _worker["params"] = params
+    _worker["format"] = file_format
+
+def _fetch_shard(shard):
+    batch, symbols, chunk_start, chunk_end, path = shard
+    params = dict(_worker["params"])
+    if symbols:
+        params["symbol"] = symbols
+    
+    result = _worker["endpoint"].get(startDate=chunk_start, endDate=chunk_end, columnar=True,
+                                     progress=False, return_result=True, **params)
+    if not result.complete:
+        # Never write a partial shard: it would be skipped on every resume
+        errors = "; ".join(f"{f.chunk_start}..{f.chunk_end}: {f.error}" for f in result.failed)
+        raise RuntimeError(f"{len(result.failed)} chunk(s) failed ({errors})")
+    df = result.to_dataframe()
+    
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Write to a temporary file first so interrupted runs never leave partial shards
+    tmp_path = path + ".tmp"
+    if _worker["format"] == "parquet":
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return len(df)
+
+def main(argv=None):
+    """Run the tmai-fetch command.
+    
+    Args:
+        argv (list, optional): Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Process exit code
+    """
+    args = _parse_args(argv)
+    symbols = _load_symbols(args)
+    shards = build_shards(args, symbols)
+    if not args.overwrite:
+        shards = [shard for shard in shards if not os.path.exists(shard[-1])]
+    
+    params = dict(param.split("=", 1) for param in args.param)
+    # Split the global rate limit evenly between the worker processes
+    rate = args.rate_limit / args.processes if args.rate_limit else None
+    
+    failed = 0
+    rows = 0
+    with ProcessPoolExecutor(max_workers=args.processes, initializer=_init_worker,
+                             initargs=(args.api_key, args.endpoint, rate, params, args.format)) as pool:
+        futures = {pool.submit(_fetch_shard, shard): shard for shard in shards}
+        with tqdm(total=len(futures), desc=f"Exporting {args.endpoint}", unit="shard") as pbar:
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    rows += future.result()
+                except Exception as e:
+                    failed += 1
+                    tqdm.write(f"Shard {shard[2]}..{shard[3]} batch {shard[0]} failed: {e}", file=sys.stderr)
+                pbar.update(1)
+    
+    print(f"Exported {rows} rows in {len(shards) - failed} shards to {args.output}"
+          + (f" ({failed} failed)" if failed else ""))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,5 @@
+import atexit
+import weakref
 from tmai_api.endpoints.tokens import TokensEndpoint
 from tmai_api.endpoints.hourly_ohlcv import HourlyOHLCVEndpoint
 from tmai_api.endpoints.daily_ohlcv import DailyOHLCVEndpoint
@@ -8,19 +10,66 @@ from tmai_api.endpoints.market_metrics import MarketMetricsEndpoint
 from tmai_api.endpoints.ai_agent import AIAgentEndpoint
 from tmai_api.endpoints.ai_reports import AIReportsEndpoint
 from tmai_api.endpoints.trading_signals import TradingSignalsEndpoint
+from tmai_api.transport import RequestsTransport
+from tmai_api.cache import ValidatorCache
+from tmai_api.hedging import LatencyTracker
+from tmai_api.keys import KeyPool
+from tmai_api.state import ClientState
 
 class TokenMetricsClient:
     """Main client for interacting with the Token Metrics AI API."""
     
     BASE_URL = "https://api.tokenmetrics.com/v2"
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, transport=None, validator_cache=None, base_url=None,
+                 timeout=(10, 60), max_workers=1, hedge_policy=None, state_file=None):
         """Initialize the Token Metrics client.
         
         Args:
-            api_key (str): Your Token Metrics API key
+            api_key (str, list or KeyPool): Your Token Metrics API key, or several keys
+                (a list or a KeyPool) to spread requests over by remaining quota, with a
+                cool-down for keys that get 429 responses
+            transport (Transport, optional): Transport used to send requests (RequestsTransport,
+                Urllib3Transport, HTTP2Transport, InMemoryTransport, ...). Defaults to RequestsTransport
+            validator_cache (ValidatorCache or bool, optional): Cache of ETag/Last-Modified
+                validators and response bodies used to revalidate slow-changing endpoints
+                (tokens, ai_reports). Pass True to create a default cache
+            base_url (str, optional): Override the API base URL, e.g. to point at a
+                local caching proxy started with tmai-proxy
+            timeout (tuple or float, optional): (connect, read) timeouts in seconds for every
+                request. None disables timeouts
+            max_workers (int, optional): Number of date chunks fetched concurrently
+            hedge_policy (HedgePolicy, optional): Hedge slow chunk requests with duplicates on
+                every paginated fetch. Fetches can also opt in with hedge=True
+            state_file (str, optional): JSON file holding warm-start state (token index,
+                row densities, latencies, cache validators). Loaded now and saved by save_state(),
+                when the client is used as a context manager, or at exit if the client is still alive
         """
-        self.api_key = api_key
+        if isinstance(api_key, (list, tuple)):
+            api_key = KeyPool(api_key)
+        self.key_pool = api_key if isinstance(api_key, KeyPool) else None
+        # With a key pool, api_key is the first key; requests pick their key from the pool
+        self.api_key = self.key_pool.keys[0] if self.key_pool is not None else api_key
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.hedge_policy = hedge_policy
+        # Recent chunk request latencies per endpoint, used to decide when to hedge
+        self.latency = LatencyTracker()
+        # Token symbol -> token IDs, filled when symbols are resolved for fetch planning
+        self.token_index = {}
+        # Endpoint path -> rows per token per day observed by planned fetches
+        self.row_density = {}
+        self.transport = transport or RequestsTransport()
+        if validator_cache is True:
+            validator_cache = ValidatorCache()
+        self.validator_cache = validator_cache if validator_cache is not False else None
+        self.state = None
+        if state_file is not None:
+            self.state = ClientState(state_file)
+            self.state.load(self)
+            # A weak reference, so the exit hook does not keep the client alive
+            atexit.register(_save_state_at_exit, weakref.ref(self))
         self.tokens = TokensEndpoint(self)
         self.hourly_ohlcv = HourlyOHLCVEndpoint(self)
         self.daily_ohlcv = DailyOHLCVEndpoint(self)
@@ -31,3 +80,19 @@ class TokenMetricsClient:
         self.ai_agent = AIAgentEndpoint(self)
         self.ai_reports = AIReportsEndpoint(self)
         self.trading_signals = TradingSignalsEndpoint(self)
+    
+    def save_state(self):
+        """Write the warm-start state to the client's state file, if it has one."""
+        if self.state is not None:
+            self.state.save(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.save_state()
+
+def _save_state_at_exit(client_ref):
+    client = client_ref()
+    if client is not None:
+        client.save_state()
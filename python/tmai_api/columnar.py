@@ -0,0 +1,317 @@
+from array import array
+import numpy as np
+import pandas as pd
+
+class _Column:
+    """Append-only typed buffer for a single column.
+    
+    Numbers are stored in ``array`` buffers (int64, promoted to float64 when a
+    float or null appears), strings are dictionary-encoded as int32 codes, and
+    anything else falls back to a plain list.
+    """
+    
+    def __init__(self, length=0):
+        self.kind = None
+        self.values = None
+        self.categories = None
+        self.lookup = None
+        # Nulls seen before the column type is known
+        self.pending_nulls = length
+    
+    def __len__(self):
+        return self.pending_nulls if self.kind is None else len(self.values)
+    
+    def _start(self, value):
+        if isinstance(value, bool):
+            self.kind = "object"
+            self.values = [None] * self.pending_nulls
+        elif isinstance(value, int):
+            if self.pending_nulls:
+                self.kind = "float"
+                self.values = array("d", [np.nan]) * self.pending_nulls
+            else:
+                self.kind = "int"
+                self.values = array("q")
+        elif isinstance(value, float):
+            self.kind = "float"
+            self.values = array("d", [np.nan]) * self.pending_nulls
+        elif isinstance(value, str):
+            self.kind = "str"
+            self.values = array("i", [-1]) * self.pending_nulls
+            self.categories = []
+            self.lookup = {}
+        else:
+            self.kind = "object"
+            self.values = [None] * self.pending_nulls
+        self.pending_nulls = 0
+    
+    def _to_object(self):
+        self.values = list(self.to_numpy())
+        self.kind = "object"
+        self.categories = None
+        self.lookup = None
+    
+    def append(self, value):
+        if self.kind is None:
+            if value is None:
+                self.pending_nulls += 1
+                return
+            self._start(value)
+        
+        kind = self.kind
+        if kind == "str":
+            if value is None:
+                self.values.append(-1)
+            elif isinstance(value, str):
+                code = self.lookup.get(value)
+                if code is None:
+                    code = self.lookup[value] = len(self.categories)
+                    self.categories.append(value)
+                self.values.append(code)
+            else:
+                self._to_object()
+                self.values.append(value)
+        elif kind == "int":
+            if isinstance(value, int) and not isinstance(value, bool):
+                try:
+                    self.values.append(value)
+                    return
+                except OverflowError:
+                    pass
+            if value is None or isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.kind = "float"
+                self.values = array("d", self.values)
+                self.append(value)
+            else:
+                self._to_object()
+                self.values.append(value)
+        elif kind == "float":
+            if value is None:
+                self.values.append(np.nan)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.values.append(value)
+            else:
+                self._to_object()
+                self.values.append(value)
+        else:
+            self.values.append(value)
+    
+    def extend(self, other):
+        """Append the values of another column."""
+        if other.kind is None:
+            for _ in range(other.pending_nulls):
+                self.append(None)
+            return
+        if self.kind == other.kind and self.kind in ("int", "float"):
+            self.values.extend(other.values)
+            return
+        if self.kind == other.kind == "str":
+            # Re-map the other column's codes onto this column's categories
+            mapping = []
+            for category in other.categories:
+                code = self.lookup.get(category)
+                if code is None:
+                    code = self.lookup[category] = len(self.categories)
+                    self.categories.append(category)
+                mapping.append(code)
+            # Null code -1 indexes the trailing -1
+            codes = np.asarray(mapping + [-1], dtype=np.int32)[np.frombuffer(other.values, dtype=np.int32)]
+            self.values.frombytes(codes.tobytes())
+            return
+        for value in other.to_numpy().tolist():
+            self.append(value)
+    
+    def slice(self, start, stop):
+        """Return a new column holding the values in [start, stop)."""
+        column = _Column()
+        if self.kind is None:
+            column.pending_nulls = len(range(self.pending_nulls)[start:stop])
+            return column
+        column.kind = self.kind
+        column.values = self.values[start:stop]
+        column.pending_nulls = 0
+        if self.kind == "str":
+            column.categories = list(self.categories)
+            column.lookup = dict(self.lookup)
+        return column
+    
+    def _codes(self):
+        # A copy: a view would export the buffer and make later appends raise BufferError
+        return np.frombuffer(self.values, dtype=np.int32).copy()
+    
+    def to_numpy(self):
+        if self.kind is None:
+            return np.full(self.pending_nulls, None, dtype=object)
+        if self.kind == "int":
+            return np.frombuffer(self.values, dtype=np.int64).copy()
+        if self.kind == "float":
+            return np.frombuffer(self.values, dtype=np.float64).copy()
+        if self.kind == "str":
+            codes = self._codes()
+            categories = np.array(self.categories + [None], dtype=object)
+            # Null code -1 indexes the trailing None
+            return categories[codes]
+        return np.array(self.values, dtype=object)
+    
+    def to_categorical(self):
+        codes = self._codes()
+        return pd.Categorical.from_codes(codes, categories=self.categories)
+    
+    def nbytes(self):
+        if self.kind in ("int", "float", "str"):
+            return self.values.itemsize * len(self.values)
+        return 8 * len(self)
+
+class ColumnarAccumulator:
+    """Struct-of-arrays accumulator for paginated API rows.
+    
+    Each page of row dicts is appended into per-column typed buffers as it
+    arrives, so large pulls never hold one Python dict per row. DataFrames,
+    NumPy arrays or Arrow tables are then built directly from the buffers.
+    """
+    
+    def __init__(self, fields=None):
+        """Initialize the accumulator.
+        
+        Args:
+            fields (list, optional): Only keep these keys of each row; other keys are
+                dropped as rows arrive. All keys are kept when None
+        """
+        self.fields = list(fields) if fields is not None else None
+        self.columns = {}
+        self.meta = {}
+        self.length = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def append(self, row):
+        """Append a single row dict.
+        
+        Args:
+            row (dict): Row to append; missing keys are stored as nulls
+        """
+        if not isinstance(row, dict):
+            row = {"value": row}
+        if self.fields is not None:
+            row = {key: row.get(key) for key in self.fields}
+        columns = self.columns
+        for key, value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = _Column(self.length)
+            column.append(value)
+        self.length += 1
+        # Pad columns that were absent from this row
+        if len(row) != len(columns):
+            for column in columns.values():
+                if len(column) < self.length:
+                    column.append(None)
+    
+    def extend(self, rows):
+        """Append a page of row dicts.
+        
+        Args:
+            rows (iterable): Rows to append
+        """
+        for row in rows:
+            self.append(row)
+    
+    def merge(self, other):
+        """Append the rows of another accumulator, buffer by buffer.
+        
+        Args:
+            other (ColumnarAccumulator): Accumulator whose rows are appended
+        """
+        for name in other.columns:
+            if name not in self.columns:
+                self.columns[name] = _Column(self.length)
+        for name, column in self.columns.items():
+            source = other.columns.get(name)
+            if source is None:
+                for _ in range(other.length):
+                    column.append(None)
+            else:
+                column.extend(source)
+        self.length += other.length
+    
+    def slice(self, start, stop):
+        """Return a new accumulator holding the rows in [start, stop).
+        
+        Args:
+            start (int): First row
+            stop (int): Row after the last one
+            
+        Returns:
+            ColumnarAccumulator: Accumulator with copies of the column buffers
+        """
+        part = ColumnarAccumulator(self.fields)
+        part.columns = {name: column.slice(start, stop) for name, column in self.columns.items()}
+        part.length = len(range(self.length)[start:stop])
+        return part
+    
+    def iter_rows(self):
+        """Iterate over the accumulated rows as dicts.
+        
+        Yields:
+            dict: Row with Python values; nulls of numeric columns are NaN
+        """
+        columns = {name: column.to_numpy().tolist() for name, column in self.columns.items()}
+        for position in range(self.length):
+            yield {name: values[position] for name, values in columns.items()}
+    
+    def to_numpy(self):
+        """Return the columns as NumPy arrays.
+        
+        Arrays are copies of the underlying buffers, so the accumulator can keep
+        growing after an export.
+        
+        Returns:
+            dict: Column name to numpy.ndarray
+        """
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+    
+    def to_dataframe(self, categorical=False):
+        """Build a pandas DataFrame from the column buffers.
+        
+        Args:
+            categorical (bool, optional): Return string columns as pandas Categoricals,
+                which keeps their dictionary encoding
+            
+        Returns:
+            pandas.DataFrame: DataFrame containing the accumulated rows
+        """
+        if not self.columns:
+            return pd.DataFrame()
+        data = {}
+        for name, column in self.columns.items():
+            if categorical and column.kind == "str":
+                data[name] = column.to_categorical()
+            else:
+                data[name] = column.to_numpy()
+        return pd.DataFrame(data)
+    
+    def to_arrow(self):
+        """Build a pyarrow Table from the column buffers.
+        
+        Returns:
+            pyarrow.Table: Table containing the accumulated rows
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for to_arrow(); install it with 'pip install pyarrow'")
+        
+        arrays = {}
+        for name, column in self.columns.items():
+            if column.kind == "str":
+                codes = column._codes()
+                indices = pa.array(codes, mask=codes < 0)
+                arrays[name] = pa.DictionaryArray.from_arrays(indices, pa.array(column.categories, pa.string()))
+            else:
+                arrays[name] = pa.array(column.to_numpy())
+        return pa.table(arrays)
+    
+    def nbytes(self):
+        """Approximate memory used by the column buffers in bytes."""
+        return sum(column.nbytes() for column in self.columns.values())
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+from tmai_api.frames import to_panel
+
+class CorrelationEngine:
+    """Cross-token correlation and covariance of returns computed locally from OHLCV data.
+    
+    Returns are aligned into a token x time matrix and pairwise statistics are
+    computed over the bars both tokens have (pairwise-complete), block by block
+    with matrix products, so intermediate memory is bounded by the block size
+    rather than the universe size.
+    """
+    
+    def __init__(self, returns, block_size=256, min_periods=20):
+        """Initialize the engine.
+        
+        Args:
+            returns (pandas.DataFrame): Time x token panel of returns (NaN where missing)
+            block_size (int, optional): Number of tokens per block
+            min_periods (int, optional): Minimum overlapping bars for a pair to get a value
+        """
+        self.returns = returns
+        self.tokens = returns.columns
+        self.block_size = block_size
+        self.min_periods = min_periods
+        values = returns.to_numpy(dtype=np.float64).T
+        self.mask = ~np.isnan(values)
+        # Token x time matrices with missing returns set to zero
+        self.values = np.where(self.mask, values, 0.0)
+        self.squares = self.values ** 2
+        self.counts = self.mask.astype(np.float64)
+    
+    @classmethod
+    def from_ohlcv(cls, df, value="CLOSE", log_returns=True, **kwargs):
+        """Build an engine from an OHLCV frame.
+        
+        Args:
+            df (pandas.DataFrame): Frame from DailyOHLCVEndpoint or HourlyOHLCVEndpoint
+            value (str, optional): Price column
+            log_returns (bool, optional): Use log returns instead of simple returns
+            **kwargs: Arguments to pass to CorrelationEngine
+            
+        Returns:
+            CorrelationEngine: Engine over the frame's returns
+        """
+        prices = to_panel(df, value)
+        if log_returns:
+            returns = np.log(prices).diff()
+        else:
+            returns = prices.pct_change(fill_method=None)
+        returns = returns.replace([np.inf, -np.inf], np.nan).iloc[1:]
+        return cls(returns, **kwargs)
+    
+    def _block_stats(self, rows, columns):
+        """Return pairwise (count, covariance, correlation) arrays for two token blocks."""
+        x, y = self.values[rows], self.values[columns]
+        mx, my = self.counts[rows], self.counts[columns]
+        n = mx @ my.T
+        sum_x = x @ my.T
+        sum_y = mx @ y.T
+        sum_xy = x @ y.T
+        sum_xx = self.squares[rows] @ my.T
+        sum_yy = mx @ self.squares[columns].T
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cross = n * sum_xy - sum_x * sum_y
+            cov = cross / (n * (n - 1))
+            corr = cross / np.sqrt((n * sum_xx - sum_x ** 2) * (n * sum_yy - sum_y ** 2))
+        too_few = n < max(self.min_periods, 2)
+        cov[too_few] = np.nan
+        corr[too_few] = np.nan
+        return n, cov, np.clip(corr, -1.0, 1.0)
+    
+    def _blocks(self, count):
+        return [slice(start, min(start + self.block_size, count)) for start in range(0, count, self.block_size)]
+    
+    def iter_blocks(self):
+        """Yield the correlation matrix block by block.
+        
+        Yields:
+            tuple: (row tokens, column tokens, correlation block as numpy.ndarray)
+        """
+        blocks = self._blocks(len(self.tokens))
+        for rows in blocks:
+            for columns in blocks:
+                _, _, corr = self._block_stats(rows, columns)
+                yield self.tokens[rows], self.tokens[columns], corr
+    
+    def _matrix(self, statistic):
+        count = len(self.tokens)
+        result = np.empty((count, count))
+        for rows in self._blocks(count):
+            for columns in self._blocks(count):
+                # The matrix is symmetric: compute the upper triangle of blocks only
+                if columns.start < rows.start:
+                    continue
+                block = self._block_stats(rows, columns)[statistic]
+                result[rows, columns] = block
+                result[columns, rows] = block.T
+        return pd.DataFrame(result, index=self.tokens, columns=self.tokens)
+    
+    def correlation(self):
+        """Return the token x token correlation matrix.
+        
+        Returns:
+            pandas.DataFrame: Pairwise-complete correlation of returns
+        """
+        return self._matrix(2)
+    
+    def covariance(self):
+        """Return the token x token covariance matrix.
+        
+        Returns:
+            pandas.DataFrame: Pairwise-complete covariance of returns
+        """
+        return self._matrix(1)
+    
+    def correlations_with(self, token):
+        """Return the correlation of one token with every token.
+        
+        Args:
+            token: Token ID
+            
+        Returns:
+            pandas.Series: Correlation indexed by token ID
+        """
+        row = self.tokens.get_loc(token)
+        _, _, corr = self._block_stats(slice(row, row + 1), slice(0, len(self.tokens)))
+        return pd.Series(corr[0], index=self.tokens, name=token)
+    
+    def top_k(self, k=10, token=None, absolute=False):
+        """Find the most correlated pairs without materializing the full matrix.
+        
+        Args:
+            k (int, optional): Number of partners per token
+            token (optional): Only return the partners of this token ID
+            absolute (bool, optional): Rank by absolute correlation
+            
+        Returns:
+            pandas.DataFrame: TOKEN_ID, OTHER_TOKEN_ID and CORRELATION columns, best first per token
+        """
+        count = len(self.tokens)
+        row_blocks = [slice(self.tokens.get_loc(token), self.tokens.get_loc(token) + 1)] if token is not None \
+            else self._blocks(count)
+        
+        results = []
+        for rows in row_blocks:
+            size = rows.stop - rows.start
+            best_scores = np.full((size, 0), -np.inf)
+            best_values = np.empty((size, 0))
+            best_index = np.empty((size, 0), dtype=np.int64)
+            for columns in self._blocks(count):
+                _, _, corr = self._block_stats(rows, columns)
+                # Exclude self-correlation
+                own = np.arange(rows.start, rows.stop)
+                in_block = (own >= columns.start) & (own < columns.stop)
+                corr[np.nonzero(in_block)[0], own[in_block] - columns.start] = np.nan
+                
+                scores = np.abs(corr) if absolute else corr.copy()
+                scores[np.isnan(scores)] = -np.inf
+                index = np.broadcast_to(np.arange(columns.start, columns.stop), corr.shape)
+                best_scores = np.concatenate([best_scores, scores], axis=1)
+                best_values = np.concatenate([best_values, corr], axis=1)
+                best_index = np.concatenate([best_index, index], axis=1)
+                # Keep only the k best candidates per row
+                if best_scores.shape[1] > k:
+                    keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                    best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                    best_values = np.take_along_axis(best_values, keep, axis=1)
+                    best_index = np.take_along_axis(best_index, keep, axis=1)
+            
+            order = np.argsort(-best_scores, axis=1, kind="stable")
+            for i in range(size):
+                for j in order[i]:
+                    if np.isfinite(best_scores[i, j]):
+                        results.append((self.tokens[rows.start + i], self.tokens[best_index[i, j]],
+                                        best_values[i, j]))
+        return pd.DataFrame(results, columns=["TOKEN_ID", "OTHER_TOKEN_ID", "CORRELATION"])
+    
+    def rolling(self, base, window, tokens=None):
+        """Rolling correlation of one token's returns with other tokens.
+        
+        Args:
+            base: Token ID to correlate against
+            window (int): Number of bars per window
+            tokens (list, optional): Token IDs to include. Defaults to all tokens
+            
+        Returns:
+            pandas.DataFrame: Time x token rolling correlation with the base token
+        """
+        others = self.returns if tokens is None else self.returns[list(tokens)]
+        min_periods = min(self.min_periods, window)
+        return others.rolling(window, min_periods=min_periods).corr(self.returns[base])
@@ -1,5 +1,145 @@
 from tmai_api.base import BaseEndpoint
 
+class ConversationSession:
+    """Stateful conversation with the AI chatbot that keeps request size bounded.
+    
+    The session holds the thread returned by the API in the response's ``thread``
+    field and appends new turns to it. Before every request the thread is trimmed
+    to the configured budget so payload size and latency stay flat over long sessions.
+    """
+    
+    SUMMARY_PREFIX = "Summary of earlier conversation: "
+    
+    def __init__(self, endpoint, max_messages=20, max_chars=8000, strategy="truncate",
+                 summarizer=None, summary_chars=1000, thread=None):
+        """Initialize the conversation session.
+        
+        Args:
+            endpoint (AIAgentEndpoint): Endpoint used to send the messages
+            max_messages (int, optional): Maximum number of messages sent per request
+            max_chars (int, optional): Maximum total characters of message text sent per request
+            strategy (str, optional): "truncate" drops the oldest turns, "summarize" folds
+                them into a single summary message at the start of the thread
+            summarizer (callable, optional): Function taking a list of messages and returning
+                summary text. Defaults to a local excerpt-based summary (no extra API calls)
+            summary_chars (int, optional): Maximum length of the summary message
+            thread (list, optional): Existing thread to resume
+        """
+        if strategy not in ("truncate", "summarize"):
+            raise ValueError(f"Unsupported budget strategy: {strategy}")
+        
+        self.endpoint = endpoint
+        self.max_messages = max_messages
+        self.max_chars = max_chars
+        self.strategy = strategy
+        self.summarizer = summarizer or self._default_summary
+        self.summary_chars = summary_chars
+        self.thread = list(thread) if thread else []
+    
+    @staticmethod
+    def _message_text(message):
+        return " ".join(str(value) for value in message.values())
+    
+    def _size(self, messages):
+        return sum(len(self._message_text(message)) for message in messages)
+    
+    def _default_summary(self, messages):
+        """Build a summary from the opening words of each dropped message."""
+        excerpts = []
+        for message in messages:
+            for role, text in message.items():
+                text = str(text)
+                if text.startswith(self.SUMMARY_PREFIX):
+                    text = text[len(self.SUMMARY_PREFIX):]
+                excerpts.append(f"{role}: {text[:200]}")
+        return " | ".join(excerpts)
+    
+    def _within_budget(self, messages, reserve_summary=False):
+        count = len(messages)
+        size = self._size(messages)
+        if reserve_summary:
+            # Leave room for the summary message that replaces dropped turns
+            count += 1
+            size += len(self.SUMMARY_PREFIX) + self.summary_chars
+        if self.max_messages is not None and count > self.max_messages:
+            return False
+        if self.max_chars is not None and size > self.max_chars:
+            return False
+        return True
+    
+    def _apply_budget(self, messages):
+        """Trim a list of messages to the session budget.
+        
+        The last message (the pending question) is always kept. Older messages are
+        dropped from the front, and a leading chatbot reply is never left without
+        the question that produced it.
+        
+        Args:
+            messages (list): Messages in thread order
+            
+        Returns:
+            list: Messages that fit the budget
+        """
+        messages = list(messages)
+        dropped = []
+        summarize = self.strategy == "summarize"
+        
+        while len(messages) > 1 and not self._within_budget(messages, summarize and bool(dropped)):
+            dropped.append(messages.pop(0))
+            # Drop replies whose question was dropped
+            while len(messages) > 1 and "user" not in messages[0]:
+                dropped.append(messages.pop(0))
+        
+        if dropped and summarize:
+            summary = self.summarizer(dropped)[:self.summary_chars]
+            messages.insert(0, {"user": self.SUMMARY_PREFIX + summary})
+        
+        return messages
+    
+    def send(self, text):
+        """Send a new user message in this conversation.
+        
+        Args:
+            text (str): The message text
+            
+        Returns:
+            dict: AI chatbot response
+        """
+        messages = self._apply_budget(self.thread + [{"user": text}])
+        response = self.endpoint.chat(messages)
+        
+        thread = response.get("thread") if isinstance(response, dict) else None
+        if isinstance(thread, list) and thread:
+            self.thread = thread
+        else:
+            self.thread = messages + [{"chatbot": self._answer(response)}]
+        
+        # Keep the stored thread within budget too so memory stays bounded
+        self.thread = self._apply_budget(self.thread)
+        return response
+    
+    def ask(self, text):
+        """Send a message and return just the answer text.
+        
+        Args:
+            text (str): The message text
+            
+        Returns:
+            str: The answer text from the AI chatbot
+        """
+        return self._answer(self.send(text))
+    
+    @staticmethod
+    def _answer(response):
+        """Return the answer text of a reply, which may be a bare string instead of a dict."""
+        if isinstance(response, dict):
+            return response.get("answer", "")
+        return response if isinstance(response, str) else ""
+    
+    def reset(self):
+        """Forget the conversation thread."""
+        self.thread = []
+
 class AIAgentEndpoint(BaseEndpoint):
     """Endpoint for accessing the AI Agent (chatbot) for token insights"""
     
@@ -42,3 +182,14 @@ class AIAgentEndpoint(BaseEndpoint):
         """
         response = self.ask(question)
         return response.get("answer", "")
+    
+    def session(self, **kwargs):
+        """Start a stateful conversation with a bounded request payload.
+        
+        Args:
+            **kwargs: Arguments to pass to ConversationSession (e.g. max_messages, strategy)
+            
+        Returns:
+            ConversationSession: New conversation session
+        """
+        return ConversationSession(self, **kwargs)
@@ -3,6 +3,9 @@ from tmai_api.base import BaseEndpoint
 class AIReportsEndpoint(BaseEndpoint):
     """Endpoint for accessing AI-generated trading and investment reports"""
     
+    # Large, slow-changing payloads: revalidate instead of re-downloading
+    conditional_requests = True
+    
     def get(self, token_id=None, symbol=None, limit=1000, page=0):
         """Get the latest AI-generated trading and investment reports.
         
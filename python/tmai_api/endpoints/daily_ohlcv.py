@@ -4,7 +4,7 @@ class DailyOHLCVEndpoint(BaseEndpoint):
     """Endpoint for accessing daily OHLCV (Open, High, Low, Close, Volume) data"""
     
     def get(self, token_id=None, symbol=None, token_name=None, 
-            startDate=None, endDate=None):
+            startDate=None, endDate=None, **options):
         """Get daily OHLCV data for tokens with automatic date chunking and pagination.
         
         Args:
@@ -13,6 +13,7 @@ class DailyOHLCVEndpoint(BaseEndpoint):
             token_name (str, optional): Comma-separated Token Names (e.g., "Bitcoin, Ethereum")
             startDate (str, optional): Start date in YYYY-MM-DD format
             endDate (str, optional): End date in YYYY-MM-DD format
+            **options: Fetch options passed to BaseEndpoint._paginated_request (e.g. stream=True)
             
         Returns:
             dict: Daily OHLCV data with all pages and date ranges combined
@@ -35,7 +36,7 @@ class DailyOHLCVEndpoint(BaseEndpoint):
         params = {k: v for k, v in params.items() if v is not None}
         
         # Use custom pagination logic with a 29-day maximum range
-        return self._paginated_request('get', 'daily-ohlcv', params, max_days=29)
+        return self._paginated_request('get', 'daily-ohlcv', params, max_days=29, **options)
     
     def get_dataframe(self, **kwargs):
         """Get daily OHLCV data as a pandas DataFrame.
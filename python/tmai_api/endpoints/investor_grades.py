@@ -5,7 +5,7 @@ class InvestorGradesEndpoint(BaseEndpoint):
     
     def get(self, token_id=None, startDate=None, endDate=None, symbol=None,
             category=None, exchange=None, marketcap=None, fdv=None, 
-            volume=None, investorGrade=None):
+            volume=None, investorGrade=None, **options):
         """Get the long-term investment grades with automatic date chunking and pagination.
         
         Args:
@@ -19,6 +19,7 @@ class InvestorGradesEndpoint(BaseEndpoint):
             fdv (str, optional): Minimum fully diluted valuation in $
             volume (str, optional): Minimum 24h trading volume in $
             investorGrade (str, optional): Minimum TM Investor Grade
+            **options: Fetch options passed to BaseEndpoint._paginated_request (e.g. stream=True)
             
         Returns:
             dict: Investor grades data with all pages and date ranges combined
@@ -45,7 +46,7 @@ class InvestorGradesEndpoint(BaseEndpoint):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self._paginated_request('get', 'investor-grades', params, max_days=29)
+        return self._paginated_request('get', 'investor-grades', params, max_days=29, **options)
     
     def get_dataframe(self, **kwargs):
         """Get investor grades data as a pandas DataFrame.
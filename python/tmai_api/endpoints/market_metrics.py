@@ -3,7 +3,7 @@ from tmai_api.base import BaseEndpoint
 class MarketMetricsEndpoint(BaseEndpoint):
     """Endpoint for accessing market sentiment metrics"""
     
-    def get(self, startDate=None, endDate=None):
+    def get(self, startDate=None, endDate=None, **options):
         """Get the Market Analytics from Token Metrics with automatic date chunking and pagination.
         
         These provide insight into the full Crypto Market, including the Bullish/Bearish Market indicator.
@@ -11,6 +11,7 @@ class MarketMetricsEndpoint(BaseEndpoint):
         Args:
             startDate (str, optional): Start date in YYYY-MM-DD format
             endDate (str, optional): End date in YYYY-MM-DD format
+            **options: Fetch options passed to BaseEndpoint._paginated_request (e.g. stream=True)
             
         Returns:
             dict: Market metrics data with all pages and date ranges combined
@@ -29,7 +30,7 @@ class MarketMetricsEndpoint(BaseEndpoint):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self._paginated_request('get', 'market-metrics', params, max_days=29)
+        return self._paginated_request('get', 'market-metrics', params, max_days=29, **options)
     
     def get_dataframe(self, **kwargs):
         """Get market metrics data as a pandas DataFrame.
@@ -3,6 +3,9 @@ from tmai_api.base import BaseEndpoint
 class TokensEndpoint(BaseEndpoint):
     """Endpoint for accessing token information"""
     
+    # Large, slow-changing payloads: revalidate instead of re-downloading
+    conditional_requests = True
+    
     def get(self, token_id=None, token_name=None, symbol=None, category=None, 
             exchange=None, blockchain_address=None, limit=1000, page=0):
         """Get the list of tokens supported by Token Metrics.
@@ -5,7 +5,7 @@ class TraderGradesEndpoint(BaseEndpoint):
     
     def get(self, token_id=None, startDate=None, endDate=None, symbol=None,
             category=None, exchange=None, marketcap=None, fdv=None, 
-            volume=None, traderGrade=None, traderGradePercentChange=None):
+            volume=None, traderGrade=None, traderGradePercentChange=None, **options):
         """Get the short-term trading grades with automatic date chunking and pagination.
         
         Args:
@@ -20,6 +20,7 @@ class TraderGradesEndpoint(BaseEndpoint):
             volume (str, optional): Minimum 24h trading volume in $
             traderGrade (str, optional): Minimum TM Trader Grade
             traderGradePercentChange (str, optional): Minimum 24h percent change in TM Trader Grade
+            **options: Fetch options passed to BaseEndpoint._paginated_request (e.g. stream=True)
             
         Returns:
             dict: Trader grades data with all pages and date ranges combined
@@ -47,7 +48,7 @@ class TraderGradesEndpoint(BaseEndpoint):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self._paginated_request('get', 'trader-grades', params, max_days=29)
+        return self._paginated_request('get', 'trader-grades', params, max_days=29, **options)
     
     def get_dataframe(self, **kwargs):
         """Get trader grades data as a pandas DataFrame.
@@ -3,12 +3,13 @@ from tmai_api.base import BaseEndpoint
 class TraderIndicesEndpoint(BaseEndpoint):
     """Endpoint for accessing AI-generated trading portfolios"""
     
-    def get(self, startDate=None, endDate=None):
+    def get(self, startDate=None, endDate=None, **options):
         """Get the AI-generated portfolio for Traders with automatic date chunking and pagination.
         
         Args:
             startDate (str, optional): Start date in YYYY-MM-DD format
             endDate (str, optional): End date in YYYY-MM-DD format
+            **options: Fetch options passed to BaseEndpoint._paginated_request (e.g. stream=True)
             
         Returns:
             dict: Trader indices data with all pages and date ranges combined
@@ -27,7 +28,7 @@ class TraderIndicesEndpoint(BaseEndpoint):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self._paginated_request('get', 'trader-indices', params, max_days=29)
+        return self._paginated_request('get', 'trader-indices', params, max_days=29, **options)
     
     def get_dataframe(self, **kwargs):
         """Get trader indices data as a pandas DataFrame.
@@ -5,7 +5,7 @@ class TradingSignalsEndpoint(BaseEndpoint):
     
     def get(self, token_id=None, symbol=None, startDate=None, endDate=None, 
             category=None, exchange=None, marketcap=None, volume=None, 
-            fdv=None, signal=None):
+            fdv=None, signal=None, **options):
         """Get AI-generated trading signals with automatic date chunking and pagination.
         
         Args:
@@ -19,6 +19,7 @@ class TradingSignalsEndpoint(BaseEndpoint):
             volume (str, optional): Minimum 24h trading volume in $
             fdv (str, optional): Minimum fully diluted valuation in $
             signal (str, optional): Signal value: bullish (1), bearish (-1) or no signal (0)
+            **options: Fetch options passed to BaseEndpoint._paginated_request (e.g. stream=True)
             
         Returns:
             dict: Trading signals data with all pages and date ranges combined
@@ -45,7 +46,7 @@ class TradingSignalsEndpoint(BaseEndpoint):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self._paginated_request('get', 'trading-signals', params, max_days=29)
+        return self._paginated_request('get', 'trading-signals', params, max_days=29, **options)
     
     def get_dataframe(self, **kwargs):
         """Get trading signals data as a pandas DataFrame.
@@ -0,0 +1,14 @@
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call runs past its deadline.
+    
+    Attributes:
+        result (FetchResult): Data from the chunks that completed before the deadline,
+            or None if the deadline expired before a single request
+    """
+    
+    def __init__(self, message, result=None):
+        super().__init__(message)
+        self.result = result
+
+class QuotaExhausted(RuntimeError):
+    """Raised when every API key of a KeyPool has used up its request quota."""
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+# Candidate time columns of endpoint frames, in order of preference
+TIME_COLUMNS = ("TIMESTAMP", "DATE")
+TOKEN_COLUMN = "TOKEN_ID"
+
+def time_column(df):
+    """Return the name of a frame's time column.
+    
+    Args:
+        df (pandas.DataFrame): Frame returned by an endpoint (e.g. hourly_ohlcv)
+        
+    Returns:
+        str: "TIMESTAMP" for hourly frames, "DATE" for daily frames
+    """
+    for column in TIME_COLUMNS:
+        if column in df.columns:
+            return column
+    raise KeyError(f"Frame has none of the time columns {TIME_COLUMNS}")
+
+def parse_times(values):
+    """Parse API timestamps (e.g. "2024-01-01T00:00:00.000Z") as UTC datetimes.
+    
+    Args:
+        values (pandas.Series or array-like): Timestamps
+        
+    Returns:
+        pandas.Series or pandas.DatetimeIndex: Parsed UTC timestamps
+    """
+    return pd.to_datetime(values, utc=True)
+
+def to_panel(df, value, time_col=None, token_col=TOKEN_COLUMN):
+    """Pivot a long endpoint frame into a time x token panel of one value column.
+    
+    Duplicate (token, time) rows keep the last occurrence.
+    
+    Args:
+        df (pandas.DataFrame): Long frame with token, time and value columns
+        value (str): Column to pivot (e.g. "CLOSE")
+        time_col (str, optional): Time column. Detected when None
+        token_col (str, optional): Token column
+        
+    Returns:
+        pandas.DataFrame: Panel indexed by UTC time with one column per token
+    """
+    time_col = time_col or time_column(df)
+    frame = pd.DataFrame({
+        "time": parse_times(df[time_col]),
+        "token": df[token_col].to_numpy(),
+        "value": pd.to_numeric(df[value], errors="coerce").to_numpy(),
+    })
+    frame = frame.drop_duplicates(["time", "token"], keep="last")
+    return frame.pivot(index="time", columns="token", values="value").sort_index()
+
+def panels_to_long(panels, time_col, token_col=TOKEN_COLUMN, mask=None):
+    """Flatten aligned time x token panels back into a long frame.
+    
+    Args:
+        panels (dict): Column name to panel; all panels share index and columns
+        time_col (str): Name of the time column in the result
+        token_col (str, optional): Name of the token column in the result
+        mask (pandas.DataFrame, optional): Boolean panel selecting the rows to keep
+        
+    Returns:
+        pandas.DataFrame: One row per (time, token) with one column per panel
+    """
+    first = next(iter(panels.values()))
+    rows, columns = first.shape
+    data = {
+        token_col: np.tile(first.columns.to_numpy(), rows),
+        time_col: first.index.repeat(columns),
+    }
+    for name, panel in panels.items():
+        data[name] = panel.to_numpy().ravel()
+    frame = pd.DataFrame(data)
+    if mask is not None:
+        frame = frame[mask.to_numpy().ravel()].reset_index(drop=True)
+    return frame
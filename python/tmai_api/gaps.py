@@ -0,0 +1,189 @@
+import datetime
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from tmai_api.base import BaseEndpoint
+from tmai_api.frames import TOKEN_COLUMN, parse_times, time_column
+from tmai_api.planner import optimal_batching
+
+# Expected bar spacing of each time column
+FREQUENCIES = {"TIMESTAMP": "h", "DATE": "D"}
+
+# Bars per token per day and page limit of the endpoint serving each bar spacing
+ROWS_PER_DAY = {"h": 24, "D": 1}
+REPAIR_LIMITS = {"h": BaseEndpoint.ENDPOINT_LIMITS['hourly-ohlcv'], "D": BaseEndpoint.ENDPOINT_LIMITS['daily-ohlcv']}
+
+class GapReport:
+    """Missing and duplicated bars of a per-token time series frame."""
+    
+    def __init__(self, gaps, duplicates, time_col, freq):
+        """Initialize the report.
+        
+        Args:
+            gaps (pandas.DataFrame): TOKEN_ID, GAP_START, GAP_END and BARS columns, one row
+                per run of consecutive missing bars
+            duplicates (pandas.DataFrame): Rows sharing a (token, time) with another row
+            time_col (str): Time column of the checked frame
+            freq (str): Expected bar spacing
+        """
+        self.gaps = gaps
+        self.duplicates = duplicates
+        self.time_col = time_col
+        self.freq = freq
+    
+    @property
+    def complete(self):
+        """bool: Whether no bar is missing or duplicated."""
+        return self.gaps.empty and self.duplicates.empty
+    
+    @property
+    def missing_bars(self):
+        """int: Total number of missing bars."""
+        return int(self.gaps["BARS"].sum())
+    
+    def repair_requests(self, limit=None, max_days=29):
+        """Group the gaps into date-range requests that fit the page limit.
+        
+        The API takes whole days, so each gap is widened to the days it touches.
+        Tokens missing the same days share requests, split into token batches and
+        date chunks by optimal_batching so no request exceeds the page limit.
+        
+        Args:
+            limit (int, optional): Page limit of a single request. Defaults to the limit
+                of the OHLCV endpoint with the report's bar spacing
+            max_days (int, optional): Maximum number of days in a single request
+        
+        Returns:
+            list: (token_ids, start_date, end_date) tuples with comma-separated token IDs
+        """
+        if self.gaps.empty:
+            return []
+        limit = limit or REPAIR_LIMITS.get(self.freq, BaseEndpoint.ENDPOINT_LIMITS['default'])
+        rows_per_day = ROWS_PER_DAY.get(self.freq, 1)
+        
+        # Merge each token's gap days into runs of consecutive days
+        runs = {}
+        gaps = pd.DataFrame({
+            "token": self.gaps[TOKEN_COLUMN].astype(str),
+            "start": self.gaps["GAP_START"].dt.date,
+            "end": self.gaps["GAP_END"].dt.date,
+        }).sort_values(["token", "start"], kind="stable")
+        for token, group in gaps.groupby("token", sort=False):
+            token_runs = []
+            for start, end in zip(group["start"], group["end"]):
+                if token_runs and start <= token_runs[-1][1] + datetime.timedelta(days=1):
+                    token_runs[-1][1] = max(token_runs[-1][1], end)
+                else:
+                    token_runs.append([start, end])
+            for start, end in token_runs:
+                runs.setdefault((start, end), []).append(token)
+        
+        requests = []
+        for (start, end), tokens in sorted(runs.items()):
+            days = (end - start).days + 1
+            batch_size, chunk_days, _ = optimal_batching(len(tokens), days, rows_per_day, limit, max_days)
+            chunk_start = start
+            while chunk_start <= end:
+                chunk_end = min(chunk_start + datetime.timedelta(days=chunk_days - 1), end)
+                for i in range(0, len(tokens), batch_size):
+                    requests.append((",".join(tokens[i:i + batch_size]), chunk_start.isoformat(),
+                                     chunk_end.isoformat()))
+                chunk_start = chunk_end + datetime.timedelta(days=1)
+        return requests
+    
+    def __repr__(self):
+        return (f"<GapReport {len(self.gaps)} gaps ({self.missing_bars} bars), "
+                f"{len(self.duplicates)} duplicate rows>")
+
+def find_gaps(df, start=None, end=None, tokens=None, freq=None, time_col=None, token_col=TOKEN_COLUMN):
+    """Find missing and duplicated bars in an OHLCV or grade frame.
+    
+    Every token is checked against the same expected grid from start to end, so
+    tokens missing at the edges of the range (e.g. after a failed chunk) are
+    reported too.
+    
+    Args:
+        df (pandas.DataFrame): Frame from an hourly/daily OHLCV or grade endpoint
+        start (str or datetime, optional): First expected bar. Defaults to the earliest bar
+        end (str or datetime, optional): Last expected bar. Defaults to the latest bar
+        tokens (list, optional): Token IDs expected in the frame. Defaults to the tokens present
+        freq (str, optional): Expected bar spacing. Detected from the time column when None
+        time_col (str, optional): Time column. Detected when None
+        token_col (str, optional): Token column
+        
+    Returns:
+        GapReport: Gaps per token and duplicated rows
+    """
+    time_col = time_col or time_column(df)
+    freq = freq or FREQUENCIES[time_col]
+    times = parse_times(df[time_col]).dt.floor(freq)
+    keys = pd.DataFrame({"token": df[token_col].to_numpy(), "time": times.to_numpy()})
+    duplicates = df[keys.duplicated(keep=False).to_numpy()]
+    
+    first = parse_times(start).floor(freq) if start is not None else times.min()
+    last = parse_times(end).floor(freq) if end is not None else times.max()
+    # Date-only end bounds cover the whole last day
+    if end is not None and freq != "D" and parse_times(end) == parse_times(end).normalize():
+        last = parse_times(end).normalize() + pd.Timedelta(days=1) - to_offset(freq)
+    grid = pd.date_range(first, last, freq=freq)
+    token_ids = pd.Index(tokens if tokens is not None else pd.unique(keys["token"]))
+    
+    # Presence matrix: tokens x grid positions
+    present = np.zeros((len(token_ids), len(grid)), dtype=bool)
+    rows = token_ids.get_indexer(keys["token"])
+    columns = grid.get_indexer(keys["time"])
+    inside = (rows >= 0) & (columns >= 0)
+    present[rows[inside], columns[inside]] = True
+    
+    # Runs of missing bars: +1 where a run starts, -1 one past where it ends
+    missing = np.pad(~present, ((0, 0), (1, 1))).astype(np.int8)
+    edges = np.diff(missing, axis=1)
+    run_tokens, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    gaps = pd.DataFrame({
+        token_col: token_ids[run_tokens],
+        "GAP_START": grid[run_starts],
+        "GAP_END": grid[run_ends - 1],
+        "BARS": run_ends - run_starts,
+    })
+    return GapReport(gaps, duplicates, time_col, freq)
+
+def repair_gaps(endpoint, df, start=None, end=None, tokens=None, limit=None, **options):
+    """Refetch only the missing bars of a frame and merge them back in.
+    
+    Duplicated (token, time) rows are collapsed to their last occurrence.
+    
+    Args:
+        endpoint (BaseEndpoint): Endpoint the frame came from (e.g. client.hourly_ohlcv)
+        df (pandas.DataFrame): Frame to repair
+        start (str or datetime, optional): First expected bar
+        end (str or datetime, optional): Last expected bar
+        tokens (list, optional): Token IDs expected in the frame
+        limit (int, optional): Page limit the repair requests must fit. Defaults to the
+            limit of the OHLCV endpoint with the frame's bar spacing
+        **options: Fetch options passed to the endpoint's get method
+        
+    Returns:
+        tuple: (repaired DataFrame, GapReport of the repaired frame)
+    """
+    report = find_gaps(df, start=start, end=end, tokens=tokens)
+    options.setdefault("progress", False)
+    frames = [df]
+    for token_ids, request_start, request_end in report.repair_requests(limit=limit):
+        data = endpoint.get(token_id=token_ids, startDate=request_start, endDate=request_end, **options)
+        frames.append(endpoint.to_dataframe(data))
+    
+    repaired = pd.concat([frame for frame in frames if not frame.empty], ignore_index=True)
+    if repaired.empty:
+        return repaired, report
+    time_col = report.time_col
+    # Normalize token IDs fetched as strings to the type of the original frame
+    if not df.empty:
+        repaired[TOKEN_COLUMN] = repaired[TOKEN_COLUMN].astype(df[TOKEN_COLUMN].dtype)
+    order = parse_times(repaired[time_col])
+    repaired = (repaired.assign(_time=order)
+                .drop_duplicates([TOKEN_COLUMN, "_time"], keep="last")
+                .sort_values([TOKEN_COLUMN, "_time"], kind="stable")
+                .drop(columns="_time")
+                .reset_index(drop=True))
+    return repaired, find_gaps(repaired, start=start, end=end, tokens=tokens)
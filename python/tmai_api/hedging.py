@@ -0,0 +1,125 @@
+import threading
+from collections import defaultdict, deque
+import numpy as np
+
+class LatencyTracker:
+    """Sliding window of recent request latencies per endpoint."""
+    
+    def __init__(self, window=200):
+        """Initialize the tracker.
+        
+        Args:
+            window (int, optional): Number of recent latencies kept per endpoint
+        """
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+    
+    def record(self, endpoint, seconds):
+        """Record the latency of a successful request.
+        
+        Args:
+            endpoint (str): API endpoint path
+            seconds (float): Request duration
+        """
+        with self._lock:
+            self._samples[endpoint].append(seconds)
+    
+    def to_dict(self):
+        """Return the recorded latencies per endpoint.
+        
+        Returns:
+            dict: Endpoint path to a list of latencies in seconds, oldest first
+        """
+        with self._lock:
+            return {endpoint: list(samples) for endpoint, samples in self._samples.items()}
+    
+    def update(self, latencies):
+        """Add previously recorded latencies, e.g. from a saved state file.
+        
+        Args:
+            latencies (dict): Endpoint path to a list of latencies in seconds
+        """
+        with self._lock:
+            for endpoint, samples in latencies.items():
+                self._samples[endpoint].extend(float(seconds) for seconds in samples)
+    
+    def count(self, endpoint):
+        """Return the number of latencies recorded for an endpoint."""
+        with self._lock:
+            return len(self._samples.get(endpoint, ()))
+    
+    def percentile(self, endpoint, q):
+        """Return a latency percentile of an endpoint.
+        
+        Args:
+            endpoint (str): API endpoint path
+            q (float): Percentile between 0 and 100
+            
+        Returns:
+            float: Latency in seconds, or None when nothing was recorded
+        """
+        with self._lock:
+            samples = list(self._samples.get(endpoint, ()))
+        if not samples:
+            return None
+        return float(np.percentile(samples, q))
+
+class HedgePolicy:
+    """When to send a duplicate of a slow chunk request, and how many duplicates to allow.
+    
+    A request is hedged once it has run longer than the given latency percentile
+    of its endpoint. Duplicates are capped at a fraction of the primary requests
+    sent under the policy, so hedging adds a bounded amount of extra load.
+    """
+    
+    def __init__(self, percentile=95, max_extra=0.1, min_samples=10, min_delay=0.05, initial_delay=None):
+        """Initialize the policy.
+        
+        Args:
+            percentile (float, optional): Latency percentile after which a request is hedged
+            max_extra (float, optional): Maximum duplicates as a fraction of primary requests
+            min_samples (int, optional): Latencies needed before the percentile is trusted
+            min_delay (float, optional): Lower bound of the hedge delay in seconds
+            initial_delay (float, optional): Hedge delay used until min_samples latencies
+                are recorded. No hedging happens before then when None
+        """
+        self.percentile = percentile
+        self.max_extra = max_extra
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+    
+    def delay(self, tracker, endpoint):
+        """Return how long a request may run before it is hedged.
+        
+        Args:
+            tracker (LatencyTracker): Recorded latencies
+            endpoint (str): API endpoint path
+            
+        Returns:
+            float: Delay in seconds, or None when requests should not be hedged yet
+        """
+        if tracker.count(endpoint) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, tracker.percentile(endpoint, self.percentile))
+    
+    def record_request(self):
+        """Count a primary request towards the hedge budget."""
+        with self._lock:
+            self.requests += 1
+    
+    def try_hedge(self):
+        """Take one duplicate from the budget.
+        
+        Returns:
+            bool: Whether a duplicate may be sent
+        """
+        with self._lock:
+            if self.hedges + 1 > self.max_extra * self.requests:
+                return False
+            self.hedges += 1
+            return True
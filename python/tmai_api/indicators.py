@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+from tmai_api.frames import panels_to_long, time_column, to_panel
+
+INDICATOR_COLUMNS = ("SMA", "EMA", "RSI", "ATR", "REALIZED_VOL")
+
+def _ewm_step(state, values, alpha):
+    """Advance an exponential average by one bar, skipping missing values."""
+    updated = np.where(np.isnan(state), values, state + alpha * (values - state))
+    return np.where(np.isnan(values), state, updated)
+
+class IndicatorEngine:
+    """Rolling technical indicators over OHLCV panels with incremental updates.
+    
+    fit() computes SMA, EMA, RSI, ATR and realized volatility for every token at
+    once on time x token panels. The engine then keeps only the state needed to
+    continue: a short tail of bars for the windowed indicators and the last value
+    of each exponential average. update() extends the indicators with new bars in
+    time proportional to the number of new bars, not the history length.
+    """
+    
+    def __init__(self, sma_window=20, ema_span=20, rsi_period=14, atr_period=14, vol_window=24,
+                 annualization=None):
+        """Initialize the engine.
+        
+        Args:
+            sma_window (int, optional): Window of the simple moving average
+            ema_span (int, optional): Span of the exponential moving average
+            rsi_period (int, optional): Period of Wilder's RSI
+            atr_period (int, optional): Period of Wilder's average true range
+            vol_window (int, optional): Window of the realized volatility of log returns
+            annualization (float, optional): Bars per year used to annualize realized
+                volatility (e.g. 24 * 365 for hourly bars). Not annualized when None
+        """
+        self.sma_window = sma_window
+        self.ema_alpha = 2.0 / (ema_span + 1)
+        self.rsi_alpha = 1.0 / rsi_period
+        self.atr_alpha = 1.0 / atr_period
+        self.vol_window = vol_window
+        self.vol_scale = np.sqrt(annualization) if annualization else 1.0
+        self.time_col = None
+        self.tokens = None
+        self.tail = None
+        self.state = None
+    
+    def _panels(self, df):
+        self.time_col = self.time_col or time_column(df)
+        return {column: to_panel(df, column, self.time_col) for column in ("HIGH", "LOW", "CLOSE")}
+    
+    def _windowed(self, close, high, low, prev_close):
+        """Compute the indicators that only depend on a window of bars."""
+        sma = close.rolling(self.sma_window, min_periods=self.sma_window).mean()
+        log_returns = np.log(close).diff()
+        vol = log_returns.rolling(self.vol_window, min_periods=self.vol_window).std() * self.vol_scale
+        true_range = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+        # The true range is undefined where the bar itself is missing
+        true_range = true_range.where(high.notna() & low.notna())
+        return sma, vol, true_range
+    
+    def _to_long(self, indicators, close):
+        # Only report bars that exist in the input
+        return panels_to_long({name: indicators[name] for name in INDICATOR_COLUMNS},
+                              self.time_col, mask=close.notna())
+    
+    def fit(self, df):
+        """Compute the indicators over a full OHLCV history and keep the update state.
+        
+        Args:
+            df (pandas.DataFrame): OHLCV frame from HourlyOHLCVEndpoint or DailyOHLCVEndpoint
+            
+        Returns:
+            pandas.DataFrame: TOKEN_ID, time and indicator columns for every bar
+        """
+        panels = self._panels(df)
+        close, high, low = panels["CLOSE"], panels["HIGH"], panels["LOW"]
+        prev_close = close.shift(1)
+        sma, vol, true_range = self._windowed(close, high, low, prev_close)
+        
+        change = close - prev_close
+        gain = change.clip(lower=0)
+        loss = (-change).clip(lower=0)
+        ewm = dict(adjust=False, ignore_na=True)
+        ema = close.ewm(alpha=self.ema_alpha, **ewm).mean()
+        avg_gain = gain.ewm(alpha=self.rsi_alpha, **ewm).mean()
+        avg_loss = loss.ewm(alpha=self.rsi_alpha, **ewm).mean()
+        atr = true_range.ewm(alpha=self.atr_alpha, **ewm).mean()
+        
+        self.tokens = close.columns
+        tail_length = max(self.sma_window, self.vol_window + 1)
+        self.tail = {name: panel.iloc[-tail_length:] for name, panel in panels.items()}
+        self.state = {
+            "EMA": ema.iloc[-1].to_numpy(),
+            "AVG_GAIN": avg_gain.iloc[-1].to_numpy(),
+            "AVG_LOSS": avg_loss.iloc[-1].to_numpy(),
+            "ATR": atr.iloc[-1].to_numpy(),
+        }
+        
+        return self._to_long({
+            "SMA": sma, "EMA": ema, "RSI": self._rsi(avg_gain, avg_loss),
+            "ATR": atr, "REALIZED_VOL": vol,
+        }, close)
+    
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        # No losses in the window means maximum strength
+        return rsi.where(~((avg_loss == 0) & (avg_gain > 0)), 100.0)
+    
+    def _align_state(self, tokens):
+        """Extend the update state with columns for newly seen tokens."""
+        if tokens.equals(self.tokens):
+            return
+        positions = self.tokens.get_indexer(tokens)
+        for name, values in self.state.items():
+            aligned = np.full(len(tokens), np.nan)
+            known = positions >= 0
+            aligned[known] = values[positions[known]]
+            self.state[name] = aligned
+        self.tail = {name: panel.reindex(columns=tokens) for name, panel in self.tail.items()}
+        self.tokens = tokens
+    
+    def update(self, df):
+        """Extend the indicators with newly appended bars.
+        
+        Bars at or before the last fitted time are ignored.
+        
+        Args:
+            df (pandas.DataFrame): OHLCV frame containing the new bars
+            
+        Returns:
+            pandas.DataFrame: TOKEN_ID, time and indicator columns for the new bars
+        """
+        if self.state is None:
+            return self.fit(df)
+        
+        panels = self._panels(df)
+        last_time = self.tail["CLOSE"].index[-1]
+        panels = {name: panel[panel.index > last_time] for name, panel in panels.items()}
+        if panels["CLOSE"].empty:
+            return self._to_long({name: panels["CLOSE"] for name in INDICATOR_COLUMNS}, panels["CLOSE"])
+        
+        self._align_state(self.tokens.union(panels["CLOSE"].columns, sort=False))
+        combined = {name: pd.concat([self.tail[name], panel.reindex(columns=self.tokens)])
+                    for name, panel in panels.items()}
+        close, high, low = combined["CLOSE"], combined["HIGH"], combined["LOW"]
+        prev_close = close.shift(1)
+        sma, vol, true_range = self._windowed(close, high, low, prev_close)
+        
+        new = len(panels["CLOSE"])
+        change = (close - prev_close).to_numpy()[-new:]
+        ranges = true_range.to_numpy()[-new:]
+        closes = close.to_numpy()[-new:]
+        
+        ema_rows, gain_rows, loss_rows, atr_rows = [], [], [], []
+        state = self.state
+        for i in range(new):
+            state["EMA"] = _ewm_step(state["EMA"], closes[i], self.ema_alpha)
+            gain = np.where(np.isnan(change[i]), np.nan, np.clip(change[i], 0, None))
+            loss = np.where(np.isnan(change[i]), np.nan, np.clip(-change[i], 0, None))
+            state["AVG_GAIN"] = _ewm_step(state["AVG_GAIN"], gain, self.rsi_alpha)
+            state["AVG_LOSS"] = _ewm_step(state["AVG_LOSS"], loss, self.rsi_alpha)
+            state["ATR"] = _ewm_step(state["ATR"], ranges[i], self.atr_alpha)
+            ema_rows.append(state["EMA"])
+            gain_rows.append(state["AVG_GAIN"])
+            loss_rows.append(state["AVG_LOSS"])
+            atr_rows.append(state["ATR"])
+        
+        tail_length = max(self.sma_window, self.vol_window + 1)
+        self.tail = {name: panel.iloc[-tail_length:] for name, panel in combined.items()}
+        
+        index = close.index[-new:]
+        def as_frame(rows):
+            return pd.DataFrame(np.vstack(rows), index=index, columns=self.tokens)
+        
+        indicators = {
+            "SMA": sma.iloc[-new:],
+            "EMA": as_frame(ema_rows),
+            "RSI": self._rsi(as_frame(gain_rows), as_frame(loss_rows)),
+            "ATR": as_frame(atr_rows),
+            "REALIZED_VOL": vol.iloc[-new:],
+        }
+        return self._to_long(indicators, close.iloc[-new:])
@@ -0,0 +1,146 @@
+import threading
+import time
+from tmai_api.exceptions import DeadlineExceeded, QuotaExhausted
+
+class _KeyState:
+    """Scheduling state of one API key."""
+    
+    def __init__(self, key, rate, burst, quota):
+        self.key = key
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.remaining = quota
+        self.cooldown_until = 0.0
+        self.throttled = 0
+        self.in_flight = 0
+        self.requests = 0
+    
+    def refill(self, now):
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def ready_in(self, now):
+        """Seconds until the key may send a request, or None if its quota is used up."""
+        if self.remaining is not None and self.remaining <= 0:
+            return None
+        wait = max(0.0, self.cooldown_until - now)
+        if self.rate and self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+        return wait
+
+class KeyPool:
+    """Schedules requests across several API keys.
+    
+    Each request takes the available key with the most remaining quota and the
+    fewest requests in flight. Keys are rate limited individually with a token
+    bucket, and a key that receives a 429 response cools down (for Retry-After
+    seconds when the server sends it) while the other keys carry the load, so
+    concurrent chunk fetches use the combined throughput of all keys.
+    """
+    
+    def __init__(self, keys, rate=None, burst=1, quota=None, cooldown=60.0):
+        """Initialize the pool.
+        
+        Args:
+            keys (list): API keys
+            rate (float or dict, optional): Sustained requests per second per key, or a dict
+                of key to rate. Unlimited when None
+            burst (int, optional): Requests a key may send back to back
+            quota (int or dict, optional): Remaining requests per key (e.g. the plan's credits),
+                or a dict of key to quota. Unlimited when None
+            cooldown (float, optional): Seconds a throttled key rests when the 429 response
+                has no Retry-After header; doubled for consecutive 429s
+        """
+        keys = list(keys)
+        if not keys:
+            raise ValueError("KeyPool needs at least one API key")
+        rates = rate if isinstance(rate, dict) else dict.fromkeys(keys, rate)
+        quotas = quota if isinstance(quota, dict) else dict.fromkeys(keys, quota)
+        self.keys = keys
+        self.cooldown = cooldown
+        self.states = {key: _KeyState(key, rates.get(key), burst, quotas.get(key)) for key in keys}
+        self.lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def acquire(self, deadline_at=None):
+        """Block until a key may send a request and reserve it.
+        
+        Args:
+            deadline_at (float, optional): time.monotonic() value after which to stop waiting
+            
+        Returns:
+            str: API key to use; pass it to release() when the request finished
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                waits = {}
+                for state in self.states.values():
+                    state.refill(now)
+                    wait = state.ready_in(now)
+                    if wait is not None:
+                        waits[state.key] = wait
+                if not waits:
+                    raise QuotaExhausted("Every API key in the pool has used up its quota")
+                ready = [self.states[key] for key, wait in waits.items() if wait == 0]
+                if ready:
+                    unlimited = float("inf")
+                    state = max(ready, key=lambda s: (unlimited if s.remaining is None else s.remaining,
+                                                      -s.in_flight, s.tokens))
+                    if state.rate:
+                        state.tokens -= 1
+                    if state.remaining is not None:
+                        state.remaining -= 1
+                    state.in_flight += 1
+                    state.requests += 1
+                    return state.key
+                wait = min(waits.values())
+            if deadline_at is not None and time.monotonic() + wait > deadline_at:
+                raise DeadlineExceeded("No API key becomes available before the deadline")
+            time.sleep(wait)
+    
+    def release(self, key, status_code=None, headers=None):
+        """Report the outcome of a request sent with a key.
+        
+        Args:
+            key (str): Key returned by acquire()
+            status_code (int, optional): Response status, None if the request failed
+            headers (dict, optional): Response headers (Retry-After, X-RateLimit-Remaining)
+        """
+        headers = headers or {}
+        with self.lock:
+            state = self.states[key]
+            state.in_flight -= 1
+            if status_code == 429:
+                state.throttled += 1
+                try:
+                    pause = float(headers.get("Retry-After"))
+                except (TypeError, ValueError):
+                    pause = self.cooldown * 2 ** (state.throttled - 1)
+                state.cooldown_until = time.monotonic() + pause
+            elif status_code is not None:
+                state.throttled = 0
+            remaining = headers.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                try:
+                    state.remaining = int(remaining)
+                except (TypeError, ValueError):
+                    pass
+    
+    def stats(self):
+        """Return per-key counters.
+        
+        Returns:
+            dict: Key to requests sent, remaining quota, 429 streak and seconds of cooldown left
+        """
+        now = time.monotonic()
+        with self.lock:
+            return {state.key: {"requests": state.requests, "remaining": state.remaining,
+                                "throttled": state.throttled,
+                                "cooldown": max(0.0, state.cooldown_until - now)}
+                    for state in self.states.values()}
@@ -0,0 +1,106 @@
+import datetime
+import pandas as pd
+from tmai_api.frames import parse_times, time_column
+
+class MarketRegime:
+    """Market-wide metrics broadcast onto per-token frames with an as-of join.
+    
+    The market metrics series is fetched once and cached; later joins only fetch
+    the days outside the cached range. The cached range only covers days that
+    actually came back, and never today, whose values may still change. Each row
+    of a daily or hourly frame gets the latest market metrics at or before its
+    time, so every hour of a day sees that day's daily value.
+    """
+    
+    def __init__(self, client=None, metrics=None, columns=None):
+        """Initialize the regime series.
+        
+        Args:
+            client (TokenMetricsClient, optional): Client used to fetch market metrics
+            metrics (pandas.DataFrame, optional): Market metrics frame to use instead of fetching
+            columns (list, optional): Metric columns to join. Defaults to every metric column
+        """
+        self.client = client
+        self.columns = list(columns) if columns is not None else None
+        self.metrics = None
+        self.start = None
+        self.end = None
+        if metrics is not None:
+            self._add(metrics)
+    
+    def _add(self, frame):
+        """Merge fetched rows into the cached series."""
+        if frame is None or frame.empty:
+            return
+        time_col = time_column(frame)
+        frame = frame.assign(_time=parse_times(frame[time_col])).drop(columns=time_col)
+        frames = [frame] if self.metrics is None else [self.metrics, frame]
+        self.metrics = (pd.concat(frames, ignore_index=True)
+                        .drop_duplicates("_time", keep="last")
+                        .sort_values("_time")
+                        .reset_index(drop=True))
+        first = self.metrics["_time"].iloc[0].date()
+        # Today's values are not final, so today is fetched again by later loads
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        last = min(self.metrics["_time"].iloc[-1].date(), today - datetime.timedelta(days=1))
+        self.start = first if self.start is None else min(self.start, first)
+        self.end = last if self.end is None else max(self.end, last)
+    
+    def load(self, startDate, endDate):
+        """Make sure the cached series covers a date range, fetching only missing days.
+        
+        Args:
+            startDate (str or date): Start date in YYYY-MM-DD format
+            endDate (str or date): End date in YYYY-MM-DD format
+            
+        Returns:
+            pandas.DataFrame: Cached market metrics with a parsed _time column
+        """
+        start = pd.Timestamp(startDate).date()
+        end = pd.Timestamp(endDate).date()
+        if self.start is None:
+            missing = [(start, end)]
+        else:
+            missing = []
+            if start < self.start:
+                missing.append((start, self.start - datetime.timedelta(days=1)))
+            if end > self.end:
+                missing.append((self.end + datetime.timedelta(days=1), end))
+        
+        for fetch_start, fetch_end in missing:
+            if self.client is None:
+                raise ValueError("A client is required to fetch market metrics")
+            frame = self.client.market_metrics.get_dataframe(startDate=fetch_start.isoformat(),
+                                                             endDate=fetch_end.isoformat(), progress=False)
+            self._add(frame)
+        return self.metrics
+    
+    def join(self, df, tolerance=None, suffix="_MARKET"):
+        """Attach the latest market metrics at or before each row's time.
+        
+        Args:
+            df (pandas.DataFrame): Frame from any endpoint with a DATE or TIMESTAMP column
+            tolerance (str or timedelta, optional): Leave metrics missing when the latest
+                value is older than this
+            suffix (str, optional): Suffix for metric columns that clash with df's columns
+            
+        Returns:
+            pandas.DataFrame: df with the metric columns added, rows in the original order
+        """
+        times = parse_times(df[time_column(df)])
+        if self.client is not None and len(df):
+            self.load(times.min().date(), times.max().date())
+        if self.metrics is None:
+            raise ValueError("No market metrics loaded")
+        
+        columns = self.columns or [c for c in self.metrics.columns if c != "_time"]
+        left = pd.DataFrame({"_time": times.to_numpy(), "_row": range(len(df))}).sort_values("_time", kind="stable")
+        right = self.metrics[["_time"] + columns]
+        if tolerance is not None:
+            tolerance = pd.Timedelta(tolerance)
+        joined = pd.merge_asof(left, right.astype({"_time": left["_time"].dtype}), on="_time",
+                               direction="backward", tolerance=tolerance)
+        joined = joined.sort_values("_row").drop(columns=["_time", "_row"])
+        joined.index = df.index
+        clashes = {c: c + suffix for c in columns if c in df.columns}
+        return pd.concat([df, joined.rename(columns=clashes)], axis=1)
@@ -0,0 +1,221 @@
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from tmai_api.frames import TOKEN_COLUMN, panels_to_long, parse_times, time_column, to_panel
+
+OHLCV_FIELDS = ("OPEN", "HIGH", "LOW", "CLOSE", "VOLUME")
+PANEL_VERSION = 1
+INDEX_FILE = "index.json"
+MASK_FILE = "mask.npy"
+CURRENT_FILE = "CURRENT"
+VERSION_PREFIX = "v-"
+
+class PricePanel:
+    """Dense token x time OHLCV arrays stored as memory-mapped .npy files.
+    
+    A panel is a directory with one float64 array per field, a boolean validity
+    mask and a small JSON index of token IDs and timestamps. Each write goes to a
+    new version subdirectory, and a CURRENT file names the live one. Arrays are
+    token-major, so one token's history is a contiguous row. Opening a panel maps
+    the files read-only: any number of processes can share the same pages without
+    copying, and slicing by token or time range only touches the requested data.
+    """
+    
+    def __init__(self, path, fields, tokens, times, arrays, mask, time_col="TIMESTAMP"):
+        self.path = path
+        self.fields = list(fields)
+        self.tokens = list(tokens)
+        self.times = times
+        self.arrays = arrays
+        self.mask = mask
+        self.time_col = time_col
+        self._token_rows = {token: row for row, token in enumerate(self.tokens)}
+    
+    @classmethod
+    def write(cls, path, df, fields=OHLCV_FIELDS, grades=None, grade_fields=("TM_TRADER_GRADE",)):
+        """Write an OHLCV frame as a panel directory.
+        
+        Args:
+            path (str): Directory to create. The new version is switched in with a single
+                rename of the CURRENT file, so readers see either the old panel or the new
+                one. Older versions are then deleted; processes that already mapped them
+                keep reading the old data
+            df (pandas.DataFrame): Frame from DailyOHLCVEndpoint or HourlyOHLCVEndpoint
+            fields (tuple, optional): Price columns to store; columns missing from df are skipped
+            grades (pandas.DataFrame, optional): Grade frame (e.g. from trader_grades)
+                whose latest value as of each bar is stored alongside the prices
+            grade_fields (tuple, optional): Grade columns to store
+            
+        Returns:
+            PricePanel: The written panel, opened read-only
+        """
+        time_col = time_column(df)
+        fields = [field for field in fields if field in df.columns]
+        if not fields:
+            raise ValueError("The frame has none of the panel fields to store")
+        panels = {field: to_panel(df, field, time_col) for field in fields}
+        # Validity is defined by the close (or the first stored field) being present
+        reference = panels["CLOSE" if "CLOSE" in panels else fields[0]]
+        tokens, times = reference.columns, reference.index
+        
+        if grades is not None:
+            for field in grade_fields:
+                grade_panel = to_panel(grades, field)
+                panels[field] = (grade_panel.reindex(columns=tokens)
+                                 .reindex(grade_panel.index.union(times)).ffill().reindex(times))
+                fields.append(field)
+        
+        os.makedirs(path, exist_ok=True)
+        # Every write gets a fresh directory: rewriting a file in place would truncate
+        # pages that readers have mapped (SIGBUS)
+        version = tempfile.mkdtemp(prefix=VERSION_PREFIX, dir=path)
+        try:
+            shape = (len(tokens), len(times))
+            for field in fields:
+                array = np.lib.format.open_memmap(os.path.join(version, f"{field}.npy"), mode="w+",
+                                                  dtype=np.float64, shape=shape)
+                array[:] = panels[field].reindex(index=times, columns=tokens).to_numpy(dtype=np.float64).T
+                array.flush()
+                del array
+            np.save(os.path.join(version, MASK_FILE), reference.notna().to_numpy().T)
+            
+            index = {
+                "version": PANEL_VERSION,
+                "time_col": time_col,
+                "fields": fields,
+                "tokens": [token.item() if hasattr(token, "item") else token for token in tokens],
+                "times": times.strftime("%Y-%m-%dT%H:%M:%S.000Z").tolist(),
+            }
+            with open(os.path.join(version, INDEX_FILE), "w") as f:
+                json.dump(index, f)
+            
+            # Renaming the pointer is the one atomic step that publishes the whole version
+            fd, pointer = tempfile.mkstemp(prefix=f".{CURRENT_FILE}-", dir=path)
+            with os.fdopen(fd, "w") as f:
+                f.write(os.path.basename(version))
+            os.replace(pointer, os.path.join(path, CURRENT_FILE))
+        except BaseException:
+            shutil.rmtree(version, ignore_errors=True)
+            raise
+        cls._remove_stale(path, os.path.basename(version))
+        return cls.open(path)
+    
+    @classmethod
+    def open(cls, path):
+        """Open a panel directory as read-only memory maps.
+        
+        Args:
+            path (str): Panel directory
+            
+        Returns:
+            PricePanel: Panel backed by the files in path
+        """
+        try:
+            index, arrays, mask = cls._load(path)
+        except FileNotFoundError:
+            # A concurrent write may have removed the version between reading CURRENT and its files
+            index, arrays, mask = cls._load(path)
+        times = parse_times(pd.Index(index["times"]))
+        return cls(path, index["fields"], index["tokens"], times, arrays, mask, index["time_col"])
+    
+    @staticmethod
+    def _load(path):
+        """Read the index and map the arrays of the version CURRENT points to."""
+        directory = path
+        try:
+            with open(os.path.join(path, CURRENT_FILE)) as f:
+                directory = os.path.join(path, f.read().strip())
+        except FileNotFoundError:
+            # Panels written before versioned directories keep their files at the top level
+            pass
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            index = json.load(f)
+        if index.get("version") != PANEL_VERSION:
+            raise ValueError(f"Unsupported panel version {index.get('version')} in {path}")
+        arrays = {field: np.load(os.path.join(directory, f"{field}.npy"), mmap_mode="r")
+                  for field in index["fields"]}
+        mask = np.load(os.path.join(directory, MASK_FILE), mmap_mode="r")
+        return index, arrays, mask
+    
+    @staticmethod
+    def _remove_stale(path, current):
+        """Delete panel versions and top-level panel files other than the current version.
+        
+        Open memory maps keep their data until they are closed, so readers of a
+        deleted version are unaffected.
+        """
+        for name in os.listdir(path):
+            target = os.path.join(path, name)
+            if name.startswith(VERSION_PREFIX) and name != current and os.path.isdir(target):
+                shutil.rmtree(target, ignore_errors=True)
+            elif name == INDEX_FILE or (name.endswith(".npy") and os.path.isfile(target)):
+                os.remove(target)
+    
+    @property
+    def shape(self):
+        """(tokens, timestamps) shape of every field array."""
+        return self.mask.shape
+    
+    def token_row(self, token):
+        """Return the array row of a token ID."""
+        try:
+            return self._token_rows[token]
+        except KeyError:
+            raise KeyError(f"Token {token} is not in the panel") from None
+    
+    def time_slice(self, start=None, end=None):
+        """Return the column slice covering the inclusive time range [start, end].
+        
+        Args:
+            start (str or datetime, optional): First timestamp. Open-ended when None
+            end (str or datetime, optional): Last timestamp. Open-ended when None
+            
+        Returns:
+            slice: Column slice into the field arrays
+        """
+        first = 0 if start is None else self.times.searchsorted(parse_times(start), side="left")
+        last = len(self.times) if end is None else self.times.searchsorted(parse_times(end), side="right")
+        return slice(first, last)
+    
+    def get(self, field, token=None, start=None, end=None):
+        """Return a view of one field for a token and/or time range.
+        
+        Args:
+            field (str): Field name (e.g. "CLOSE")
+            token (optional): Token ID. All tokens when None
+            start (str or datetime, optional): First timestamp
+            end (str or datetime, optional): Last timestamp
+            
+        Returns:
+            numpy.ndarray: 1-D view for a single token, 2-D token x time view otherwise
+        """
+        columns = self.time_slice(start, end)
+        if token is None:
+            return self.arrays[field][:, columns]
+        return self.arrays[field][self.token_row(token), columns]
+    
+    def to_dataframe(self, tokens=None, start=None, end=None, fields=None):
+        """Materialize part of the panel as a long frame like get_dataframe returns.
+        
+        Args:
+            tokens (list, optional): Token IDs to include. All tokens when None
+            start (str or datetime, optional): First timestamp
+            end (str or datetime, optional): Last timestamp
+            fields (list, optional): Fields to include. All fields when None
+            
+        Returns:
+            pandas.DataFrame: One row per valid (token, time) pair
+        """
+        columns = self.time_slice(start, end)
+        tokens = self.tokens if tokens is None else list(tokens)
+        rows = [self.token_row(token) for token in tokens]
+        times = self.times[columns]
+        panels = {field: pd.DataFrame(self.arrays[field][rows, columns].T, index=times, columns=tokens)
+                  for field in (fields or self.fields)}
+        mask = pd.DataFrame(self.mask[rows, columns].T, index=times, columns=tokens)
+        frame = panels_to_long(panels, self.time_col, TOKEN_COLUMN, mask=mask)
+        frame[self.time_col] = frame[self.time_col].dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        return frame
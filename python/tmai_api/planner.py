@@ -0,0 +1,281 @@
+import datetime
+import math
+
+# Expected rows per token per day for each endpoint
+ROWS_PER_DAY = {
+    'hourly-ohlcv': 24,
+    'daily-ohlcv': 1,
+    'trader-grades': 1,
+    'investor-grades': 1,
+    'trading-signals': 1,
+    'market-metrics': 1,
+    # Approximate number of holdings per day
+    'trader-indices': 30,
+}
+
+# Endpoints that return market-wide rows rather than rows per token
+MARKET_WIDE_ENDPOINTS = {'market-metrics', 'trader-indices'}
+
+def optimal_batching(token_count, days, rows_per_day, limit, max_days):
+    """Choose the token batch size and days per request that minimize the request count.
+    
+    Every request must satisfy batch_size * rows_per_day * chunk_days <= limit.
+    
+    Args:
+        token_count (int): Number of tokens
+        days (int): Number of days in the date range (inclusive)
+        rows_per_day (float): Expected rows per token per day
+        limit (int): Page limit of a single request
+        max_days (int): Maximum number of days in a single request
+        
+    Returns:
+        tuple: (batch_size, chunk_days, fits) where fits is False when even a
+        single token-day exceeds the page limit
+    """
+    best = None
+    for chunk_days in range(1, min(max_days, days) + 1):
+        batch_size = min(token_count, int(limit // (rows_per_day * chunk_days)))
+        if batch_size < 1:
+            break
+        cost = math.ceil(token_count / batch_size) * math.ceil(days / chunk_days)
+        if best is None or cost < best[0]:
+            best = (cost, batch_size, chunk_days)
+    if best is None:
+        return 1, 1, False
+    
+    # Spread tokens and days evenly over the same number of requests
+    _, batch_size, chunk_days = best
+    batches = math.ceil(token_count / batch_size)
+    date_chunks = math.ceil(days / chunk_days)
+    return math.ceil(token_count / batches), math.ceil(days / date_chunks), True
+
+class FetchPlan:
+    """A set of (token batch, date range) requests that each fit the page limit."""
+    
+    def __init__(self, endpoint, path, params, units, limit, rows_per_request, expected_rows, fits=True):
+        """Initialize the plan.
+        
+        Args:
+            endpoint (BaseEndpoint): Endpoint that executes the plan
+            path (str): API endpoint path
+            params (dict): Query parameters shared by every request
+            units (list): (token_ids, start_date, end_date) tuples, token_ids being a
+                comma-separated string or None
+            limit (int): Page limit of each request
+            rows_per_request (float): Expected rows of the largest request, or None if unknown
+            expected_rows (float): Expected total rows, or None if unknown
+            fits (bool, optional): Whether every request is expected to fit the page limit
+        """
+        self.endpoint = endpoint
+        self.path = path
+        self.params = params
+        self.units = units
+        self.limit = limit
+        self.rows_per_request = rows_per_request
+        self.expected_rows = expected_rows
+        self.fits = fits
+    
+    @property
+    def request_count(self):
+        """int: Number of requests the plan makes."""
+        return len(self.units)
+    
+    def chunk_requests(self):
+        """Return the request parameters of every unit.
+        
+        Returns:
+            list: (chunk_start, chunk_end, chunk_params) tuples
+        """
+        chunk_requests = []
+        for token_ids, start, end in self.units:
+            chunk_params = dict(self.params)
+            if token_ids is not None:
+                chunk_params.pop('symbol', None)
+                chunk_params['token_id'] = token_ids
+            if start:
+                chunk_params['startDate'] = start
+            if end:
+                chunk_params['endDate'] = end
+            chunk_params['limit'] = self.limit
+            chunk_params['page'] = 0
+            chunk_requests.append((start, end, chunk_params))
+        return chunk_requests
+    
+    def execute(self, **options):
+        """Fetch every request of the plan.
+        
+        Args:
+            **options: Fetch options (stream, columnar, progress, return_result, deadline, ...)
+            
+        Returns:
+            dict: Combined API response data
+        """
+        return self.endpoint._fetch_chunks('get', self.path, self.chunk_requests(), **options)
+    
+    def observe(self, result):
+        """Learn the endpoint's row density from the result of fetching this plan.
+        
+        The estimate is stored in ``client.row_density`` and used by later plans.
+        Results with failed chunks, or with any request that returned a full page
+        and so may have been truncated by the page limit, are ignored.
+        
+        Args:
+            result (FetchResult): Result of fetching this plan's requests
+        """
+        row_counts = result.row_counts
+        if not result.complete or any(count is None or count >= self.limit for count in row_counts):
+            return
+        rows = sum(row_counts)
+        market_wide = self.path in MARKET_WIDE_ENDPOINTS
+        token_days = 0
+        for token_ids, start, end in self.units:
+            if token_ids is None and not market_wide:
+                return
+            try:
+                days = (datetime.date.fromisoformat(end) - datetime.date.fromisoformat(start)).days + 1
+            except (TypeError, ValueError):
+                return
+            token_days += days * (1 if token_ids is None else len(token_ids.split(",")))
+        if not token_days or not rows:
+            return
+        density = rows / token_days
+        row_density = self.endpoint.client.row_density
+        previous = row_density.get(self.path)
+        row_density[self.path] = density if previous is None else 0.5 * previous + 0.5 * density
+    
+    def summary(self):
+        """Return the plan's request count and expected rows.
+        
+        Returns:
+            dict: Plan summary
+        """
+        return {
+            "endpoint": self.path,
+            "requests": self.request_count,
+            "expected_rows": self.expected_rows,
+            "rows_per_request": self.rows_per_request,
+            "limit": self.limit,
+            "fits_limit": self.fits,
+        }
+    
+    def __repr__(self):
+        expected = "unknown" if self.expected_rows is None else f"~{int(self.expected_rows)}"
+        return f"<FetchPlan {self.path}: {self.request_count} requests, {expected} rows>"
+
+class FetchPlanner:
+    """Plans paginated fetches so that no request is truncated by the page limit.
+    
+    Symbols are resolved to token IDs through the tokens endpoint (cached in
+    ``client.token_index``), and the token list and date range are split into the
+    fewest (token batch, date range) requests whose expected rows fit the limit.
+    """
+    
+    def __init__(self, client, rows_per_day=None):
+        """Initialize the planner.
+        
+        Args:
+            client (TokenMetricsClient): Client used to resolve symbols
+            rows_per_day (dict, optional): Overrides of ROWS_PER_DAY per endpoint path
+        """
+        self.client = client
+        # Defaults, then densities learned from earlier fetches, then explicit overrides
+        self.rows_per_day = dict(ROWS_PER_DAY, **client.row_density, **(rows_per_day or {}))
+    
+    def resolve_token_ids(self, symbol=None, token_id=None):
+        """Resolve symbols and token IDs to a list of token IDs.
+        
+        Args:
+            symbol (str, optional): Comma-separated Token Symbols
+            token_id (str, optional): Comma-separated Token IDs
+            
+        Returns:
+            list: Token IDs as strings, or None when no token filter was given or a
+            symbol could not be resolved (requests then keep the symbol parameter)
+        """
+        if symbol is None and token_id is None:
+            return None
+        token_ids = [t.strip() for t in str(token_id).split(",") if t.strip()] if token_id is not None else []
+        if symbol is None:
+            return token_ids
+        
+        symbols = [s.strip().upper() for s in str(symbol).split(",") if s.strip()]
+        index = self.client.token_index
+        missing = [s for s in symbols if s not in index]
+        if missing:
+            response = self.client.tokens.get(symbol=",".join(missing))
+            rows = response.get("data", []) if isinstance(response, dict) else response
+            for row in rows or []:
+                row_symbol = str(row.get("TOKEN_SYMBOL", "")).upper()
+                if row_symbol in missing and row.get("TOKEN_ID") is not None:
+                    index.setdefault(row_symbol, []).append(str(row["TOKEN_ID"]))
+        
+        if any(s not in index for s in symbols):
+            # Misses are not cached: the symbol may be listed later or the lookup may have failed
+            return None
+        for s in symbols:
+            token_ids.extend(t for t in index[s] if t not in token_ids)
+        return token_ids
+    
+    def plan(self, endpoint, path, params, max_days=29, limit=None):
+        """Plan the requests for a paginated fetch.
+        
+        Unlike plain date chunking, the planned date ranges do not overlap.
+        
+        Args:
+            endpoint (BaseEndpoint): Endpoint that will execute the plan
+            path (str): API endpoint path (e.g. "hourly-ohlcv")
+            params (dict): Query parameters of the fetch
+            max_days (int, optional): Maximum number of days in a single request
+            limit (int, optional): Page limit. Defaults to the endpoint's limit
+            
+        Returns:
+            FetchPlan: The planned requests
+        """
+        if limit is None:
+            limit = endpoint.ENDPOINT_LIMITS.get(path, endpoint.ENDPOINT_LIMITS['default'])
+        params = {k: v for k, v in params.items() if k not in ('limit', 'page')}
+        rows_per_day = self.rows_per_day.get(path, 1)
+        
+        market_wide = path in MARKET_WIDE_ENDPOINTS
+        token_ids = None if market_wide else self.resolve_token_ids(params.get('symbol'), params.get('token_id'))
+        token_count = 1 if market_wide else (len(token_ids) if token_ids is not None else None)
+        
+        start, end = params.get('startDate'), params.get('endDate')
+        try:
+            start_date = datetime.datetime.strptime(start, "%Y-%m-%d").date()
+            end_date = datetime.datetime.strptime(end, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            start_date = end_date = None
+        days = (end_date - start_date).days + 1 if start_date and end_date and end_date >= start_date else None
+        
+        if token_count == 0:
+            return FetchPlan(endpoint, path, params, [], limit, 0, 0)
+        
+        if token_count is None:
+            # Unknown universe size: only the date range can be split
+            batch_size, chunk_days, fits = None, max_days, True
+        else:
+            batch_size, chunk_days, fits = optimal_batching(token_count, days or 1, rows_per_day, limit, max_days)
+        
+        if days is None:
+            date_ranges = [(start, end)]
+        else:
+            date_ranges = []
+            chunk_start = start_date
+            while chunk_start <= end_date:
+                chunk_end = min(chunk_start + datetime.timedelta(days=chunk_days - 1), end_date)
+                date_ranges.append((chunk_start.isoformat(), chunk_end.isoformat()))
+                chunk_start = chunk_end + datetime.timedelta(days=1)
+        
+        if token_ids is None:
+            batches = [None]
+        else:
+            batches = [",".join(token_ids[i:i + batch_size]) for i in range(0, len(token_ids), batch_size)]
+        units = [(batch, chunk_start, chunk_end) for chunk_start, chunk_end in date_ranges for batch in batches]
+        
+        if token_count is None:
+            rows_per_request = expected_rows = None
+        else:
+            rows_per_request = min(batch_size, token_count) * rows_per_day * min(chunk_days, days or 1)
+            expected_rows = token_count * rows_per_day * (days or 1)
+        return FetchPlan(endpoint, path, params, units, limit, rows_per_request, expected_rows, fits)
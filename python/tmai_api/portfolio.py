@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+from tmai_api.frames import TOKEN_COLUMN, parse_times, time_column, to_panel
+
+class PortfolioPerformance:
+    """NAV, daily weights and rebalancing turnover of a reconstructed portfolio."""
+    
+    def __init__(self, nav, weights, turnover):
+        """Initialize the result.
+        
+        Args:
+            nav (pandas.Series): Portfolio value per date
+            weights (pandas.DataFrame): Date x token drifted weights at each close
+            turnover (pandas.Series): One-sided turnover per rebalance date
+        """
+        self.nav = nav
+        self.weights = weights
+        self.turnover = turnover
+    
+    @property
+    def returns(self):
+        """pandas.Series: Daily portfolio returns."""
+        return self.nav.pct_change().iloc[1:]
+
+def holdings_panel(holdings, weight_col=None, time_col=None, token_col=TOKEN_COLUMN):
+    """Pivot trader indices holdings into a date x token panel of target weights.
+    
+    Weights are normalized to sum to one on every date. Constituents are equally
+    weighted when the frame has no weight column.
+    
+    Args:
+        holdings (pandas.DataFrame): Frame from TraderIndicesEndpoint
+        weight_col (str, optional): Column with constituent weights
+        time_col (str, optional): Time column. Detected when None
+        token_col (str, optional): Token column
+        
+    Returns:
+        pandas.DataFrame: Target weights indexed by UTC date, zero for tokens not held
+    """
+    time_col = time_col or time_column(holdings)
+    if weight_col is None:
+        holdings = holdings.assign(_weight=1.0)
+        weight_col = "_weight"
+    panel = to_panel(holdings, weight_col, time_col, token_col).fillna(0.0)
+    panel.index = panel.index.normalize()
+    panel = panel.groupby(level=0).last()
+    return panel.div(panel.sum(axis=1).replace(0.0, np.nan), axis=0).fillna(0.0)
+
+def reconstruct_nav(holdings, prices, weight_col=None, initial=1.0, cost_bps=0.0, price_col="CLOSE"):
+    """Reconstruct a portfolio's NAV from its rebalance holdings and daily prices.
+    
+    The portfolio is rebalanced to the target weights at the close of every date
+    that has holdings and drifts with prices in between. All constituents and
+    dates are processed as matrix operations.
+    
+    Args:
+        holdings (pandas.DataFrame): Frame from TraderIndicesEndpoint
+        prices (pandas.DataFrame): Frame from DailyOHLCVEndpoint covering the constituents
+        weight_col (str, optional): Column with constituent weights. Equal weights when None
+        initial (float, optional): NAV before the first rebalance
+        cost_bps (float, optional): Trading cost in basis points of traded value
+        price_col (str, optional): Price column
+        
+    Returns:
+        PortfolioPerformance: NAV, weights and turnover from the first rebalance onwards
+    """
+    targets = holdings_panel(holdings, weight_col)
+    price_panel = to_panel(prices, price_col)
+    price_panel.index = price_panel.index.normalize()
+    price_panel = price_panel.groupby(level=0).last()
+    
+    dates = price_panel.index.union(targets.index)
+    dates = dates[dates >= targets.index[0]]
+    tokens = targets.columns.union(price_panel.columns)
+    price = price_panel.reindex(index=dates, columns=tokens).ffill().to_numpy()
+    target = targets.reindex(columns=tokens, fill_value=0.0).reindex(dates).to_numpy()
+    is_rebalance = dates.isin(targets.index)
+    
+    # Holdings set at the last rebalance strictly before each date, and their entry prices
+    period = np.cumsum(is_rebalance) - is_rebalance
+    rebalance_rows = np.flatnonzero(is_rebalance)
+    held = np.zeros_like(target)
+    anchor = np.ones_like(price)
+    has_period = period > 0
+    held[has_period] = target[rebalance_rows[period[has_period] - 1]]
+    anchor[has_period] = price[rebalance_rows[period[has_period] - 1]]
+    
+    # Growth of each holding since the last rebalance; unpriced holdings keep their value
+    growth = np.where(held > 0, price / anchor, 0.0)
+    growth = np.where(np.isnan(growth), held > 0, growth)
+    value = (held * growth).sum(axis=1)
+    value[~has_period] = 1.0
+    
+    # Turnover: distance between the drifted weights and the new targets
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drifted = np.where(value[:, None] > 0, held * growth / value[:, None], 0.0)
+    turnover = 0.5 * np.abs(target[is_rebalance] - drifted[is_rebalance]).sum(axis=1)
+    turnover[0] = 1.0
+    costs = 1.0 - turnover * cost_bps / 10000.0
+    
+    # Chain the value factors of the completed periods
+    period_growth = np.concatenate([[1.0], value[rebalance_rows[1:]]]) * costs
+    nav = initial * np.cumprod(period_growth)[np.maximum(period - 1, 0)] * value
+    nav[is_rebalance] *= costs
+    nav[rebalance_rows[0]] = initial * costs[0]
+    
+    weights = np.where(is_rebalance[:, None], target, drifted)
+    return PortfolioPerformance(
+        nav=pd.Series(nav, index=dates, name="NAV"),
+        weights=pd.DataFrame(weights, index=dates, columns=tokens),
+        turnover=pd.Series(turnover, index=dates[is_rebalance], name="TURNOVER"),
+    )
@@ -0,0 +1,263 @@
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+import requests
+from tmai_api.client import TokenMetricsClient
+from tmai_api.ratelimit import RateLimiter
+
+# Response headers forwarded to clients
+FORWARDED_HEADERS = ("content-type", "etag", "last-modified")
+
+class _Flight:
+    """An upstream request that identical concurrent requests wait on."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+class CachingProxy:
+    """Local caching gateway in front of the Token Metrics API.
+    
+    Worker processes point TokenMetricsClient(base_url=...) at the proxy. The proxy
+    coalesces identical concurrent requests into one upstream request, caches
+    successful GET responses with date-aware TTLs and applies one shared rate
+    limit to all upstream traffic.
+    """
+    
+    def __init__(self, api_key=None, upstream=TokenMetricsClient.BASE_URL, rate_limit=None,
+                 ttl_recent=60, ttl_historical=86400, ttl_default=300, max_entries=4096,
+                 transport=None, timeout=(10, 60), wait_timeout=None):
+        """Initialize the proxy.
+        
+        Args:
+            api_key (str, optional): API key used upstream. If None, each request's own
+                api_key header is forwarded (and becomes part of the cache key)
+            upstream (str, optional): Base URL of the upstream API
+            rate_limit (float, optional): Maximum upstream requests per second
+            ttl_recent (float, optional): Seconds to cache responses whose date range reaches today
+            ttl_historical (float, optional): Seconds to cache responses that end before today
+            ttl_default (float, optional): Seconds to cache responses without a date range
+            max_entries (int, optional): Maximum number of cached responses
+            transport (Transport, optional): Transport used for upstream requests.
+                Defaults to RequestsTransport
+            timeout (tuple or float, optional): (connect, read) timeouts in seconds for
+                upstream requests
+            wait_timeout (float, optional): Seconds a coalesced request waits for the
+                upstream request it joined before answering 504. Defaults to the sum of
+                the connect and read timeouts
+        """
+        self.api_key = api_key
+        self.client = TokenMetricsClient(api_key=api_key, transport=transport, base_url=upstream,
+                                         timeout=timeout)
+        self.upstream = self.client.base_url
+        if wait_timeout is None and timeout is not None:
+            wait_timeout = sum(timeout) if isinstance(timeout, (tuple, list)) else timeout
+        self.wait_timeout = wait_timeout
+        self.limiter = RateLimiter(rate_limit)
+        self.ttl_recent = ttl_recent
+        self.ttl_historical = ttl_historical
+        self.ttl_default = ttl_default
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.flights = {}
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "upstream": 0}
+    
+    def ttl_for(self, params):
+        """Return the cache TTL for a request's query parameters.
+        
+        Args:
+            params (dict): Query parameters
+            
+        Returns:
+            float: TTL in seconds
+        """
+        end_date = params.get("endDate")
+        if not end_date:
+            return self.ttl_recent if params.get("startDate") else self.ttl_default
+        try:
+            end = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        except ValueError:
+            return self.ttl_default
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        return self.ttl_historical if end < today else self.ttl_recent
+    
+    def _upstream_headers(self, headers):
+        return {
+            "accept": "application/json",
+            "api_key": self.api_key or headers.get("api_key", ""),
+        }
+    
+    def _fetch(self, path, params, headers):
+        self.limiter.acquire()
+        with self.lock:
+            self.stats["upstream"] += 1
+        response = self.client.transport.send("get", self.upstream + path, self._upstream_headers(headers),
+                                              params=params, timeout=self.client.timeout)
+        response_headers = {name: value for name, value in response.headers.items()
+                            if name.lower() in FORWARDED_HEADERS}
+        return response.status_code, response_headers, response.content
+    
+    def get(self, path, params, headers):
+        """Serve a GET request from the cache, a coalesced flight or upstream.
+        
+        Args:
+            path (str): Request path (e.g. "/hourly-ohlcv")
+            params (dict): Query parameters
+            headers (dict): Request headers
+            
+        Returns:
+            tuple: (status code, response headers, body bytes)
+        """
+        key = (path, tuple(sorted(params.items())), None if self.api_key else headers.get("api_key"))
+        now = time.monotonic()
+        
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None and cached[0] > now:
+                self.cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached[1]
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = _Flight()
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        
+        if not leader:
+            if not flight.done.wait(self.wait_timeout):
+                return 504, {"content-type": "text/plain"}, b"Timed out waiting for the upstream response"
+            return flight.result
+        
+        try:
+            flight.result = self._fetch(path, params, headers)
+        except Exception as e:
+            # Coalesced waiters need a reply whatever went wrong upstream
+            flight.result = (502, {"content-type": "text/plain"}, str(e).encode("utf-8"))
+        finally:
+            with self.lock:
+                if flight.result is not None and flight.result[0] == 200:
+                    self.cache[key] = (now + self.ttl_for(params), flight.result)
+                    self.cache.move_to_end(key)
+                    while len(self.cache) > self.max_entries:
+                        self.cache.popitem(last=False)
+                del self.flights[key]
+            flight.done.set()
+        return flight.result
+    
+    def post(self, path, body, headers):
+        """Forward a POST request upstream without caching.
+        
+        Args:
+            path (str): Request path (e.g. "/tmai")
+            body (bytes): Request body
+            headers (dict): Request headers
+            
+        Returns:
+            tuple: (status code, response headers, body bytes)
+        """
+        self.limiter.acquire()
+        with self.lock:
+            self.stats["upstream"] += 1
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return 400, {"content-type": "text/plain"}, b"Request body must be JSON"
+        try:
+            response = self.client.transport.send("post", self.upstream + path, self._upstream_headers(headers),
+                                                  json=payload, timeout=self.client.timeout)
+        except requests.RequestException as e:
+            return 502, {"content-type": "text/plain"}, str(e).encode("utf-8")
+        response_headers = {name: value for name, value in response.headers.items()
+                            if name.lower() in FORWARDED_HEADERS}
+        return response.status_code, response_headers, response.content
+    
+    def make_server(self, host="127.0.0.1", port=8765):
+        """Create the HTTP server for this proxy.
+        
+        Args:
+            host (str, optional): Interface to bind
+            port (int, optional): Port to bind (0 picks a free port)
+            
+        Returns:
+            ThreadingHTTPServer: Server; call serve_forever() to start it
+        """
+        proxy = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def _reply(self, result):
+                status, headers, body = result
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_GET(self):
+                url = urlsplit(self.path)
+                self._reply(proxy.get(url.path, dict(parse_qsl(url.query)), self.headers))
+            
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                body = self.rfile.read(length)
+                self._reply(proxy.post(urlsplit(self.path).path, body, self.headers))
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return ThreadingHTTPServer((host, port), Handler)
+
+def main(argv=None):
+    """Run the tmai-proxy command.
+    
+    Args:
+        argv (list, optional): Command-line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="tmai-proxy",
+        description="Run a local caching gateway shared by many TokenMetricsClient processes.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind (default: 8765)")
+    parser.add_argument("--api-key", default=os.environ.get("TMAI_API_KEY"),
+                        help="Upstream API key (defaults to TMAI_API_KEY; otherwise client keys are forwarded)")
+    parser.add_argument("--upstream", default=TokenMetricsClient.BASE_URL, help="Upstream API base URL")
+    parser.add_argument("--rate-limit", type=float, default=None,
+                        help="Maximum upstream requests per second")
+    parser.add_argument("--ttl-recent", type=float, default=60,
+                        help="Cache seconds for date ranges reaching today (default: 60)")
+    parser.add_argument("--ttl-historical", type=float, default=86400,
+                        help="Cache seconds for date ranges ending before today (default: 86400)")
+    parser.add_argument("--ttl-default", type=float, default=300,
+                        help="Cache seconds for requests without a date range (default: 300)")
+    args = parser.parse_args(argv)
+    
+    proxy = CachingProxy(api_key=args.api_key, upstream=args.upstream, rate_limit=args.rate_limit,
+                         ttl_recent=args.ttl_recent, ttl_historical=args.ttl_historical,
+                         ttl_default=args.ttl_default)
+    server = proxy.make_server(args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]} -> {proxy.upstream}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
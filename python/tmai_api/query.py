@@ -0,0 +1,238 @@
+import inspect
+import operator
+import pandas as pd
+from tmai_api.frames import TIME_COLUMNS, parse_times
+from tmai_api.screener import NUMERIC_FILTERS
+
+# Columns whose equality / membership predicates map to a comma-separated get() parameter
+LIST_PARAMS = {
+    'TOKEN_SYMBOL': 'symbol',
+    'TOKEN_ID': 'token_id',
+    'TOKEN_NAME': 'token_name',
+}
+
+# Columns whose lower bounds map to a "minimum" get() parameter
+THRESHOLD_PARAMS = {column: param for param, column in NUMERIC_FILTERS.items()}
+
+OPERATORS = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+class Predicate:
+    """A comparison of a response column with a value."""
+    
+    def __init__(self, column, op, value):
+        self.column = column
+        self.op = op
+        self.value = value
+    
+    def mask(self, df):
+        """Evaluate the predicate on a frame.
+        
+        Args:
+            df (pandas.DataFrame): Frame containing the column
+            
+        Returns:
+            pandas.Series: Boolean mask
+        """
+        if self.column not in df.columns:
+            raise KeyError(f"Column '{self.column}' is not in the response")
+        values = df[self.column]
+        value = self.value
+        if self.column in TIME_COLUMNS:
+            values = parse_times(values)
+            value = [parse_times(v) for v in value] if self.op == 'in' else parse_times(value)
+        if self.op == 'in':
+            return values.isin(list(value))
+        return OPERATORS[self.op](values, value)
+    
+    def __repr__(self):
+        return f"{self.column} {self.op} {self.value!r}"
+
+class Column:
+    """Reference to a response column for building predicates, e.g. col("DATE") >= "2024-01-01"."""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def __ge__(self, value):
+        return Predicate(self.name, '>=', value)
+    
+    def __gt__(self, value):
+        return Predicate(self.name, '>', value)
+    
+    def __le__(self, value):
+        return Predicate(self.name, '<=', value)
+    
+    def __lt__(self, value):
+        return Predicate(self.name, '<', value)
+    
+    def __eq__(self, value):
+        return Predicate(self.name, '==', value)
+    
+    def __ne__(self, value):
+        return Predicate(self.name, '!=', value)
+    
+    __hash__ = None
+    
+    def isin(self, values):
+        """Predicate matching any of the values."""
+        return Predicate(self.name, 'in', list(values))
+    
+    def between(self, low, high):
+        """Predicates for an inclusive range."""
+        return [Predicate(self.name, '>=', low), Predicate(self.name, '<=', high)]
+
+def col(name):
+    """Reference a response column in a query predicate.
+    
+    Args:
+        name (str): Column name (e.g. "DATE", "TOKEN_SYMBOL", "TM_TRADER_GRADE")
+        
+    Returns:
+        Column: Column reference supporting comparisons, isin() and between()
+    """
+    return Column(name)
+
+def _date(value):
+    """Return the YYYY-MM-DD date of a date or timestamp."""
+    return parse_times(value).strftime("%Y-%m-%d")
+
+class Query:
+    """Lazy query over a paginated endpoint with predicate and column pushdown.
+    
+    Nothing is fetched until collect(). Predicates the API can evaluate (token
+    membership, date range, minimum thresholds) become get() parameters, so the
+    date chunking and fetch planning only cover what is needed. Every predicate
+    is also applied to the result, which keeps exclusive bounds and sub-day
+    times exact. Only the selected columns (plus those the predicates need) are
+    kept while the response is parsed.
+    """
+    
+    def __init__(self, endpoint, predicates=None, params=None, columns=None):
+        self.endpoint = endpoint
+        self.predicates = list(predicates or [])
+        self.params = dict(params or {})
+        self.columns = list(columns) if columns is not None else None
+    
+    def _copy(self, **changes):
+        state = {"predicates": self.predicates, "params": self.params, "columns": self.columns}
+        state.update(changes)
+        return Query(self.endpoint, **state)
+    
+    def where(self, *predicates, **params):
+        """Add predicates and get() parameters.
+        
+        Args:
+            *predicates (Predicate): Column predicates, e.g. col("TM_TRADER_GRADE") >= 80
+            **params: get() parameters passed through as-is (lists are comma-joined)
+            
+        Returns:
+            Query: New query with the predicates added
+        """
+        flat = []
+        for predicate in predicates:
+            flat.extend(predicate if isinstance(predicate, (list, tuple)) else [predicate])
+        params = {k: ",".join(map(str, v)) if isinstance(v, (list, tuple)) else v for k, v in params.items()}
+        return self._copy(predicates=self.predicates + flat, params=dict(self.params, **params))
+    
+    def select(self, columns):
+        """Keep only some columns of the result.
+        
+        Args:
+            columns (list): Column names
+            
+        Returns:
+            Query: New query with the projection
+        """
+        return self._copy(columns=list(columns))
+    
+    def pushdown(self):
+        """Translate the predicates into get() parameters.
+        
+        Returns:
+            dict: Parameters for the endpoint's get method
+        """
+        accepted = set(inspect.signature(self.endpoint.get).parameters)
+        params = {}
+        members = {}
+        for predicate in self.predicates:
+            column, op, value = predicate.column, predicate.op, predicate.value
+            if column in LIST_PARAMS and op in ('==', 'in'):
+                values = [str(v) for v in (value if op == 'in' else [value])]
+                param = LIST_PARAMS[column]
+                # Several membership predicates on one column intersect
+                members[param] = [v for v in members[param] if v in values] if param in members else values
+            elif column in TIME_COLUMNS and op in ('>=', '>', '=='):
+                start = _date(value)
+                params['startDate'] = max(params.get('startDate', start), start)
+                if op == '==':
+                    params['endDate'] = min(params.get('endDate', start), start)
+            elif column in TIME_COLUMNS and op in ('<=', '<'):
+                end = _date(value)
+                params['endDate'] = min(params.get('endDate', end), end)
+            elif column in THRESHOLD_PARAMS and op in ('>=', '>'):
+                param = THRESHOLD_PARAMS[column]
+                params[param] = max(params.get(param, value), value)
+        for param, values in members.items():
+            params[param] = ",".join(values)
+        params = {k: v for k, v in params.items() if k in accepted}
+        params.update(self.params)
+        return params
+    
+    def fields(self):
+        """Return the response fields to keep, or None to keep every field."""
+        if self.columns is None:
+            return None
+        needed = list(self.columns)
+        for predicate in self.predicates:
+            if predicate.column not in needed:
+                needed.append(predicate.column)
+        return needed
+    
+    def explain(self):
+        """Describe how the query will be executed.
+        
+        Returns:
+            dict: get() parameters, fields kept while parsing and predicates applied locally
+        """
+        return {"params": self.pushdown(), "fields": self.fields(), "predicates": list(self.predicates)}
+    
+    def plan(self):
+        """Return the FetchPlan of the query without fetching anything."""
+        return self.endpoint.get(**self.pushdown(), dry_run=True)
+    
+    def collect(self, **options):
+        """Fetch the data and apply the query.
+        
+        Args:
+            **options: Fetch options passed to the endpoint's get method (e.g. plan=True)
+            
+        Returns:
+            pandas.DataFrame: Rows matching every predicate, with the selected columns
+        """
+        parameters = inspect.signature(self.endpoint.get).parameters.values()
+        if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters):
+            reserved = sorted({"columnar", "fields"} & set(options))
+            if reserved:
+                raise TypeError(f"collect() sets {', '.join(reserved)} itself; use select() to choose columns")
+            # Paginated endpoints stream each page into column buffers, decoding only the needed fields
+            options.setdefault("progress", False)
+            options.setdefault("stream", True)
+            data = self.endpoint.get(**self.pushdown(), columnar=True, fields=self.fields(), **options)
+            df = data.to_dataframe()
+        else:
+            df = self.endpoint.to_dataframe(self.endpoint.get(**self.pushdown(), **options))
+        if df.empty:
+            return pd.DataFrame(columns=self.columns) if self.columns is not None else df
+        
+        mask = pd.Series(True, index=df.index)
+        for predicate in self.predicates:
+            mask &= predicate.mask(df)
+        df = df[mask].reset_index(drop=True)
+        return df[self.columns] if self.columns is not None else df
@@ -0,0 +1,33 @@
+import threading
+import time
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often requests may start."""
+    
+    def __init__(self, rate, burst=1):
+        """Initialize the rate limiter.
+        
+        Args:
+            rate (float): Sustained number of requests per second. None or 0 disables limiting
+            burst (int, optional): Number of requests that may start back to back
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may start."""
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,296 @@
+import hashlib
+import re
+import sqlite3
+from tmai_api.transport import request_key
+
+# Report sections returned by the ai-reports endpoint
+REPORT_SECTIONS = ("TRADER_REPORT", "TECHNOLOGY_REPORT", "FUNDAMENTAL_REPORT")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_PHRASE_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric terms.
+    
+    Args:
+        text (str): Text to tokenize
+        
+    Returns:
+        list: Terms in order of appearance
+    """
+    return _TOKEN_RE.findall(str(text).lower()) if text else []
+
+class ReportStore:
+    """Locally persisted full-text index over AI reports.
+    
+    Reports are stored in a SQLite database together with an inverted index of
+    term positions per report section. Refreshing revalidates each page with the
+    stored ETag/Last-Modified validators, only re-indexes sections whose content
+    changed and drops sections the API no longer returns. Keyword/phrase searches
+    run locally without any requests.
+    """
+    
+    def __init__(self, path, client=None):
+        """Open (or create) a report store.
+        
+        Args:
+            path (str): Path of the SQLite database file (":memory:" for a temporary store)
+            client (TokenMetricsClient, optional): Client used to refresh the reports
+        """
+        self.client = client
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS reports (
+                token_id TEXT NOT NULL,
+                section TEXT NOT NULL,
+                symbol TEXT,
+                name TEXT,
+                hash TEXT NOT NULL,
+                body TEXT NOT NULL,
+                PRIMARY KEY (token_id, section)
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                token_id TEXT NOT NULL,
+                section TEXT NOT NULL,
+                positions TEXT NOT NULL,
+                PRIMARY KEY (term, section, token_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_report ON postings (token_id, section);
+            CREATE TABLE IF NOT EXISTS pages (
+                request TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                token_ids TEXT NOT NULL
+            );
+        """)
+    
+    def close(self):
+        """Close the underlying database."""
+        self.conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def add_reports(self, reports):
+        """Store and index reports, skipping sections whose content is unchanged.
+        
+        Stored sections that a report no longer contains are removed.
+        
+        Args:
+            reports (list): Report dicts as returned in the ai-reports "data" field
+            
+        Returns:
+            int: Number of report sections that were (re-)indexed
+        """
+        updated = 0
+        with self.conn:
+            for report in reports:
+                token_id = str(report.get("TOKEN_ID"))
+                for section in REPORT_SECTIONS:
+                    body = report.get(section)
+                    if not body:
+                        self._delete_section(token_id, section)
+                        continue
+                    digest = hashlib.sha1(body.encode("utf-8")).hexdigest()
+                    row = self.conn.execute(
+                        "SELECT hash FROM reports WHERE token_id = ? AND section = ?",
+                        (token_id, section)).fetchone()
+                    if row and row[0] == digest:
+                        continue
+                    self._index_section(token_id, section, report, body, digest)
+                    updated += 1
+        return updated
+    
+    def _delete_section(self, token_id, section):
+        self.conn.execute("DELETE FROM postings WHERE token_id = ? AND section = ?", (token_id, section))
+        self.conn.execute("DELETE FROM reports WHERE token_id = ? AND section = ?", (token_id, section))
+    
+    def _index_section(self, token_id, section, report, body, digest):
+        self.conn.execute("DELETE FROM postings WHERE token_id = ? AND section = ?",
+                          (token_id, section))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO reports (token_id, section, symbol, name, hash, body) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (token_id, section, report.get("TOKEN_SYMBOL"), report.get("TOKEN_NAME"), digest, body))
+        
+        positions = {}
+        for position, term in enumerate(tokenize(body)):
+            positions.setdefault(term, []).append(position)
+        self.conn.executemany(
+            "INSERT INTO postings (term, token_id, section, positions) VALUES (?, ?, ?, ?)",
+            ((term, token_id, section, ",".join(map(str, offsets)))
+             for term, offsets in positions.items()))
+    
+    def refresh(self, token_id=None, symbol=None, page_size=1000, max_pages=100):
+        """Download reports and re-index the ones whose content changed.
+        
+        Pages whose stored validators are still current are answered with 304 and
+        not downloaded again. When every page was read, stored reports that the API
+        no longer returns for the requested tokens are removed.
+        
+        Args:
+            token_id (str, optional): Comma-separated Token IDs
+            symbol (str, optional): Comma-separated Token Symbols (e.g., "BTC,ETH")
+            page_size (int, optional): Number of reports requested per page
+            max_pages (int, optional): Maximum number of pages to request
+            
+        Returns:
+            int: Number of report sections that were (re-)indexed
+        """
+        if self.client is None:
+            raise ValueError("A client is required to refresh the report store")
+        
+        updated = 0
+        seen = set()
+        previous = None
+        complete = False
+        for page in range(max_pages):
+            params = {k: v for k, v in {"token_id": token_id, "symbol": symbol,
+                                        "limit": page_size, "page": page}.items() if v is not None}
+            token_ids, reports = self._fetch_page(params)
+            if reports:
+                updated += self.add_reports(reports)
+            if token_ids and token_ids == previous:
+                # The server ignored the page parameter and sent the same page again
+                complete = True
+                break
+            seen.update(token_ids)
+            if len(token_ids) < page_size:
+                complete = True
+                break
+            previous = token_ids
+        
+        if complete:
+            self._remove_missing(seen, token_id, symbol)
+        return updated
+    
+    def _fetch_page(self, params):
+        """Fetch one page of reports, revalidating it with the stored validators.
+        
+        Returns:
+            tuple: (token IDs on the page, report dicts or None when the page is unchanged)
+        """
+        endpoint = self.client.ai_reports
+        key = request_key("get", f"{endpoint.base_url}/ai-reports", params)
+        row = self.conn.execute("SELECT etag, last_modified, token_ids FROM pages WHERE request = ?",
+                                (key,)).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["if-none-match"] = row[0]
+        if row and row[1]:
+            headers["if-modified-since"] = row[1]
+        
+        response = endpoint._send("get", "ai-reports", params=params, extra_headers=headers,
+                                  allow_not_modified=row is not None)
+        if response.status_code == 304:
+            return row[2].split(",") if row[2] else [], None
+        
+        data = response.json()
+        reports = (data.get("data", []) if isinstance(data, dict) else data) or []
+        token_ids = [str(report.get("TOKEN_ID")) for report in reports]
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (request, etag, last_modified, token_ids) VALUES (?, ?, ?, ?)",
+                (key, response.headers.get("ETag"), response.headers.get("Last-Modified"), ",".join(token_ids)))
+        return token_ids, reports
+    
+    def _remove_missing(self, seen, token_id=None, symbol=None):
+        """Remove stored reports within the refreshed scope that were not returned."""
+        if token_id is not None:
+            scope = {t.strip() for t in str(token_id).split(",") if t.strip()}
+            stored = self.conn.execute("SELECT DISTINCT token_id FROM reports").fetchall()
+            stale = [t for (t,) in stored if t in scope and t not in seen]
+        elif symbol is not None:
+            symbols = {s.strip().upper() for s in str(symbol).split(",") if s.strip()}
+            stored = self.conn.execute("SELECT DISTINCT token_id, symbol FROM reports").fetchall()
+            stale = [t for t, s in stored if str(s).upper() in symbols and t not in seen]
+        else:
+            stored = self.conn.execute("SELECT DISTINCT token_id FROM reports").fetchall()
+            stale = [t for (t,) in stored if t not in seen]
+        with self.conn:
+            for stale_id in stale:
+                self.conn.execute("DELETE FROM postings WHERE token_id = ?", (stale_id,))
+                self.conn.execute("DELETE FROM reports WHERE token_id = ?", (stale_id,))
+    
+    def _postings(self, term, sections):
+        placeholders = ",".join("?" * len(sections))
+        rows = self.conn.execute(
+            f"SELECT token_id, section, positions FROM postings "
+            f"WHERE term = ? AND section IN ({placeholders})",
+            (term, *sections))
+        return {(token_id, section): [int(p) for p in positions.split(",")]
+                for token_id, section, positions in rows}
+    
+    def _match_phrase(self, terms, sections):
+        """Return {(token_id, section): match_count} for a sequence of terms."""
+        matches = self._postings(terms[0], sections)
+        for offset, term in enumerate(terms[1:], start=1):
+            if not matches:
+                break
+            following = self._postings(term, sections)
+            narrowed = {}
+            for key, starts in matches.items():
+                if key not in following:
+                    continue
+                present = set(following[key])
+                kept = [start for start in starts if start + offset in present]
+                if kept:
+                    narrowed[key] = kept
+            matches = narrowed
+        return {key: len(starts) for key, starts in matches.items()}
+    
+    def search(self, query, sections=None, limit=None):
+        """Find reports matching all keywords and quoted phrases in a query.
+        
+        Args:
+            query (str): Keywords and "quoted phrases" that must all appear in a section
+            sections (list, optional): Report sections to search. Defaults to all sections
+            limit (int, optional): Maximum number of results
+            
+        Returns:
+            list: Dicts with token_id, symbol, name, section and score, best matches first
+        """
+        sections = list(sections or REPORT_SECTIONS)
+        clauses = [tokenize(phrase or word) for phrase, word in _PHRASE_RE.findall(query)]
+        clauses = [terms for terms in clauses if terms]
+        if not clauses:
+            return []
+        
+        scores = None
+        for terms in clauses:
+            matches = self._match_phrase(terms, sections)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {key: scores[key] + count for key, count in matches.items() if key in scores}
+            if not scores:
+                return []
+        
+        results = []
+        for (token_id, section), score in sorted(scores.items(), key=lambda item: -item[1]):
+            symbol, name = self.conn.execute(
+                "SELECT symbol, name FROM reports WHERE token_id = ? AND section = ?",
+                (token_id, section)).fetchone()
+            results.append({"token_id": token_id, "symbol": symbol, "name": name,
+                            "section": section, "score": score})
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+    
+    def get_report(self, token_id, section):
+        """Return the stored text of a report section.
+        
+        Args:
+            token_id (str): Token ID
+            section (str): Report section (e.g. "TRADER_REPORT")
+            
+        Returns:
+            str: Report text, or None if the section is not stored
+        """
+        row = self.conn.execute("SELECT body FROM reports WHERE token_id = ? AND section = ?",
+                                (str(token_id), section)).fetchone()
+        return row[0] if row else None
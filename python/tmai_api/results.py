@@ -0,0 +1,152 @@
+from collections import namedtuple
+from tmai_api.columnar import ColumnarAccumulator
+
+FailedChunk = namedtuple("FailedChunk", ["chunk_start", "chunk_end", "error"])
+FailedChunk.__doc__ = "A date chunk whose request failed, with the exception that was raised."
+
+class FetchResult:
+    """Result of a paginated fetch that records which chunks failed.
+    
+    Holds the data that was fetched plus the failed (chunk_start, chunk_end, error)
+    units, so only those chunks have to be fetched again with refetch_failed().
+    """
+    
+    def __init__(self, endpoint, method, path, data, meta, failed=None, failed_params=None, stream=False,
+                 row_counts=None, failed_indexes=None, fields=None):
+        """Initialize the result.
+        
+        Args:
+            endpoint (BaseEndpoint): Endpoint that produced the result
+            method (str): HTTP method of the chunk requests
+            path (str): API endpoint path of the chunk requests
+            data (list or ColumnarAccumulator): Data items fetched so far
+            meta (dict): Combined non-data response fields
+            failed (list, optional): FailedChunk tuples
+            failed_params (list, optional): Request parameters of each failed chunk
+            stream (bool, optional): Whether chunks are parsed incrementally
+            row_counts (list, optional): Rows returned by each chunk request in chunk
+                order, None for chunks that failed
+            failed_indexes (list, optional): Chunk order position of each failed chunk
+            fields (list, optional): Only keep these fields of each data item
+        """
+        self.endpoint = endpoint
+        self.method = method
+        self.path = path
+        self.data = data
+        self.meta = meta
+        self.failed = list(failed or [])
+        self.failed_params = list(failed_params or [])
+        self.stream = stream
+        self.row_counts = list(row_counts or [])
+        self.failed_indexes = list(failed_indexes or [])
+        self.fields = fields
+    
+    @property
+    def complete(self):
+        """bool: Whether every chunk was fetched successfully."""
+        return not self.failed
+    
+    def refetch_failed(self):
+        """Retry only the failed chunks and merge their data into this result.
+        
+        Chunks that fail again stay in ``failed`` with their new error. Refetched
+        rows are placed in chunk order, as if the chunks had never failed.
+        
+        Returns:
+            FetchResult: This result
+        """
+        still_failed = []
+        still_failed_params = []
+        still_failed_indexes = []
+        indexes = self.failed_indexes if len(self.failed_indexes) == len(self.failed) else [None] * len(self.failed)
+        refetched = {}
+        for chunk, params, index in zip(self.failed, self.failed_params, indexes):
+            try:
+                data_items, chunk_meta = self.endpoint._fetch_chunk(self.method, self.path, params, self.stream,
+                                                                    fields=self.fields)
+            except Exception as e:
+                still_failed.append(FailedChunk(chunk.chunk_start, chunk.chunk_end, e))
+                still_failed_params.append(params)
+                still_failed_indexes.append(index)
+                continue
+            if self.fields is not None:
+                data_items = [{key: item.get(key) for key in self.fields} if isinstance(item, dict)
+                              else item for item in data_items]
+            if isinstance(self.data, ColumnarAccumulator):
+                chunk_data = ColumnarAccumulator(self.data.fields)
+                chunk_data.extend(data_items)
+                data_items = chunk_data
+            if index is None or index >= len(self.row_counts):
+                # Without the chunk position the rows can only be appended
+                if isinstance(self.data, ColumnarAccumulator):
+                    self.data.merge(data_items)
+                else:
+                    self.data.extend(data_items)
+            else:
+                refetched[index] = data_items
+            self.meta.update(chunk_meta)
+        if refetched:
+            self._merge(refetched)
+        self.failed = still_failed
+        self.failed_params = still_failed_params
+        self.failed_indexes = still_failed_indexes
+        return self
+    
+    def _merge(self, refetched):
+        """Rebuild the data with refetched chunks in their chunk order position.
+        
+        Args:
+            refetched (dict): Chunk position to the data items (list or ColumnarAccumulator) of that chunk
+        """
+        if isinstance(self.data, ColumnarAccumulator):
+            self._merge_columns(refetched)
+            return
+        merged = []
+        rows = iter(self.data)
+        for index, count in enumerate(self.row_counts):
+            if count is not None:
+                merged.extend(next(rows) for _ in range(count))
+            elif index in refetched:
+                merged.extend(refetched[index])
+                self.row_counts[index] = len(refetched[index])
+        # Rows of chunks appended without a known position stay at the end
+        merged.extend(rows)
+        self.data = merged
+    
+    def _merge_columns(self, refetched):
+        """Rebuild columnar data buffer by buffer, without going through row dicts.
+        
+        Args:
+            refetched (dict): Chunk position to the ColumnarAccumulator of that chunk
+        """
+        merged = ColumnarAccumulator(self.data.fields)
+        merged.meta = getattr(self.data, "meta", {})
+        position = 0
+        for index, count in enumerate(self.row_counts):
+            if count is not None:
+                merged.merge(self.data.slice(position, position + count))
+                position += count
+            elif index in refetched:
+                merged.merge(refetched[index])
+                self.row_counts[index] = len(refetched[index])
+        merged.merge(self.data.slice(position, len(self.data)))
+        self.data = merged
+    
+    def to_response(self):
+        """Return the data in the same shape as a regular get() call.
+        
+        Returns:
+            dict: Combined API response data
+        """
+        return self.endpoint._combine_results(self.data, self.meta)
+    
+    def to_dataframe(self):
+        """Convert the fetched data to a pandas DataFrame.
+        
+        Returns:
+            pandas.DataFrame: DataFrame containing the fetched data
+        """
+        return self.endpoint.to_dataframe(self.to_response())
+    
+    def __repr__(self):
+        return f"<FetchResult {self.path}: {len(self.data)} items, {len(self.failed)} failed chunks>"
@@ -0,0 +1,187 @@
+import ast
+import json
+import numpy as np
+import pandas as pd
+from tmai_api.frames import TOKEN_COLUMN, parse_times, time_column
+
+# Columns compared by the server-side filters of the grade endpoints (minimum values)
+NUMERIC_FILTERS = {
+    'marketcap': 'MARKET_CAP',
+    'fdv': 'FULLY_DILUTED_VALUATION',
+    'volume': 'VOLUME_24H',
+    'traderGrade': 'TM_TRADER_GRADE',
+    'traderGradePercentChange': 'TM_TRADER_GRADE_24H_PCT_CHANGE',
+    'investorGrade': 'TM_INVESTOR_GRADE',
+    'investorGradePercentChange': 'TM_INVESTOR_GRADE_7D_PCT_CHANGE',
+}
+
+# Columns matched by the comma-separated list filters
+LIST_FILTERS = {
+    'category': 'CATEGORY_LIST',
+    'exchange': 'EXCHANGE_LIST',
+}
+
+def parse_list(value):
+    """Parse a list column value into a set of lowercase items.
+    
+    Values may be lists, JSON or Python list literals (e.g. "['DeFi', 'Lending']")
+    or comma-separated strings. Dict items contribute their string values.
+    
+    Args:
+        value: Cell of a list column
+        
+    Returns:
+        set: Lowercase, stripped items
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith("["):
+            try:
+                value = json.loads(text)
+            except ValueError:
+                try:
+                    value = ast.literal_eval(text)
+                except (ValueError, SyntaxError):
+                    value = text.strip("[]").split(",")
+        else:
+            value = text.split(",")
+    elif not isinstance(value, (list, tuple, set, np.ndarray)):
+        return set()
+    
+    items = set()
+    for item in value:
+        if isinstance(item, dict):
+            items.update(str(v).strip().lower() for v in item.values() if isinstance(v, str))
+        elif item is not None:
+            items.add(str(item).strip().strip("'\"").lower())
+    items.discard("")
+    return items
+
+class Screener:
+    """Screens a cached universe snapshot locally with vectorized column operations.
+    
+    The snapshot holds the latest grade row per token. Screens accept the same
+    filters as TraderGradesEndpoint and InvestorGradesEndpoint plus arbitrary
+    DataFrame.eval expressions, so trying a new screen costs no API request.
+    Filter masks are cached, so screens that share filters reuse them.
+    """
+    
+    def __init__(self, snapshot, numeric_filters=None, list_filters=None):
+        """Initialize the screener.
+        
+        Args:
+            snapshot (pandas.DataFrame): Grade frame; only the latest row per token is kept
+            numeric_filters (dict, optional): Overrides of NUMERIC_FILTERS
+            list_filters (dict, optional): Overrides of LIST_FILTERS
+        """
+        if TOKEN_COLUMN in snapshot.columns and len(snapshot):
+            try:
+                order = parse_times(snapshot[time_column(snapshot)]).to_numpy().argsort(kind="stable")
+                snapshot = snapshot.iloc[order]
+            except KeyError:
+                pass
+            snapshot = snapshot.drop_duplicates(TOKEN_COLUMN, keep="last")
+        self.snapshot = snapshot.reset_index(drop=True)
+        self.numeric_filters = dict(NUMERIC_FILTERS, **(numeric_filters or {}))
+        self.list_filters = dict(LIST_FILTERS, **(list_filters or {}))
+        self._masks = {}
+        self._list_items = {}
+    
+    @classmethod
+    def load(cls, client, date, investor=True, **kwargs):
+        """Fetch one universe snapshot of trader (and investor) grades.
+        
+        Args:
+            client (TokenMetricsClient): Client used to fetch grades
+            date (str): Snapshot date in YYYY-MM-DD format
+            investor (bool, optional): Also fetch investor grades and join them per token
+            **kwargs: Arguments to pass to Screener
+            
+        Returns:
+            Screener: Screener over the snapshot
+        """
+        snapshot = client.trader_grades.get_dataframe(startDate=date, endDate=date, progress=False)
+        if investor:
+            investor_grades = client.investor_grades.get_dataframe(startDate=date, endDate=date, progress=False)
+            if not investor_grades.empty:
+                new_columns = [c for c in investor_grades.columns if c not in snapshot.columns or c == TOKEN_COLUMN]
+                investor_grades = investor_grades[new_columns].drop_duplicates(TOKEN_COLUMN, keep="last")
+                snapshot = snapshot.merge(investor_grades, on=TOKEN_COLUMN, how="outer") \
+                    if not snapshot.empty else investor_grades
+        return cls(snapshot, **kwargs)
+    
+    def __len__(self):
+        return len(self.snapshot)
+    
+    def _filter_mask(self, name, value):
+        """Return the cached boolean mask of one endpoint-style filter."""
+        key = (name, str(value))
+        if key in self._masks:
+            return self._masks[key]
+        
+        if name in self.numeric_filters:
+            column = pd.to_numeric(self.snapshot[self.numeric_filters[name]], errors="coerce").to_numpy()
+            with np.errstate(invalid="ignore"):
+                mask = column >= float(value)
+        elif name in self.list_filters:
+            column = self.list_filters[name]
+            if column not in self._list_items:
+                self._list_items[column] = [parse_list(cell) for cell in self.snapshot[column]]
+            # Exact, case-insensitive membership of any requested item
+            wanted = {item.strip().lower() for item in str(value).split(",") if item.strip()}
+            mask = np.fromiter((not wanted.isdisjoint(items) for items in self._list_items[column]),
+                               dtype=bool, count=len(self.snapshot))
+        else:
+            raise ValueError(f"Unknown filter '{name}'")
+        self._masks[key] = mask
+        return mask
+    
+    def mask(self, expr=None, **filters):
+        """Return the boolean mask of the rows that pass a screen.
+        
+        Args:
+            expr (str or callable, optional): DataFrame.eval expression (e.g.
+                "TM_TRADER_GRADE > TM_INVESTOR_GRADE") or a function of the snapshot
+                returning a boolean mask
+            **filters: Endpoint-style filters (e.g. marketcap=1e9, category="defi")
+            
+        Returns:
+            numpy.ndarray: Boolean mask over the snapshot rows
+        """
+        mask = np.ones(len(self.snapshot), dtype=bool)
+        for name, value in filters.items():
+            if value is not None:
+                mask &= self._filter_mask(name, value)
+        if expr is not None:
+            result = expr(self.snapshot) if callable(expr) else self.snapshot.eval(expr)
+            mask &= np.asarray(result, dtype=bool)
+        return mask
+    
+    def screen(self, expr=None, sort=None, ascending=False, top=None, columns=None, **filters):
+        """Run a screen over the snapshot.
+        
+        Args:
+            expr (str or callable, optional): See mask()
+            sort (str, optional): Column to rank by
+            ascending (bool, optional): Rank smallest first
+            top (int, optional): Keep only the first rows after ranking
+            columns (list, optional): Columns to return. All columns when None
+            **filters: Endpoint-style filters (e.g. traderGrade=80, exchange="binance")
+            
+        Returns:
+            pandas.DataFrame: Matching rows, ranked when sort is given
+        """
+        rows = np.flatnonzero(self.mask(expr, **filters))
+        if sort is not None:
+            values = pd.to_numeric(self.snapshot[sort].to_numpy()[rows], errors="coerce").astype(np.float64)
+            keys = values if ascending else -values
+            keys = np.where(np.isnan(keys), np.inf, keys)
+            if top is not None and top < len(rows):
+                # Select the top rows before sorting only those
+                part = np.argpartition(keys, top - 1)[:top]
+                rows, keys = rows[part], keys[part]
+            rows = rows[np.argsort(keys, kind="stable")]
+        if top is not None:
+            rows = rows[:top]
+        result = self.snapshot.iloc[rows]
+        return result[list(columns)] if columns is not None else result
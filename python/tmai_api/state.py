@@ -0,0 +1,98 @@
+import json as jsonlib
+import os
+import tempfile
+import time
+
+# Bump when the layout of the state file changes; files with another version are ignored
+STATE_VERSION = 1
+
+class ClientState:
+    """Warm-start state of a client persisted to a JSON file.
+    
+    The file holds the token index (symbol -> token IDs), learned row densities
+    per endpoint, recent request latencies and cache validators with their
+    response bodies, so short-lived processes skip lookups and start with sized
+    chunks. Files written with another STATE_VERSION or older than ``max_age``
+    are ignored.
+    """
+    
+    def __init__(self, path, max_age=7 * 24 * 3600):
+        """Initialize the state file.
+        
+        Args:
+            path (str): State file path
+            max_age (float, optional): Seconds after which a saved state is considered stale.
+                None never expires
+        """
+        self.path = os.path.expanduser(path)
+        self.max_age = max_age
+    
+    def read(self):
+        """Read the state file.
+        
+        Returns:
+            dict: Saved state, or None when the file is missing, unreadable, stale or
+            of another version
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = jsonlib.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return None
+        if self.max_age is not None and time.time() - state.get("saved_at", 0) > self.max_age:
+            return None
+        return state
+    
+    def load(self, client):
+        """Apply the saved state to a client.
+        
+        Values the client already holds take precedence over saved ones.
+        
+        Args:
+            client (TokenMetricsClient): Client to warm up
+            
+        Returns:
+            bool: Whether a usable state was loaded
+        """
+        state = self.read()
+        if state is None:
+            return False
+        for symbol, token_ids in state.get("token_index", {}).items():
+            client.token_index.setdefault(symbol, token_ids)
+        for path, density in state.get("row_density", {}).items():
+            client.row_density.setdefault(path, density)
+        client.latency.update(state.get("latency", {}))
+        if client.validator_cache is not None:
+            for key, entry in state.get("validators", []):
+                if client.validator_cache.get(key) is None:
+                    client.validator_cache.put(key, entry["data"], entry["digest"],
+                                               etag=entry["etag"], last_modified=entry["last_modified"])
+        return True
+    
+    def save(self, client):
+        """Write a client's state to the file atomically.
+        
+        Args:
+            client (TokenMetricsClient): Client whose state is saved
+        """
+        state = {
+            "version": STATE_VERSION,
+            "saved_at": time.time(),
+            "token_index": client.token_index,
+            "row_density": client.row_density,
+            "latency": client.latency.to_dict(),
+            "validators": client.validator_cache.items() if client.validator_cache is not None else [],
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmai-state-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                jsonlib.dump(state, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,184 @@
+import codecs
+import json
+import re
+
+_WHITESPACE = " \t\n\r"
+# Strings, numbers and literals, matched without decoding them
+_SCALAR_RE = re.compile(r'"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null')
+# Characters that may continue a number split across chunks
+_NUMBER_TAIL = set("0123456789.eE+-")
+# Drop consumed text from the buffer once this many characters have been parsed
+_COMPACT_THRESHOLD = 1 << 16
+
+class _JSONReader:
+    """Incremental reader over a stream of text chunks."""
+    
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+    
+    def _fill(self):
+        if self.pos > _COMPACT_THRESHOLD:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        for chunk in self.chunks:
+            if chunk:
+                self.buffer += chunk
+                return True
+        self.eof = True
+        return False
+    
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+    
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Malformed JSON: expected {char!r} at offset {self.pos}")
+        self.pos += 1
+    
+    def _at_tail(self, end):
+        # Whether only a possible continuation of a number follows end in the buffer
+        tail = self.buffer[end:]
+        return len(tail) < 32 and all(char in _NUMBER_TAIL for char in tail)
+    
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if not self.eof and self._at_tail(end) and self._fill():
+                continue
+            self.pos = end
+            return value
+    
+    def skip(self):
+        """Move past one value without building it (nested containers are decoded)."""
+        while True:
+            if self.peek() in "{[":
+                self.value()
+                return
+            match = _SCALAR_RE.match(self.buffer, self.pos)
+            # A value at the end of the buffer may continue in the next chunk
+            if (match is None or self._at_tail(match.end())) and not self.eof and self._fill():
+                continue
+            if match is None:
+                raise ValueError(f"Malformed JSON value at offset {self.pos}")
+            self.pos = match.end()
+            return
+    
+    def object(self, fields):
+        """Parse an object, building only the values of the given keys."""
+        self.expect("{")
+        item = {}
+        if self.peek() == "}":
+            self.pos += 1
+        else:
+            while True:
+                name = self.value()
+                self.expect(":")
+                if name in fields:
+                    item[name] = self.value()
+                else:
+                    self.skip()
+                separator = self.peek()
+                self.pos += 1
+                if separator == "}":
+                    break
+                if separator != ",":
+                    raise ValueError(f"Malformed JSON object at offset {self.pos}")
+        return {key: item.get(key) for key in fields}
+    
+    def array(self, fields=None):
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.object(fields) if fields is not None and self.peek() == "{" else self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed JSON array at offset {self.pos}")
+
+def iter_json_items(chunks, key="data", meta=None, fields=None):
+    """Incrementally parse a JSON document and yield the items of one top-level array.
+    
+    Only one item (plus a small read buffer) is held in memory at a time, so a
+    large response never has to be materialized as a single string.
+    
+    Args:
+        chunks (iterable): Text chunks of the JSON document
+        key (str, optional): Top-level key of the array to stream
+        meta (dict, optional): Dict that receives every other top-level key/value
+        fields (list, optional): Only build these keys of object items; the values of
+            other keys are skipped without being decoded
+        
+    Yields:
+        Items of the array. If the document is itself an array its items are yielded;
+        a non-array value under ``key`` is yielded as a single item.
+    """
+    reader = _JSONReader(chunks)
+    start = reader.peek()
+    
+    if start == "[":
+        yield from reader.array(fields)
+        return
+    if start != "{":
+        yield reader.value()
+        return
+    
+    reader.pos += 1
+    if reader.peek() == "}":
+        return
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            yield from reader.array(fields)
+        elif name == key:
+            yield reader.value()
+        else:
+            value = reader.value()
+            if meta is not None:
+                meta[name] = value
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Malformed JSON object at offset {reader.pos}")
+
+def iter_response_text(response, chunk_size=65536):
+    """Yield decoded text chunks from a streamed requests response.
+    
+    Args:
+        response (requests.Response): Response opened with ``stream=True``
+        chunk_size (int, optional): Number of bytes read per chunk
+        
+    Yields:
+        str: Decoded text chunks
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
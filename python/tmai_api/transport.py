@@ -0,0 +1,359 @@
+import gzip
+import json as jsonlib
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+import urllib3
+
+def request_key(method, url, params=None, json=None):
+    """Build a normalized key identifying a request.
+    
+    Args:
+        method (str): HTTP method
+        url (str): Request URL
+        params (dict, optional): Query parameters
+        json (dict, optional): JSON payload
+        
+    Returns:
+        str: Key that is identical for equivalent requests
+    """
+    normalized_params = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    return jsonlib.dumps([method.lower(), url, normalized_params, json], sort_keys=True,
+                         separators=(",", ":"), default=str)
+
+class TransportResponse:
+    """Minimal in-memory response compatible with the parts of requests.Response the SDK uses."""
+    
+    def __init__(self, status_code, content, headers=None, url=None, encoding="utf-8"):
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.url = url
+        self.encoding = encoding
+    
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8")
+    
+    def json(self):
+        return jsonlib.loads(self.content)
+    
+    def iter_content(self, chunk_size=65536):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+    
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+    
+    def close(self):
+        pass
+
+class StreamedTransportResponse(TransportResponse):
+    """Response whose body is read lazily from an iterator of byte chunks."""
+    
+    def __init__(self, status_code, chunks, headers=None, url=None, encoding="utf-8", close=None):
+        self._chunks = chunks
+        self._content = None
+        self._close = close
+        super().__init__(status_code, None, headers, url=url, encoding=encoding)
+    
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = b"".join(self._chunks)
+        return self._content
+    
+    @content.setter
+    def content(self, value):
+        self._content = value
+    
+    def iter_content(self, chunk_size=65536):
+        if self._content is not None:
+            yield from super().iter_content(chunk_size)
+            return
+        yield from self._chunks
+    
+    def close(self):
+        if self._close is not None:
+            self._close()
+
+def _split_timeout(timeout):
+    """Return (connect, read) timeouts from a tuple, a number or None."""
+    if isinstance(timeout, (tuple, list)):
+        return timeout[0], timeout[1]
+    return timeout, timeout
+
+class Transport:
+    """Interface for sending HTTP requests on behalf of the endpoints."""
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        """Send a request.
+        
+        Args:
+            method (str): HTTP method ("get" or "post")
+            url (str): Request URL
+            headers (dict): Request headers
+            params (dict, optional): Query parameters
+            json (dict, optional): JSON payload
+            stream (bool, optional): Defer downloading the response body
+            timeout (tuple, optional): (connect, read) timeouts in seconds
+            
+        Returns:
+            Response object with status_code, headers, content, json(), iter_content()
+            and raise_for_status()
+        """
+        raise NotImplementedError
+
+class RequestsTransport(Transport):
+    """Transport backed by the requests library (the default)."""
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        kwargs = {"stream": True} if stream else {}
+        if method.lower() == "get":
+            return requests.get(url, headers=headers, params=params, timeout=timeout, **kwargs)
+        return requests.post(url, headers=headers, json=json, timeout=timeout, **kwargs)
+
+class Urllib3Transport(Transport):
+    """Transport backed by a shared urllib3 connection pool.
+    
+    Connections are kept alive and reused across threads; with block=True the
+    number of open connections per host never exceeds maxsize, so concurrent
+    chunk fetches share a fixed set of sockets.
+    """
+    
+    def __init__(self, maxsize=10, block=True, **pool_kwargs):
+        """Initialize the pool.
+        
+        Args:
+            maxsize (int, optional): Maximum connections kept per host (e.g. the client's max_workers)
+            block (bool, optional): Wait for a free connection instead of opening extra ones
+            **pool_kwargs: Arguments to pass to urllib3.PoolManager
+        """
+        pool_kwargs.setdefault("retries", False)
+        self.pool = urllib3.PoolManager(maxsize=maxsize, block=block, **pool_kwargs)
+        # Negotiate compression like requests does (gzip/deflate, plus br/zstd when decodable)
+        self.default_headers = urllib3.util.make_headers(accept_encoding=True)
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        connect, read = _split_timeout(timeout)
+        kwargs = {
+            "headers": dict(self.default_headers, **headers),
+            "timeout": urllib3.Timeout(connect=connect, read=read),
+            "preload_content": not stream,
+        }
+        if method.lower() == "get":
+            kwargs["fields"] = {k: str(v) for k, v in (params or {}).items()}
+        elif json is not None:
+            kwargs["body"] = jsonlib.dumps(json).encode("utf-8")
+            kwargs["headers"]["content-type"] = "application/json"
+        try:
+            response = self.pool.request(method.upper(), url, **kwargs)
+        except urllib3.exceptions.TimeoutError as e:
+            raise requests.Timeout(str(e)) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        
+        headers = dict(response.headers)
+        if stream:
+            def close():
+                # Read any unconsumed body so the connection can be reused
+                response.drain_conn()
+                response.release_conn()
+            return StreamedTransportResponse(response.status, response.stream(65536), headers, url=url,
+                                             close=close)
+        return TransportResponse(response.status, response.data, headers, url=url)
+
+class HTTP2Transport(Transport):
+    """Transport that multiplexes concurrent requests over HTTP/2 connections (requires httpx).
+    
+    Concurrent chunk fetches share one connection per host as separate HTTP/2
+    streams, so a pull of many chunks does not open a socket per chunk. Servers
+    without HTTP/2 support are served over HTTP/1.1.
+    """
+    
+    def __init__(self, max_connections=1, **client_kwargs):
+        """Initialize the HTTP/2 client.
+        
+        Args:
+            max_connections (int, optional): Maximum connections per client
+            **client_kwargs: Arguments to pass to httpx.Client
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("httpx is required for HTTP2Transport; install it with 'pip install httpx[http2]'")
+        self.httpx = httpx
+        client_kwargs.setdefault("limits", httpx.Limits(max_connections=max_connections))
+        self.client = httpx.Client(http2=True, **client_kwargs)
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        connect, read = _split_timeout(timeout)
+        httpx = self.httpx
+        timeout = httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+        try:
+            request = self.client.build_request(method.upper(), url, headers=headers, params=params,
+                                                json=json, timeout=timeout)
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        
+        if stream:
+            return StreamedTransportResponse(response.status_code, response.iter_bytes(65536),
+                                             response.headers, url=url, encoding=response.encoding,
+                                             close=response.close)
+        return TransportResponse(response.status_code, response.content, response.headers, url=url,
+                                 encoding=response.encoding)
+    
+    def close(self):
+        """Close the underlying connections."""
+        self.client.close()
+
+class InMemoryTransport(Transport):
+    """Transport that serves responses from Python callables, for tests and benchmarks.
+    
+    Routes map endpoint paths (e.g. "daily-ohlcv") to a handler called with the
+    query parameters and JSON payload. A handler returns the response body (any
+    JSON-serializable value) or a (status, body) tuple. Every request is
+    recorded in ``calls``.
+    """
+    
+    def __init__(self, routes=None, latency=0.0):
+        """Initialize the transport.
+        
+        Args:
+            routes (dict, optional): Endpoint path to handler or fixed response body
+            latency (float, optional): Seconds to sleep per request, to simulate a network
+        """
+        self.routes = dict(routes or {})
+        self.latency = latency
+        self.calls = []
+        self.lock = threading.Lock()
+    
+    def add(self, path, handler):
+        """Serve an endpoint path with a handler or a fixed response body."""
+        self.routes[path] = handler
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        path = urlsplit(url).path.rstrip("/")
+        with self.lock:
+            self.calls.append((method.lower(), path, dict(params or {}), json))
+        route = next((route for route in self.routes if path.endswith("/" + route.strip("/"))), None)
+        if route is None:
+            return TransportResponse(404, b'{"success": false, "message": "Not found"}', url=url)
+        if self.latency:
+            time.sleep(self.latency)
+        
+        handler = self.routes[route]
+        result = handler(params or {}, json) if callable(handler) else handler
+        status, body = result if isinstance(result, tuple) else (200, result)
+        content = body if isinstance(body, bytes) else jsonlib.dumps(body).encode("utf-8")
+        return TransportResponse(status, content, {"content-type": "application/json"}, url=url)
+
+class RateLimitedTransport(Transport):
+    """Transport that waits for a RateLimiter before every request of another transport."""
+    
+    def __init__(self, transport, limiter):
+        """Initialize the transport.
+        
+        Args:
+            transport (Transport): Transport that sends the requests
+            limiter (RateLimiter): Limiter acquired before each request
+        """
+        self.transport = transport
+        self.limiter = limiter
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        self.limiter.acquire()
+        return self.transport.send(method, url, headers, params=params, json=json, stream=stream,
+                                   timeout=timeout)
+
+class RecordingTransport(Transport):
+    """Transport that records every response to a compressed cassette file.
+    
+    Cassettes are gzip-compressed JSON lines and can be served back offline by
+    ReplayTransport. Call save() (or use the transport as a context manager) to
+    write the cassette.
+    """
+    
+    # Response headers kept in the cassette
+    RECORDED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+    
+    def __init__(self, path, transport=None):
+        """Initialize the recording transport.
+        
+        Args:
+            path (str): Cassette file to write
+            transport (Transport, optional): Transport used for the real requests
+        """
+        self.path = path
+        self.transport = transport or RequestsTransport()
+        self.entries = []
+        self.lock = threading.Lock()
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        response = self.transport.send(method, url, headers, params=params, json=json, timeout=timeout)
+        content = response.content
+        entry = {
+            "key": request_key(method, url, params, json),
+            "status": response.status_code,
+            "headers": {name: value for name, value in response.headers.items()
+                        if name.lower() in self.RECORDED_HEADERS},
+            "body": content.decode(response.encoding or "utf-8"),
+        }
+        with self.lock:
+            self.entries.append(entry)
+        return TransportResponse(response.status_code, content, entry["headers"], url=url)
+    
+    def save(self):
+        """Write all recorded responses to the cassette file."""
+        with self.lock:
+            entries = list(self.entries)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(jsonlib.dumps(entry, separators=(",", ":")) + "\n")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.save()
+
+class ReplayTransport(Transport):
+    """Transport that serves responses from a cassette file without any network access.
+    
+    Responses are matched on method, URL, query parameters and JSON payload.
+    Requests recorded more than once are replayed in recording order, repeating
+    the last response once the recordings are exhausted.
+    """
+    
+    def __init__(self, path):
+        """Load a cassette file.
+        
+        Args:
+            path (str): Cassette file written by RecordingTransport
+        """
+        self.responses = {}
+        self.calls = {}
+        self.lock = threading.Lock()
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = jsonlib.loads(line)
+                self.responses.setdefault(entry["key"], []).append(
+                    (entry["status"], entry["body"].encode("utf-8"), entry["headers"]))
+    
+    def send(self, method, url, headers, params=None, json=None, stream=False, timeout=None):
+        key = request_key(method, url, params, json)
+        recorded = self.responses.get(key)
+        if not recorded:
+            raise LookupError(f"No recorded response for {method.upper()} {url} with params {params}")
+        with self.lock:
+            call = self.calls.get(key, 0)
+            self.calls[key] = call + 1
+        status, content, response_headers = recorded[min(call, len(recorded) - 1)]
+        return TransportResponse(status, content, response_headers, url=url)